@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import inspect
 from typing import TYPE_CHECKING, Any, Callable
 
 import structlog
@@ -13,10 +14,57 @@ from agentguard.core.models import Decision, ProvenanceSourceType, ProvenanceTag
 if TYPE_CHECKING:
     from agentguard.interceptor.interceptor import Interceptor
 
+# Resolved once at import — the blocked path returns a ToolMessage when
+# langchain-core is installed, plain text otherwise.
+try:
+    from langchain_core.messages import ToolMessage
+
+    _HAVE_TOOL_MESSAGE = True
+except ImportError:  # pragma: no cover
+    ToolMessage = None  # type: ignore[assignment,misc]
+    _HAVE_TOOL_MESSAGE = False
+
 logger = structlog.get_logger(__name__)
 
 _BLOCKED_CONTENT = "[BLOCKED BY AGENTGUARD] This action was blocked by the security policy."
 
+# How many wrapper layers wrap_langgraph() peels off a node looking for a ToolNode
+_MAX_NODE_WRAP_DEPTH = 4
+
+# Constant per adapter — built once instead of per tool call (tags are never mutated)
+_PROVENANCE = ProvenanceTag(source_type=ProvenanceSourceType.SYSTEM, label="langgraph_middleware")
+
+
+def _accepts_only_keywords(tool_fn: Callable) -> bool:
+    """True if tool_fn takes no positional parameters (shape is fixed at wrap time)."""
+    try:
+        params = inspect.signature(tool_fn).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return all(
+        p.kind in (inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.VAR_KEYWORD) for p in params
+    )
+
+
+def _blocked_result(name: str, exc: BlockedByAgentGuard, proto: Any) -> Any:
+    """
+    Refusal returned in place of the tool result so the graph keeps running.
+
+    proto is the tool's prebuilt ToolMessage (None without langchain-core);
+    model_copy fills in the tool_call_id without re-running validation; the
+    copy is deep so callers mutating additional_kwargs / response_metadata on
+    one refusal cannot leak into the next.
+    """
+    logger.warning(
+        "langgraph_tool_blocked",
+        tool=name,
+        risk_score=exc.event.assessment.risk_score,
+        reason=exc.event.assessment.reason,
+    )
+    if proto is not None:
+        return proto.model_copy(update={"tool_call_id": str(exc.event.event_id)}, deep=True)
+    return _BLOCKED_CONTENT
+
 
 class LangGraphAdapter(AgentAdapter):
     """
@@ -58,12 +106,7 @@ class LangGraphAdapter(AgentAdapter):
             raw_payload=raw_payload,
             agent_goal=self._agent_goal,
             session_id=self._session_id,
-            provenance_tags=[
-                ProvenanceTag(
-                    source_type=ProvenanceSourceType.SYSTEM,
-                    label="langgraph_middleware",
-                )
-            ],
+            provenance_tags=[_PROVENANCE],
             framework="langgraph",
         )
         if decision == Decision.BLOCK:
@@ -81,28 +124,28 @@ class LangGraphAdapter(AgentAdapter):
         """
         name = tool_name or getattr(tool_fn, "name", getattr(tool_fn, "__name__", "unknown"))
         adapter = self
+        proto = (
+            ToolMessage(content=_BLOCKED_CONTENT, tool_call_id="", name=name)
+            if _HAVE_TOOL_MESSAGE
+            else None
+        )
 
-        async def guarded_tool(*args: Any, **kwargs: Any) -> Any:
-            parameters = kwargs if kwargs else (args[0] if args and isinstance(args[0], dict) else {})
-            try:
-                await adapter.before_tool_call(name, parameters)
-                return await tool_fn(*args, **kwargs)
-            except BlockedByAgentGuard as exc:
-                logger.warning(
-                    "langgraph_tool_blocked",
-                    tool=name,
-                    risk_score=exc.event.assessment.risk_score,
-                    reason=exc.event.assessment.reason,
-                )
+        if _accepts_only_keywords(tool_fn):
+            # Structured tools called purely by keyword: the kwargs ARE the parameters
+            async def guarded_tool(**kwargs: Any) -> Any:
                 try:
-                    from langchain_core.messages import ToolMessage
-                    return ToolMessage(
-                        content=_BLOCKED_CONTENT,
-                        tool_call_id=str(exc.event.event_id),
-                        name=name,
-                    )
-                except ImportError:
-                    return _BLOCKED_CONTENT
+                    await adapter.before_tool_call(name, kwargs)
+                    return await tool_fn(**kwargs)
+                except BlockedByAgentGuard as exc:
+                    return _blocked_result(name, exc, proto)
+        else:
+            async def guarded_tool(*args: Any, **kwargs: Any) -> Any:  # type: ignore[misc]
+                parameters = kwargs if kwargs else (args[0] if args and isinstance(args[0], dict) else {})
+                try:
+                    await adapter.before_tool_call(name, parameters)
+                    return await tool_fn(*args, **kwargs)
+                except BlockedByAgentGuard as exc:
+                    return _blocked_result(name, exc, proto)
 
         guarded_tool.__name__ = f"guarded_{name}"
         # Preserve any attributes the original tool had (name, description, etc.)
@@ -132,23 +175,32 @@ class LangGraphAdapter(AgentAdapter):
         try:
             nodes = getattr(compiled_graph, "nodes", None) or {}
             for node_name, node_callable in nodes.items():
-                # Walk one level of wrapping (RunnableLambda stores .func)
-                candidate = getattr(node_callable, "func", node_callable)
-                tools_by_name: dict[str, Any] | None = getattr(candidate, "tools_by_name", None)
-                if tools_by_name is None:
-                    # Some versions nest another level deep
-                    candidate = getattr(candidate, "bound", candidate)
+                # Follow wrapper layers (RunnableLambda.func, RunnableBinding.bound, ...)
+                # until a ToolNode-like object exposing tools_by_name turns up.
+                candidate = node_callable
+                tools_by_name: dict[str, Any] | None = None
+                for _ in range(_MAX_NODE_WRAP_DEPTH):
                     tools_by_name = getattr(candidate, "tools_by_name", None)
+                    if tools_by_name is not None:
+                        break
+                    candidate = (
+                        getattr(candidate, "func", None)
+                        or getattr(candidate, "bound", None)
+                        or getattr(candidate, "runnable", None)
+                    )
+                    if candidate is None:
+                        break
 
                 if tools_by_name is not None:
+                    node_patched = 0
                     for tname in list(tools_by_name.keys()):
-                        original = tools_by_name[tname]
-                        tools_by_name[tname] = self.wrap_tool(original, tname)
-                        patched += 1
-                    logger.info(
+                        tools_by_name[tname] = self.wrap_tool(tools_by_name[tname], tname)
+                        node_patched += 1
+                    patched += node_patched
+                    logger.debug(
                         "langgraph_node_patched",
                         node=node_name,
-                        tools_wrapped=patched,
+                        tools_wrapped=node_patched,
                     )
         except Exception as exc:
             logger.error(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -21,6 +22,11 @@ try:
 except ImportError:
     _RunHooksBase = object  # type: ignore[assignment,misc]
 
+# Where the SDK may carry tool input, in probe order. Different SDK versions use
+# different attributes, so the first one that works is cached per hooks instance.
+_CONTEXT_PARAM_ATTRS = ("tool_use_input", "tool_input", "input", "args")
+_TOOL_PARAM_ATTRS = ("input", "args", "kwargs")
+
 
 class AgentGuardOpenAIHooks(_RunHooksBase):  # type: ignore[misc]
     """
@@ -40,6 +46,11 @@ class AgentGuardOpenAIHooks(_RunHooksBase):  # type: ignore[misc]
         self._interceptor = interceptor
         self._agent_goal = agent_goal
         self._session_id = session_id
+        # Provenance tag for the most recent agent — rebuilt only when the agent changes
+        self._provenance_agent: Any = None
+        self._provenance: ProvenanceTag | None = None
+        # (context, tool) → parameters, bound on the first successful probe
+        self._param_resolver: Callable[[Any, Any], Any] | None = None
 
     async def on_tool_start(
         self,
@@ -50,22 +61,7 @@ class AgentGuardOpenAIHooks(_RunHooksBase):  # type: ignore[misc]
         """Called before a tool is executed by the OpenAI Agents SDK."""
         tool_name = getattr(tool, "name", str(tool))
 
-        # The OpenAI Agents SDK passes tool input via context.tool_use_input
-        # in newer versions, or as a keyword argument in on_function_tool_start.
-        # We try several attribute locations to be forward-compatible.
-        parameters: dict[str, Any] = {}
-        for attr in ("tool_use_input", "tool_input", "input", "args"):
-            value = getattr(context, attr, None)
-            if isinstance(value, dict):
-                parameters = value
-                break
-        if not parameters:
-            # Last resort: check the tool object itself
-            for attr in ("input", "args", "kwargs"):
-                value = getattr(tool, attr, None)
-                if isinstance(value, dict):
-                    parameters = value
-                    break
+        parameters = self._extract_parameters(context, tool)
 
         raw_payload = {
             "tool_name": tool_name,
@@ -76,13 +72,7 @@ class AgentGuardOpenAIHooks(_RunHooksBase):  # type: ignore[misc]
             raw_payload=raw_payload,
             agent_goal=self._agent_goal,
             session_id=self._session_id,
-            provenance_tags=[
-                ProvenanceTag(
-                    source_type=ProvenanceSourceType.SYSTEM,
-                    label="openai_hooks",
-                    value=str(agent)[:80],
-                )
-            ],
+            provenance_tags=[self._provenance_for(agent)],
             framework="openai",
         )
 
@@ -95,6 +85,44 @@ class AgentGuardOpenAIHooks(_RunHooksBase):  # type: ignore[misc]
             )
             raise BlockedByAgentGuard(event)
 
+    def _extract_parameters(self, context: Any, tool: Any) -> dict[str, Any]:
+        """
+        Return the tool input dict for this call.
+
+        The OpenAI Agents SDK passes tool input via context.tool_use_input
+        in newer versions, or as a keyword argument in on_function_tool_start.
+        We try several attribute locations to be forward-compatible, then reuse
+        the location that worked so later calls do a single attribute load.
+        """
+        if self._param_resolver is not None:
+            value = self._param_resolver(context, tool)
+            if isinstance(value, dict) and value:
+                return value
+
+        for attr in _CONTEXT_PARAM_ATTRS:
+            value = getattr(context, attr, None)
+            if isinstance(value, dict) and value:
+                self._param_resolver = lambda ctx, _tool, _attr=attr: getattr(ctx, _attr, None)
+                return value
+        # Last resort: check the tool object itself
+        for attr in _TOOL_PARAM_ATTRS:
+            value = getattr(tool, attr, None)
+            if isinstance(value, dict):
+                if value:
+                    self._param_resolver = lambda _ctx, t, _attr=attr: getattr(t, _attr, None)
+                return value
+        return {}
+
+    def _provenance_for(self, agent: Any) -> ProvenanceTag:
+        if self._provenance is None or agent is not self._provenance_agent:
+            self._provenance = ProvenanceTag(
+                source_type=ProvenanceSourceType.SYSTEM,
+                label="openai_hooks",
+                value=str(agent)[:80],
+            )
+            self._provenance_agent = agent
+        return self._provenance
+
     async def on_tool_end(self, context: Any, agent: Any, tool: Any, result: Any) -> None:
         """Called after a tool completes (no-op for AgentGuard)."""
 
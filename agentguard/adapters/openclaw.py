@@ -54,6 +54,10 @@ logger = structlog.get_logger(__name__)
 _SKILL_RE = re.compile(r"^[a-zA-Z0-9_]+(\.[a-zA-Z0-9_]+)*$")
 
 
+# Constant per adapter — built once instead of per tool call (tags are never mutated)
+_PROVENANCE = ProvenanceTag(source_type=ProvenanceSourceType.SYSTEM, label="openclaw_adapter")
+
+
 def _normalise_skill_name(skill: str) -> str:
     """Convert OpenClaw skill identifiers to AgentGuard tool_name format."""
     return skill.strip().lower() if _SKILL_RE.match(skill.strip()) else skill
@@ -100,12 +104,7 @@ class OpenClawAdapter(AgentAdapter):
             agent_goal=self._agent_goal,
             session_id=self._session_id,
             agent_id=self._agent_id,
-            provenance_tags=[
-                ProvenanceTag(
-                    source_type=ProvenanceSourceType.SYSTEM,
-                    label="openclaw_adapter",
-                )
-            ],
+            provenance_tags=[_PROVENANCE],
             framework="openclaw",
         )
 
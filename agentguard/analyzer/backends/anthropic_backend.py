@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
+import importlib.util
+from typing import Any
+
+import httpx
+
 from agentguard.core.models import Action, RiskAssessment
-from agentguard.analyzer.backends.base import AnalyzerBackend
-from agentguard.analyzer.prompts import ASSESS_RISK_TOOL, SYSTEM_PROMPT, build_user_prompt
+from agentguard.analyzer.backends.base import AnalyzerBackend, AssessRequest
+from agentguard.analyzer.prompts import (
+    ASSESS_RISK_BATCH_TOOL,
+    ASSESS_RISK_TOOL,
+    BATCH_SYSTEM_PROMPT,
+    SYSTEM_PROMPT,
+    build_batch_user_prompt,
+    build_user_prompt,
+)
 
 # Anthropic tool schema (input_schema format)
 _TOOL = ASSESS_RISK_TOOL
 
+# System prompt as a content block so it can carry a prompt-cache breakpoint —
+# the static system + tool prefix is served from Anthropic's cache on repeat calls.
+_SYSTEM = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+_BATCH_SYSTEM = [{"type": "text", "text": BATCH_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
+# One long-lived connection pool per backend. HTTP/2 multiplexes concurrent
+# (hedged / batched) requests over a single TLS connection when the optional
+# h2 package is installed — `pip install agentguard[http2]`.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
+
 
 class AnthropicBackend(AnalyzerBackend):
     """
@@ -24,8 +47,30 @@ class AnthropicBackend(AnalyzerBackend):
     def __init__(self, api_key: str | None = None, model: str = "claude-sonnet-4-6") -> None:
         import anthropic
 
-        self._client = anthropic.AsyncAnthropic(api_key=api_key)
+        self._client = anthropic.AsyncAnthropic(
+            api_key=api_key,
+            http_client=anthropic.DefaultAsyncHttpxClient(
+                http2=_HTTP2,
+                limits=_HTTP_LIMITS,
+                # The SDK's own Timeout type, so it is honoured for every request
+                timeout=anthropic.Timeout(30.0, connect=2.0),
+            ),
+        )
         self._model = model
+        # Everything except the user message is fixed for the backend's lifetime
+        self._base_kwargs = {
+            "model": model,
+            "max_tokens": 512,
+            "system": _SYSTEM,
+            "tools": [_TOOL],
+            "tool_choice": {"type": "tool", "name": "assess_risk"},
+        }
+        self._batch_base_kwargs = {
+            "model": model,
+            "system": _BATCH_SYSTEM,
+            "tools": [ASSESS_RISK_BATCH_TOOL],
+            "tool_choice": {"type": "tool", "name": "assess_risk_batch"},
+        }
 
     @property
     def provider(self) -> str:
@@ -35,6 +80,9 @@ class AnthropicBackend(AnalyzerBackend):
     def model(self) -> str:
         return self._model
 
+    async def aclose(self) -> None:
+        await self._client.close()
+
     async def assess(
         self,
         action: Action,
@@ -42,11 +90,7 @@ class AnthropicBackend(AnalyzerBackend):
         session_context: list[dict] | None = None,
     ) -> RiskAssessment:
         response = await self._client.messages.create(
-            model=self._model,
-            max_tokens=512,
-            system=SYSTEM_PROMPT,
-            tools=[_TOOL],
-            tool_choice={"type": "tool", "name": "assess_risk"},
+            **self._base_kwargs,
             messages=[
                 {"role": "user", "content": build_user_prompt(action, agent_goal, session_context)}
             ],
@@ -54,13 +98,47 @@ class AnthropicBackend(AnalyzerBackend):
 
         for block in response.content:
             if block.type == "tool_use" and block.name == "assess_risk":
-                result = block.input
-                return RiskAssessment(
-                    risk_score=result["risk_score"],
-                    reason=result["reason"],
-                    indicators=result.get("indicators", []),
-                    is_goal_aligned=result.get("is_goal_aligned", True),
-                    analyzer_model=self._model,
-                )
+                return self._to_assessment(block.input)
 
         raise ValueError("Anthropic response contained no assess_risk tool call")
+
+    async def assess_batch(
+        self,
+        requests: list[AssessRequest],
+    ) -> list[RiskAssessment | BaseException]:
+        """Score every request in a single Messages call via the assess_risk_batch tool."""
+        if len(requests) == 1:
+            return await super().assess_batch(requests)
+
+        response = await self._client.messages.create(
+            **self._batch_base_kwargs,
+            max_tokens=512 * len(requests),
+            messages=[{"role": "user", "content": build_batch_user_prompt(requests)}],
+        )
+
+        by_index: dict[int, dict[str, Any]] = {}
+        for block in response.content:
+            if block.type == "tool_use" and block.name == "assess_risk_batch":
+                for item in block.input.get("assessments", []):
+                    by_index[item.get("action_index")] = item
+
+        results: list[RiskAssessment | BaseException] = []
+        for i in range(1, len(requests) + 1):
+            item = by_index.get(i)
+            if item is None:
+                results.append(ValueError(f"Anthropic batch response missing action {i}"))
+                continue
+            try:
+                results.append(self._to_assessment(item))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
+    def _to_assessment(self, result: dict[str, Any]) -> RiskAssessment:
+        return RiskAssessment(
+            risk_score=result["risk_score"],
+            reason=result["reason"],
+            indicators=result.get("indicators", []),
+            is_goal_aligned=result.get("is_goal_aligned", True),
+            analyzer_model=self._model,
+        )
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 
 from agentguard.core.models import Action, RiskAssessment
 
+# One pending assessment: (action, agent_goal, session_context)
+AssessRequest = tuple[Action, str, list[dict] | None]
+
 
 class AnalyzerBackend(ABC):
     """
@@ -35,6 +39,29 @@ class AnalyzerBackend(ABC):
         """
         ...
 
+    async def assess_batch(
+        self,
+        requests: list[AssessRequest],
+    ) -> list[RiskAssessment | BaseException]:
+        """
+        Assess several actions at once.
+
+        Default: one independent assess() call per request, run concurrently.
+        Backends that can score multiple actions in a single API round-trip
+        override this.
+
+        Returns:
+            One entry per request, in order — a RiskAssessment, or the exception
+            raised while assessing that request.
+        """
+        return list(await asyncio.gather(
+            *(self.assess(action, goal, ctx) for action, goal, ctx in requests),
+            return_exceptions=True,
+        ))
+
+    async def aclose(self) -> None:
+        """Release network resources held by the backend. Default: nothing to release."""
+
     @property
     @abstractmethod
     def provider(self) -> str:
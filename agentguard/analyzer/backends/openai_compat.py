@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+import orjson
 
 from agentguard.core.models import Action, RiskAssessment
 from agentguard.analyzer.backends.base import AnalyzerBackend
@@ -74,6 +74,13 @@ class OpenAICompatBackend(AnalyzerBackend):
         )
         self._model = model
         self._provider_name = provider_name
+        # Everything except the user message is fixed for the backend's lifetime
+        self._base_kwargs = {
+            "model": model,
+            "tools": [_TOOL],
+            "tool_choice": {"type": "function", "function": {"name": "assess_risk"}},
+        }
+        self._system_message = {"role": "system", "content": SYSTEM_PROMPT}
 
     @property
     def provider(self) -> str:
@@ -83,6 +90,9 @@ class OpenAICompatBackend(AnalyzerBackend):
     def model(self) -> str:
         return self._model
 
+    async def aclose(self) -> None:
+        await self._client.close()
+
     async def assess(
         self,
         action: Action,
@@ -90,11 +100,9 @@ class OpenAICompatBackend(AnalyzerBackend):
         session_context: list[dict] | None = None,
     ) -> RiskAssessment:
         response = await self._client.chat.completions.create(
-            model=self._model,
-            tools=[_TOOL],
-            tool_choice={"type": "function", "function": {"name": "assess_risk"}},
+            **self._base_kwargs,
             messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
+                self._system_message,
                 {"role": "user", "content": build_user_prompt(action, agent_goal, session_context)},
             ],
         )
@@ -103,7 +111,7 @@ class OpenAICompatBackend(AnalyzerBackend):
         if message.tool_calls:
             for tc in message.tool_calls:
                 if tc.function.name == "assess_risk":
-                    result = json.loads(tc.function.arguments)
+                    result = orjson.loads(tc.function.arguments)
                     return RiskAssessment(
                         risk_score=result["risk_score"],
                         reason=result["reason"],
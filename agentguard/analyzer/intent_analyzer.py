@@ -7,22 +7,36 @@ import hashlib
 import json
 import time
 from collections import OrderedDict
-from typing import Any
 
 import structlog
 
+from agentguard.core.batching import Coalescer
 from agentguard.core.models import Action, ActionType, RiskAssessment
 from agentguard.analyzer.backends.base import AnalyzerBackend
 from agentguard.analyzer.local_classifier import LocalClassifier
 
-_CACHE_MAX_SIZE = 1024
+_CACHE_MAX_SIZE = 4096
+_CACHE_TTL_NS = 600 * 1_000_000_000
+# Verdicts at or above the block threshold are never cached — they always re-evaluate.
+_CACHE_MAX_RISK = 0.75
+# Upper bound on actions coalesced into one backend request
+_BATCH_MAX_SIZE = 16
 
 
-def _cache_key(action: Action, agent_goal: str) -> str:
-    """Stable hash key for an (action, goal) pair."""
-    params_str = json.dumps(action.parameters, sort_keys=True, default=str)[:300]
-    raw = f"{action.tool_name}|{action.type.value}|{params_str}|{agent_goal[:100]}"
-    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+def _cache_key(action: Action, agent_goal: str, model: str) -> bytes:
+    """Stable 128-bit fingerprint for an (action, goal, model) triple."""
+    raw = json.dumps(
+        {
+            "t": action.tool_name,
+            "ty": action.type.value,
+            "p": action.parameters,
+            "g": agent_goal,
+            "m": model,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).digest()
 
 logger = structlog.get_logger(__name__)
 
@@ -34,17 +48,26 @@ _FAIL_CLOSED_TYPES: frozenset[ActionType] = frozenset({
 })
 
 
+# Prebuilt fallbacks keyed by (reason, fail_closed). Failures cluster during
+# provider outages, so each distinct reason is validated once and then copied.
+_FALLBACKS: dict[tuple[str, bool], RiskAssessment] = {}
+
+
 def _fallback_assessment(action: Action, reason: str, latency_ms: float) -> RiskAssessment:
     """Fail-closed: sensitive action types default to BLOCK on any error."""
-    score = 1.0 if action.type in _FAIL_CLOSED_TYPES else 0.5
-    return RiskAssessment(
-        risk_score=score,
-        reason=reason,
-        indicators=["analyzer_error"],
-        is_goal_aligned=False,
-        analyzer_model="fallback",
-        latency_ms=latency_ms,
-    )
+    fail_closed = action.type in _FAIL_CLOSED_TYPES
+    template = _FALLBACKS.get((reason, fail_closed))
+    if template is None:
+        template = RiskAssessment(
+            risk_score=1.0 if fail_closed else 0.5,
+            reason=reason,
+            indicators=["analyzer_error"],
+            is_goal_aligned=False,
+            analyzer_model="fallback",
+        )
+        _FALLBACKS[(reason, fail_closed)] = template
+    # model_copy skips validation; callers never mutate the shared indicators list
+    return template.model_copy(update={"latency_ms": latency_ms})
 
 
 class IntentAnalyzer:
@@ -52,9 +75,17 @@ class IntentAnalyzer:
     Provider-agnostic intent analyzer.
 
     Pipeline:
-      1. LocalClassifier  — zero-latency pattern match (catches obvious prompt injection)
+      1. LocalClassifier  — zero-latency pattern match (catches obvious prompt injection;
+         clears allowlisted safe_tools whose parameters carry no suspicious indicators)
       2. Backend.assess() — LLM risk scoring via whichever provider is configured
       3. Request hedging  — parallel call fires after hedge_after seconds if first is slow
+         (or micro-batching when batch_window_ms > 0 — concurrent calls arriving within
+         the window share one backend request via Backend.assess_batch().
+         A batch mixes untrusted parameters from unrelated agents and sessions in
+         one prompt; each action is fenced with a per-batch random tag and the
+         batch system prompt forbids cross-action influence, but an injection in
+         one action still shares the model's context with the others. Leave
+         batching off where that cross-tenant exposure is unacceptable.)
       4. Fail-closed      — sensitive action types default to BLOCK on any error
 
     Supports any backend implementing AnalyzerBackend:
@@ -65,11 +96,20 @@ class IntentAnalyzer:
         self,
         backend: AnalyzerBackend,
         hedge_after: float = 1.0,
+        batch_window_ms: float = 0.0,
+        safe_tools: list[str] | None = None,
     ) -> None:
         self._backend = backend
         self._hedge_after = hedge_after
-        self._local = LocalClassifier()
-        self._cache: OrderedDict[str, RiskAssessment] = OrderedDict()
+        self._batch_window = batch_window_ms / 1000
+        self._batcher: Coalescer[tuple[Action, str, list[dict] | None, asyncio.Future]] = Coalescer(
+            self._flush, self._batch_window, _BATCH_MAX_SIZE
+        )
+        self._local = LocalClassifier(safe_tools=safe_tools)
+        # LRU + TTL assessment cache: key → (expires_at perf_counter_ns, assessment)
+        self._cache: OrderedDict[bytes, tuple[int, RiskAssessment]] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     @property
     def provider(self) -> str:
@@ -79,6 +119,11 @@ class IntentAnalyzer:
     def model(self) -> str:
         return self._backend.model
 
+    async def aclose(self) -> None:
+        """Send any queued batch, then close the backend's HTTP connection pool."""
+        await self._batcher.drain()
+        await self._backend.aclose()
+
     async def analyze(
         self,
         action: Action,
@@ -86,71 +131,143 @@ class IntentAnalyzer:
         session_context: list[dict] | None = None,
     ) -> RiskAssessment:
         """Analyze an action and return a RiskAssessment."""
-        t_start = time.monotonic()
-        log = logger.bind(
+        t_start = time.perf_counter_ns()
+        # Context-local fields instead of a per-call BoundLogger; reset on exit
+        with structlog.contextvars.bound_contextvars(
             tool=action.tool_name,
             action_type=action.type.value,
             provider=self._backend.provider,
             model=self._backend.model,
-        )
+        ):
+            return await self._analyze(action, agent_goal, session_context, t_start)
 
+    async def _analyze(
+        self,
+        action: Action,
+        agent_goal: str,
+        session_context: list[dict] | None,
+        t_start: int,
+    ) -> RiskAssessment:
+        """Pipeline body — runs with the per-action log context already bound."""
         # 1. Local classifier — zero-latency pre-screen
         local_result = self._local.classify(action)
         if local_result is not None:
-            log.info(
+            logger.info(
                 "local_classifier_hit",
                 risk_score=local_result.risk_score,
                 indicators=local_result.indicators,
             )
             return local_result
 
-        # 2. Assessment cache — skip LLM for identical (action, goal) pairs
-        key = _cache_key(action, agent_goal)
-        if key in self._cache:
-            cached = self._cache[key]
-            self._cache.move_to_end(key)
-            log.info("assessment_cache_hit", risk_score=cached.risk_score)
-            return cached
+        # 2. Assessment cache — skip LLM for identical (action, goal, model) triples
+        key = _cache_key(action, agent_goal, self._backend.model)
+        cached = self._cache_get(key, t_start)
+        if cached is not None:
+            self.cache_hits += 1
+            logger.info(
+                "assessment_cache_hit",
+                risk_score=cached.risk_score,
+                cache_hits=self.cache_hits,
+                cache_misses=self.cache_misses,
+            )
+            # Return a copy so callers (e.g. taxonomy enrichment) never mutate the cached entry
+            return cached.model_copy(update={"latency_ms": 0.0}, deep=True)
+        self.cache_misses += 1
 
         # 3. LLM analysis with request hedging
         try:
-            assessment = await self._hedged_analyze(action, agent_goal, session_context, log)
-            latency_ms = (time.monotonic() - t_start) * 1000
+            if self._batch_window > 0:
+                assessment = await self._batched_analyze(action, agent_goal, session_context)
+            else:
+                assessment = await self._hedged_analyze(action, agent_goal, session_context)
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
             assessment.latency_ms = latency_ms
-            log.info(
+            logger.debug(
                 "analysis_complete",
                 risk_score=assessment.risk_score,
                 risk_level=assessment.risk_level,
-                latency_ms=f"{latency_ms:.0f}ms",
+                latency_ms=int(latency_ms),
             )
-            # Store in cache — evict oldest entry when full
-            self._cache[key] = assessment
-            if len(self._cache) > _CACHE_MAX_SIZE:
-                self._cache.popitem(last=False)
+            if assessment.risk_score < _CACHE_MAX_RISK:
+                self._cache_put(key, assessment.model_copy(deep=True), t_start)
             return assessment
 
         except asyncio.CancelledError:
             # CancelledError is BaseException in Python 3.8+ — explicit catch required.
             # Treat cancellation as an analyzer failure and apply fail-closed defaults.
-            latency_ms = (time.monotonic() - t_start) * 1000
-            log.error("analyzer_cancelled", latency_ms=f"{latency_ms:.0f}ms")
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
+            logger.error("analyzer_cancelled", latency_ms=int(latency_ms))
             return _fallback_assessment(action, "analyzer_cancelled", latency_ms)
 
         except Exception as exc:
-            latency_ms = (time.monotonic() - t_start) * 1000
-            log.error("analyzer_error", error=str(exc), latency_ms=f"{latency_ms:.0f}ms")
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
+            logger.error("analyzer_error", error=str(exc), latency_ms=int(latency_ms))
             return _fallback_assessment(
                 action,
                 f"analyzer_unavailable: {type(exc).__name__}",
                 latency_ms,
             )
 
+    def _cache_get(self, key: bytes, now: int) -> RiskAssessment | None:
+        """Return a live cache entry (refreshing its LRU position) or None."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, assessment = entry
+        if expires_at <= now:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return assessment
+
+    def _cache_put(self, key: bytes, assessment: RiskAssessment, now: int) -> None:
+        """Store an assessment — evict the least recently used entry when full."""
+        self._cache[key] = (now + _CACHE_TTL_NS, assessment)
+        self._cache.move_to_end(key)
+        if len(self._cache) > _CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
+    async def _batched_analyze(
+        self,
+        action: Action,
+        agent_goal: str,
+        session_context: list[dict] | None,
+    ) -> RiskAssessment:
+        """
+        Micro-batching: queue the request and wait for its slot in the next flush.
+
+        The first request in an empty queue schedules a flush after batch_window;
+        a full queue (_BATCH_MAX_SIZE) is flushed immediately.
+        """
+        future: asyncio.Future[RiskAssessment] = asyncio.get_running_loop().create_future()
+        self._batcher.add((action, agent_goal, session_context, future))
+        return await future
+
+    async def _flush(
+        self,
+        batch: list[tuple[Action, str, list[dict] | None, asyncio.Future]],
+    ) -> None:
+        """Send one batch to the backend and fan results back to each waiting caller."""
+        logger.debug("analyzer_batch_flush", size=len(batch))
+        try:
+            results = await self._backend.assess_batch(
+                [(action, goal, ctx) for action, goal, ctx, _ in batch]
+            )
+        except BaseException as exc:
+            results = [exc] * len(batch)
+        for (_, _, _, future), result in zip(batch, results):
+            if future.done():
+                continue  # caller was cancelled while waiting
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
     async def _hedged_analyze(
         self,
         action: Action,
         agent_goal: str,
         session_context: list[dict] | None,
-        log: Any,
     ) -> RiskAssessment:
         """
         Request hedging: fire first call immediately.
@@ -163,7 +280,7 @@ class IntentAnalyzer:
         try:
             return await asyncio.wait_for(asyncio.shield(task1), timeout=self._hedge_after)
         except asyncio.TimeoutError:
-            log.info("hedge_triggered", hedge_after=self._hedge_after)
+            logger.info("hedge_triggered", hedge_after=self._hedge_after)
             task2 = asyncio.create_task(
                 self._backend.assess(action, agent_goal, session_context)
             )
@@ -174,7 +291,7 @@ class IntentAnalyzer:
                     await p
                 except BaseException as p_exc:
                     if not isinstance(p_exc, asyncio.CancelledError):
-                        log.debug("hedge_pending_task_error", error_type=type(p_exc).__name__)
+                        logger.debug("hedge_pending_task_error", error_type=type(p_exc).__name__)
             # Prefer a successful result when both tasks finish simultaneously.
             winner = None
             for task in done:
@@ -1,18 +1,22 @@
 """Zero-latency pre-screen classifier — runs before LLM, zero API cost.
 
-Catches high-confidence prompt injection attempts using pattern matching.
+Catches high-confidence prompt injection attempts using pattern matching, and
+(opt-in) clears obviously-safe calls to allowlisted tools.
 Returns a RiskAssessment immediately; returns None when ambiguous (→ escalate to LLM).
 """
 
 from __future__ import annotations
 
+import json
 import re
 
-from agentguard.core.models import Action, RiskAssessment
+import orjson
+
+from agentguard.core.models import Action, ActionType, RiskAssessment
 
 # Unambiguous prompt injection signals in parameter values
 _INJECTION_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(p, re.I)
+    re.compile(p, re.IGNORECASE)
     for p in [
         r"ignore\s+(previous|prior|all|your)\s+instructions?",
         r"override\s+(your|the|all|previous)\s+(goal|instruction|directive|system)",
@@ -32,6 +36,50 @@ _INJECTION_PATTERNS: list[re.Pattern[str]] = [
 ]
 
 
+# Any of these tokens anywhere in the serialized parameters disqualifies the
+# safe-tool fast path — the call goes to the LLM like any other.
+_SUSPICIOUS_TERMS: tuple[str, ...] = (
+    # exfiltration endpoints / transports
+    "ngrok", "requestbin", "pipedream", "webhook.site", "pastebin", "burpcollaborator",
+    "interact.sh", "http://", "https://", "ftp://", "curl", "wget", "nc ", "netcat",
+    # credentials and secrets
+    ".ssh", "id_rsa", "id_ed25519", "aws/credentials", ".aws", ".env", ".netrc", ".pgpass",
+    ".kube", ".docker", ".gnupg", "passwd", "shadow", "secret", "token", "password",
+    "api_key", "apikey", "private key", "credential",
+    # execution / obfuscation
+    "rm -rf", "sudo", "chmod", "base64", "eval(", "exec(", "os.system", "subprocess",
+    "/etc/", "..",
+    # instruction tampering
+    "ignore", "override", "disregard", "system prompt", "instruction",
+)
+_SUSPICIOUS = re.compile("|".join(map(re.escape, _SUSPICIOUS_TERMS)), re.IGNORECASE)
+
+# Sensitive types always get LLM scrutiny, whatever tool name they arrive under
+_NEVER_SAFE_TYPES: frozenset[ActionType] = frozenset({
+    ActionType.CREDENTIAL_ACCESS,
+    ActionType.SHELL_COMMAND,
+    ActionType.MEMORY_WRITE,
+    ActionType.HTTP_REQUEST,
+})
+
+_SAFE_ASSESSMENT = RiskAssessment(
+    risk_score=0.05,
+    reason="Allowlisted tool with no suspicious indicators in parameters",
+    indicators=[],
+    is_goal_aligned=True,
+    analyzer_model="local_classifier",
+)
+
+
+def _params_look_suspicious(parameters: dict) -> bool:
+    """True if any suspicious token appears anywhere in the parameters (keys included)."""
+    try:
+        haystack = orjson.dumps(parameters, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        haystack = json.dumps(parameters, default=str)
+    return _SUSPICIOUS.search(haystack) is not None
+
+
 def _params_contain_injection(parameters: dict) -> tuple[bool, str]:
     """Return (True, matched_pattern) if any parameter value contains an injection pattern."""
     for val in parameters.values():
@@ -47,12 +95,17 @@ class LocalClassifier:
     """
     Fast pre-screen before LLM analysis.
 
-    Only classifies when confidence is very high (injection detected).
-    Returns None for all ambiguous cases — LLM handles those.
+    Only classifies when confidence is very high: injection detected, or a
+    call to an operator-allowlisted safe tool whose parameters carry none of
+    the suspicious indicators. Returns None for all ambiguous cases — LLM
+    handles those.
     """
 
     INJECTION_SCORE = 0.92
 
+    def __init__(self, safe_tools: list[str] | None = None) -> None:
+        self._safe_tools: frozenset[str] = frozenset(t.lower() for t in (safe_tools or []))
+
     def classify(self, action: Action) -> RiskAssessment | None:
         """
         Return a high-confidence RiskAssessment or None (→ call LLM).
@@ -66,4 +119,11 @@ class LocalClassifier:
                 is_goal_aligned=False,
                 analyzer_model="local_classifier",
             )
+        if (
+            self._safe_tools
+            and action.tool_name.lower() in self._safe_tools
+            and action.type not in _NEVER_SAFE_TYPES
+            and not _params_look_suspicious(action.parameters)
+        ):
+            return _SAFE_ASSESSMENT.model_copy()
         return None
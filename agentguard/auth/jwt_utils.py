@@ -126,6 +126,12 @@ async def check_token_revocation(payload: dict[str, Any]) -> None:
             _revocation_redis_warned = True
 
 
+async def add_to_denylist(jti: str, ttl: int, redis_url: str) -> None:
+    """Add a jti to the Redis denylist for ttl seconds (shared pooled client)."""
+    client = _get_redis_client(redis_url)
+    await client.setex(f"agentguard:revoked:{jti}", ttl, "1")
+
+
 def auth_enabled() -> bool:
     """Auth is enabled only when AGENTGUARD_API_KEY is configured."""
     return bool(os.getenv("AGENTGUARD_API_KEY"))
@@ -0,0 +1,78 @@
+"""Time-window batching shared by the analyzer, enrichment, stream publisher and ledger."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+
+class Coalescer[T]:
+    """
+    Collects items into batches for one flush callback.
+
+    The first item added to an empty batch schedules a flush after `window`
+    seconds; a batch reaching `max_size` is flushed immediately. Every flush
+    runs as a task held here until it finishes, so drain() can wait for
+    in-flight sends on shutdown instead of the loop dropping them.
+
+    The flush callback owns error handling — it must resolve whatever its
+    callers are waiting on, even when the send fails.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[None]],
+        window: float,
+        max_size: int,
+    ) -> None:
+        self._flush = flush
+        self._window = window
+        self._max_size = max_size
+        self._pending: list[T] = []
+        self._timer: asyncio.Task | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def add(self, item: T) -> None:
+        self._pending.append(item)
+        if len(self._pending) >= self._max_size:
+            self._spawn(self._take())
+        elif self._timer is None:
+            self._timer = asyncio.create_task(self._flush_after_window())
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """
+        Flush queued items now and wait for every in-flight flush.
+
+        Flushes still running after `timeout` seconds are cancelled.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch = self._take()
+        if batch:
+            self._spawn(batch)
+        if not self._tasks:
+            return
+        _, still_running = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in still_running:
+            task.cancel()
+        if still_running:
+            await asyncio.wait(still_running)
+
+    def _take(self) -> list[T]:
+        batch, self._pending = self._pending, []
+        return batch
+
+    def _spawn(self, batch: list[T]) -> None:
+        task = asyncio.create_task(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_after_window(self) -> None:
+        try:
+            await asyncio.sleep(self._window)
+        finally:
+            self._timer = None
+        batch = self._take()
+        if batch:
+            self._spawn(batch)
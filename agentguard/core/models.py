@@ -3,13 +3,37 @@
 from __future__ import annotations
 
 import hashlib
+import os
 import re
+import time
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
+from functools import partial
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
+
+_UTC = timezone.utc
+# C-level partial avoids a Python lambda frame per default timestamp
+_utcnow = partial(datetime.now, _UTC)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp, then
+    74 random bits. Consecutive ids land on the same B-tree leaf, unlike
+    uuid4, so primary-key inserts stay sequential.
+    """
+    rand = int.from_bytes(os.urandom(10))
+    value = (
+        (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                          # version
+        | (rand >> 68 & 0xFFF) << 64         # rand_a (12 bits)
+        | 0b10 << 62                         # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b (62 bits)
+    )
+    return uuid.UUID(int=value)
 
 
 class ActionType(str, Enum):
@@ -66,12 +90,12 @@ def derive_agent_id(agent_goal: str, framework: str = "unknown") -> str:
 
 
 class Action(BaseModel):
-    action_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    action_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     type: ActionType = ActionType.UNKNOWN
     tool_name: str
     parameters: dict[str, Any] = Field(default_factory=dict)
     raw_payload: dict[str, Any] = Field(default_factory=dict)
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
 
     model_config = {"use_enum_values": False}
 
@@ -91,6 +115,7 @@ class AttackTaxonomyAnnotation(BaseModel):
 
 
 class RiskAssessment(BaseModel):
+    # ge/le are enforced inside pydantic-core — out-of-range scores raise ValidationError
     risk_score: float = Field(ge=0.0, le=1.0)
     reason: str
     indicators: list[str] = Field(default_factory=list)
@@ -99,11 +124,6 @@ class RiskAssessment(BaseModel):
     latency_ms: float = 0.0
     attack_taxonomy: AttackTaxonomyAnnotation | None = None
 
-    @field_validator("risk_score")
-    @classmethod
-    def clamp_score(cls, v: float) -> float:
-        return max(0.0, min(1.0, v))
-
     @property
     def risk_level(self) -> str:
         if self.risk_score < 0.3:
@@ -126,7 +146,10 @@ class PolicyViolation(BaseModel):
 
 
 class Event(BaseModel):
-    event_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    # Canonical dashed form — the SQL ledger stores event_id as a UUID column and
+    # round-trips it through uuid.UUID, so it must compare equal after a reload.
+    # UUIDv7 keeps the primary-key index insert-ordered.
+    event_id: str = Field(default_factory=lambda: str(uuid7()))
     session_id: str
     agent_id: str = ""            # explicit registered ID or derived slug-hash
     agent_is_registered: bool = False   # True only when caller passes explicit agent_id
@@ -135,10 +158,10 @@ class Event(BaseModel):
     assessment: RiskAssessment
     decision: Decision
     policy_violation: PolicyViolation | None = None
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = Field(default_factory=_utcnow)
     provenance: list[ProvenanceTag] = Field(default_factory=list)
     framework: str = "unknown"
-    correlation_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    correlation_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     initiating_principal: str = ""  # JWT sub or auth header hash — who triggered this session
 
 
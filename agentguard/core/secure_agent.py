@@ -50,7 +50,7 @@ class SecureAgent:
         self._agent_id = agent_id  # explicit identity; None → auto-derived per intercept call
         self._interceptor = interceptor
         self._ledger = ledger
-        self._session_id = session_id or str(uuid.uuid4())
+        self._session_id = session_id or uuid.uuid4().hex
         self._framework = framework
 
     @classmethod
@@ -87,6 +87,11 @@ class SecureAgent:
             GROQ_API_KEY             — Groq API key
             TOGETHER_API_KEY         — Together AI API key
             AGENTGUARD_POLICY_PATH   — policy file path (default: policies/default.yaml)
+            AGENTGUARD_BATCH_WINDOW_MS — coalesce concurrent analyses within this window
+                                         into one LLM request (default: 0, disabled)
+            AGENTGUARD_SAFE_TOOLS    — comma-separated tools that skip the LLM when their
+                                       parameters carry no suspicious indicators
+            AGENTGUARD_SKIP_LOGGING_CONFIG — set to 1 when the host app configures structlog
         """
         log_level = os.getenv("AGENTGUARD_LOG_LEVEL", "INFO")
         configure_logging(log_level=log_level, json_logs=False)
@@ -108,7 +113,14 @@ class SecureAgent:
             base_url=analyzer_base_url,
         )
         hedge_after = float(os.getenv("AGENTGUARD_HEDGE_AFTER", "1.0"))
-        analyzer = IntentAnalyzer(backend=backend, hedge_after=hedge_after)
+        batch_window_ms = float(os.getenv("AGENTGUARD_BATCH_WINDOW_MS", "0"))
+        safe_tools = [t.strip() for t in os.getenv("AGENTGUARD_SAFE_TOOLS", "").split(",") if t.strip()]
+        analyzer = IntentAnalyzer(
+            backend=backend,
+            hedge_after=hedge_after,
+            batch_window_ms=batch_window_ms,
+            safe_tools=safe_tools,
+        )
         policy_engine = PolicyEngine.from_yaml(policy_file)
         if ledger is not None:
             event_ledger = ledger
@@ -147,6 +159,10 @@ class SecureAgent:
             framework=self._framework,
         )
 
+    async def aclose(self) -> None:
+        """Close the analyzer's HTTP connection pool. Call once the agent run is finished."""
+        await self._interceptor.aclose()
+
     def get_openai_hooks(self) -> Any:
         """Get OpenAI Agents SDK RunHooks implementation."""
         from agentguard.adapters.openai_adapter import AgentGuardOpenAIHooks
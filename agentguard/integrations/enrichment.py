@@ -6,13 +6,20 @@ for structured output, same pattern as IntentAnalyzer.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 import re
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from functools import cached_property, lru_cache
+from typing import Any, Literal
 
 import structlog
+from pydantic import BaseModel, ValidationError
+
+from agentguard.core.batching import Coalescer
 
 logger = structlog.get_logger(__name__)
 
@@ -122,12 +129,65 @@ TRIAGE_TOOL = {
     },
 }
 
+class TriageResult(BaseModel):
+    """Validated security_triage tool input — mirrors TRIAGE_TOOL["input_schema"]."""
+
+    attack_pattern: Literal[
+        "credential_exfiltration",
+        "data_exfiltration",
+        "prompt_injection",
+        "goal_hijacking",
+        "memory_poisoning",
+        "privilege_escalation",
+        "lateral_movement",
+        "reconnaissance",
+        "none",
+    ] = "none"
+    confidence: float = 0.0
+    severity: Literal["low", "medium", "high", "critical"] = "low"
+    summary: str = "Analysis unavailable"
+    recommended_action: str = "Monitor"
+    false_positive_likelihood: float = 0.0
+
+
+# Seconds between Message Batch status polls
+_BATCH_POLL_INTERVAL = 5.0
+# How long aclose() waits for submitted Message Batches to end
+_BATCH_CLOSE_TIMEOUT = 30.0
+# Triage results kept for repeat (tool, decision, reason) events
+_TRIAGE_CACHE_MAX_SIZE = 512
+
 SYSTEM_PROMPT = """\
 You are a senior AI security analyst reviewing blocked or flagged actions from autonomous AI agents.
 Your job is to classify each event into a structured security insight.
 Be precise and conservative — only flag as high/critical severity when the evidence is clear.
 """
 
+_USER_TEMPLATE = (
+    "Review this blocked/flagged AI agent action:\n\n"
+    "Tool: {tool_name}\n"
+    "Decision: {decision}\n"
+    "Risk Score: {risk_score}\n"
+    "Agent Goal: {agent_goal}\n"
+    "Reason: {reason}\n"
+    "Session: {session_id}"
+)
+
+# Request fields identical for every triage call — built once, splatted per request
+_TRIAGE_KWARGS: dict[str, Any] = {
+    "max_tokens": 512,
+    "system": SYSTEM_PROMPT,
+    "tools": [TRIAGE_TOOL],
+    "tool_choice": {"type": "tool", "name": "security_triage"},
+}
+
+
+class _EventFields(dict):
+    """Event view for _USER_TEMPLATE — missing fields render as 'unknown' (risk as 0.0)."""
+
+    def __missing__(self, key: str) -> Any:
+        return 0.0 if key == "risk_score" else "unknown"
+
 
 @dataclass
 class EnrichmentInsight:
@@ -138,7 +198,12 @@ class EnrichmentInsight:
     severity: str
     recommended_action: str
     false_positive_likelihood: float
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @cached_property
+    def created_at_iso(self) -> str:
+        """ISO-8601 created_at, formatted once — reused by every API read and stream publish."""
+        return self.created_at.isoformat()
 
 
 class EnrichmentClient:
@@ -148,7 +213,11 @@ class EnrichmentClient:
     Configured via environment variables:
         ANTHROPIC_API_KEY         — required
         AGENTGUARD_ANALYZER_MODEL — default: claude-sonnet-4-6
-        AGENTGUARD_ANALYZER_TIMEOUT — default: 30.0
+        AGENTGUARD_ANALYZER_READ_TIMEOUT — default: 60.0 (legacy alias: AGENTGUARD_ANALYZER_TIMEOUT)
+        AGENTGUARD_ENRICHMENT_BATCHES — "true" to triage via the Message Batches API
+            (cheaper, higher throughput; insights arrive minutes rather than seconds later)
+        AGENTGUARD_ANALYZER_BATCH_SIZE — max events per batch, default: 20
+        AGENTGUARD_ANALYZER_BATCH_WINDOW_MS — max wait to fill a batch, default: 500
     """
 
     def __init__(
@@ -156,13 +225,41 @@ class EnrichmentClient:
         api_key: str | None = None,
         model: str | None = None,
         timeout: float | None = None,
+        batch: bool | None = None,
     ) -> None:
         self._api_key = api_key or os.getenv("ANTHROPIC_API_KEY", "")
         self._model = model or os.getenv("AGENTGUARD_ANALYZER_MODEL", "claude-sonnet-4-6")
-        self._timeout = timeout or float(os.getenv("AGENTGUARD_ANALYZER_TIMEOUT", "30.0"))
+        # Read timeout for the triage call; connect/write/pool get their own short limits
+        self._timeout = timeout or float(
+            os.getenv("AGENTGUARD_ANALYZER_READ_TIMEOUT")
+            or os.getenv("AGENTGUARD_ANALYZER_TIMEOUT", "60.0")
+        )
         self._enabled = bool(self._api_key)
         # Process-local cache: agent_id → display_name (avoids redundant LLM calls)
         self._name_cache: dict[str, str] = {}
+        # (tool_name, decision, reason digest) → insight. Repeated attacks produce the
+        # same triage verdict, so a hit skips the API round-trip entirely.
+        # Plain dict in insertion order; the oldest entry is evicted when full.
+        self._triage_cache: dict[tuple[Any, Any, bytes], EnrichmentInsight] = {}
+        self._triage_inflight: dict[tuple[Any, Any, bytes], asyncio.Future[EnrichmentInsight]] = {}
+        # Shared AsyncAnthropic client — created on first use, reused so every
+        # triage/naming call rides the same pooled keep-alive connections.
+        self._client: Any = None
+        # Message Batches mode (worker path only — latency-to-insight is not critical there)
+        self._batch_enabled = (
+            batch
+            if batch is not None
+            else os.getenv("AGENTGUARD_ENRICHMENT_BATCHES", "").lower() == "true"
+        )
+        self._batch_size = int(os.getenv("AGENTGUARD_ANALYZER_BATCH_SIZE", "20"))
+        self._batch_window = float(os.getenv("AGENTGUARD_ANALYZER_BATCH_WINDOW_MS", "500")) / 1000
+        self._batcher: Coalescer[tuple[dict[str, Any], asyncio.Future[EnrichmentInsight]]] = Coalescer(
+            self._submit_batch, self._batch_window, self._batch_size
+        )
+        # Optional budget gate (e.g. the enrichment worker's RPM/TPM limiter),
+        # awaited with the event just before each real triage request — cache
+        # hits and coalesced duplicates never reach it
+        self.triage_gate: Callable[[dict[str, Any]], Awaitable[None]] | None = None
 
         if not self._enabled:
             logger.warning("enrichment_disabled", reason="ANTHROPIC_API_KEY not set")
@@ -171,6 +268,31 @@ class EnrichmentClient:
     def enabled(self) -> bool:
         return self._enabled
 
+    def _get_client(self) -> Any:
+        # No await between the check and the assignment, so no lock is needed
+        if self._client is None:
+            # Deferred: only processes that actually call Claude pay for the SDK import
+            import anthropic
+            import httpx
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self._api_key,
+                http_client=anthropic.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                    # Long read (first token on large prompts), fail fast on everything else
+                    timeout=anthropic.Timeout(connect=5.0, read=self._timeout, write=10.0, pool=5.0),
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections (call on worker/app shutdown)."""
+        # Message Batches can take minutes to end; waiters on batches still
+        # polling after the timeout are cancelled rather than left hanging
+        await self._batcher.drain(timeout=_BATCH_CLOSE_TIMEOUT)
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
     def get_display_name(self, agent_id: str, goal: str, framework: str, is_registered: bool = False) -> str:
         """
         Return a display name for an agent immediately — zero latency, never blocks.
@@ -201,7 +323,6 @@ class EnrichmentClient:
         self._name_cache[agent_id] = rule_name
 
         if self._enabled:
-            import asyncio
             try:
                 asyncio.get_running_loop().create_task(
                     self._refine_name_background(agent_id, goal)
@@ -220,9 +341,7 @@ class EnrichmentClient:
         Called at most once per unique agent_id per process lifetime.
         """
         try:
-            import anthropic
-            client = anthropic.AsyncAnthropic(api_key=self._api_key)
-            response = await client.messages.create(
+            response = await self._get_client().messages.create(
                 model=_NAME_MODEL,
                 max_tokens=12,          # a 2-4 word name never needs more than 12 tokens
                 system=_NAME_SYSTEM,
@@ -235,8 +354,7 @@ class EnrichmentClient:
         except Exception as exc:
             # Rule-based name already in cache — this is a best-effort refinement.
             # Log at debug so systematic failures (e.g. API format changes) are visible.
-            import structlog as _sl
-            _sl.get_logger(__name__).debug(
+            logger.debug(
                 "name_refine_failed",
                 agent_id=agent_id,
                 error_type=type(exc).__name__,
@@ -248,50 +366,171 @@ class EnrichmentClient:
         if not self._enabled:
             return _fallback_insight(event["event_id"])
 
-        user_message = (
-            f"Review this blocked/flagged AI agent action:\n\n"
-            f"Tool: {event.get('tool_name', 'unknown')}\n"
-            f"Decision: {event.get('decision', 'unknown')}\n"
-            f"Risk Score: {event.get('risk_score', 0.0)}\n"
-            f"Agent Goal: {event.get('agent_goal', 'unknown')}\n"
-            f"Reason: {event.get('reason', 'unknown')}\n"
-            f"Session: {event.get('session_id', 'unknown')}"
-        )
-
+        key = _triage_key(event)
+        cached = self._triage_cache.get(key)
+        if cached is not None:
+            logger.debug("enrichment_triage_cache_hit", event_id=event.get("event_id"))
+            return _reissue(cached, event)
+
+        # Single-flight: a duplicate of an event already being triaged waits for
+        # that call instead of paying for a second identical one.
+        inflight = self._triage_inflight.get(key)
+        if inflight is not None:
+            logger.debug("enrichment_triage_coalesced", event_id=event.get("event_id"))
+            return _reissue(await asyncio.shield(inflight), event)
+
+        future: asyncio.Future[EnrichmentInsight] = asyncio.get_running_loop().create_future()
+        self._triage_inflight[key] = future
         try:
-            import anthropic
-            client = anthropic.AsyncAnthropic(api_key=self._api_key)
-            response = await client.messages.create(
-                model=self._model,
-                max_tokens=512,
-                system=SYSTEM_PROMPT,
-                tools=[TRIAGE_TOOL],
-                tool_choice={"type": "tool", "name": "security_triage"},
-                messages=[{"role": "user", "content": user_message}],
-                timeout=self._timeout,
-            )
-
-            tool_input: dict[str, Any] = {}
-            for block in response.content:
-                if block.type == "tool_use" and block.name == "security_triage":
-                    tool_input = block.input
-                    break
-
-            pattern = tool_input.get("attack_pattern", "none")
-            return EnrichmentInsight(
-                event_id=event["event_id"],
-                analysis=tool_input.get("summary", "Analysis unavailable"),
-                attack_patterns=[pattern] if pattern and pattern != "none" else [],
-                confidence=float(tool_input.get("confidence", 0.0)),
-                severity=tool_input.get("severity", "low"),
-                recommended_action=tool_input.get("recommended_action", "Monitor"),
-                false_positive_likelihood=float(tool_input.get("false_positive_likelihood", 0.0)),
-            )
+            insight = await self._triage_uncached(event)
+        except BaseException:
+            # Waiters get the fallback rather than this caller's cancellation
+            future.set_result(_fallback_insight(event["event_id"]))
+            raise
+        else:
+            future.set_result(insight)
+        finally:
+            del self._triage_inflight[key]
+        return insight
+
+    async def _triage_uncached(self, event: dict[str, Any]) -> EnrichmentInsight:
+        if self._batch_enabled:
+            return await self._triage_batched(event)
+
+        if self.triage_gate is not None:
+            await self.triage_gate(event)
+        try:
+            response = await self._get_client().messages.create(**self._triage_params(event))
+            insight = _insight_from_content(event["event_id"], response.content)
+            self._remember_triage(event, insight)
+            return insight
 
         except Exception as exc:
             logger.warning("enrichment_triage_error", event_id=event.get("event_id"), error=str(exc))
             return _fallback_insight(event["event_id"])
 
+    def _remember_triage(self, event: dict[str, Any], insight: EnrichmentInsight) -> None:
+        """Cache a successful triage result, evicting the oldest entry when full."""
+        self._triage_cache[_triage_key(event)] = insight
+        if len(self._triage_cache) > _TRIAGE_CACHE_MAX_SIZE:
+            del self._triage_cache[next(iter(self._triage_cache))]
+
+    def _triage_params(self, event: dict[str, Any]) -> dict[str, Any]:
+        """messages.create parameters for one triage request (shared by both modes)."""
+        user_message = _USER_TEMPLATE.format_map(_EventFields(event))
+        return {
+            "model": self._model,
+            **_TRIAGE_KWARGS,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+
+    # ------------------------------------------------------------------
+    # Message Batches mode
+    # ------------------------------------------------------------------
+
+    async def _triage_batched(self, event: dict[str, Any]) -> EnrichmentInsight:
+        """Queue the event for the next Message Batches submission and wait for its insight."""
+        # Up to batch_size events (or batch_window seconds) per submission; each
+        # submission runs in the background so the next batch fills meanwhile
+        future: asyncio.Future[EnrichmentInsight] = asyncio.get_running_loop().create_future()
+        self._batcher.add((event, future))
+        return await future
+
+    async def _submit_batch(
+        self,
+        batch: list[tuple[dict[str, Any], asyncio.Future[EnrichmentInsight]]],
+    ) -> None:
+        """Create one Message Batch, poll until it ends, and resolve every waiting caller."""
+        # Index-based custom_ids — event_ids are not guaranteed unique within a batch
+        pending = {f"e{i}": item for i, item in enumerate(batch)}
+        insights: dict[str, EnrichmentInsight] = {}
+        client = self._get_client()
+        try:
+            message_batch = await client.messages.batches.create(
+                requests=[
+                    {"custom_id": custom_id, "params": self._triage_params(event)}
+                    for custom_id, (event, _) in pending.items()
+                ],
+            )
+            logger.debug("enrichment_batch_submitted", batch_id=message_batch.id, size=len(batch))
+            while message_batch.processing_status != "ended":
+                await asyncio.sleep(_BATCH_POLL_INTERVAL)
+                message_batch = await client.messages.batches.retrieve(message_batch.id)
+
+            async for entry in await client.messages.batches.results(message_batch.id):
+                item = pending.get(entry.custom_id)
+                if item is None:
+                    continue
+                event_id = item[0]["event_id"]
+                if entry.result.type == "succeeded":
+                    try:
+                        insight = _insight_from_content(event_id, entry.result.message.content)
+                    except ValidationError as exc:
+                        logger.warning("enrichment_triage_invalid", event_id=event_id, error=str(exc))
+                    else:
+                        insights[entry.custom_id] = insight
+                        self._remember_triage(item[0], insight)
+                else:
+                    logger.warning(
+                        "enrichment_batch_entry_failed",
+                        event_id=event_id,
+                        result=entry.result.type,
+                    )
+        except Exception as exc:
+            logger.warning("enrichment_batch_error", size=len(batch), error=str(exc))
+        except asyncio.CancelledError:
+            for _, future in pending.values():
+                future.cancel()
+            raise
+
+        for custom_id, (event, future) in pending.items():
+            if not future.done():
+                future.set_result(insights.get(custom_id) or _fallback_insight(event["event_id"]))
+
+
+def _triage_key(event: dict[str, Any]) -> tuple[Any, Any, bytes]:
+    """Triage cache key — long reason strings are reduced to a 64-bit digest."""
+    reason = str(event.get("reason", ""))
+    return (
+        event.get("tool_name"),
+        event.get("decision"),
+        hashlib.blake2b(reason.encode(), digest_size=8).digest(),
+    )
+
+
+def _reissue(insight: EnrichmentInsight, event: dict[str, Any]) -> EnrichmentInsight:
+    """Copy a shared triage result for another event with the same triage key."""
+    return replace(
+        insight,
+        event_id=event["event_id"],
+        attack_patterns=list(insight.attack_patterns),
+        created_at=datetime.now(UTC),
+    )
+
+
+def _insight_from_content(event_id: str, content: Any) -> EnrichmentInsight:
+    """
+    Build an EnrichmentInsight from the security_triage tool_use block of a response.
+
+    Raises ValidationError when the tool input does not match TRIAGE_TOOL's schema.
+    """
+    tool_input: dict[str, Any] = {}
+    for block in content:
+        if block.type == "tool_use" and block.name == "security_triage":
+            tool_input = block.input
+            break
+
+    parsed = TriageResult.model_validate(tool_input)
+    return EnrichmentInsight(
+        event_id=event_id,
+        analysis=parsed.summary,
+        attack_patterns=[] if parsed.attack_pattern == "none" else [parsed.attack_pattern],
+        confidence=parsed.confidence,
+        severity=parsed.severity,
+        recommended_action=parsed.recommended_action,
+        false_positive_likelihood=parsed.false_positive_likelihood,
+    )
+
 
 def _fallback_insight(event_id: str) -> EnrichmentInsight:
     return EnrichmentInsight(
@@ -309,11 +548,6 @@ def _fallback_insight(event_id: str) -> EnrichmentInsight:
 # Singleton
 # ---------------------------------------------------------------------------
 
-_client: EnrichmentClient | None = None
-
-
+@lru_cache(maxsize=1)
 def get_enrichment_client() -> EnrichmentClient:
-    global _client
-    if _client is None:
-        _client = EnrichmentClient()
-    return _client
+    return EnrichmentClient()
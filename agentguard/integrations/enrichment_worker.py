@@ -12,10 +12,12 @@ and the 'agentguard:insights' Redis stream.
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 import signal
+import time
+from typing import Any
 
+import orjson
 import structlog
 
 from agentguard.integrations.enrichment import get_enrichment_client
@@ -25,6 +27,64 @@ from agentguard.telemetry.logger import configure_logging
 
 logger = structlog.get_logger(__name__)
 
+# Rough per-request budget: system prompt + triage tool schema + max output tokens
+_REQUEST_OVERHEAD_TOKENS = 400 + 512
+# Seconds in-flight triage calls get to finish on shutdown
+_DRAIN_TIMEOUT = 10.0
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute budget for the Anthropic API.
+
+    Fixed 60 s window on the monotonic clock. acquire() waits for the next
+    window when the request would push either counter over its limit, so a
+    burst of concurrent triage calls stays under the account's rate limits
+    instead of tripping 429s and retries.
+    """
+
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self._rpm = rpm
+        self._tpm = tpm
+        self._lock = asyncio.Lock()
+        self._window_start = time.monotonic()
+        self._requests = 0
+        self._tokens = 0
+
+    async def acquire(self, tokens: int) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now - self._window_start >= 60.0:
+                    self._window_start = now
+                    self._requests = 0
+                    self._tokens = 0
+                # A request larger than the whole budget still goes through in an empty window
+                fits_tokens = self._tokens + tokens <= self._tpm or self._tokens == 0
+                if self._requests < self._rpm and fits_tokens:
+                    self._requests += 1
+                    self._tokens += tokens
+                    return
+                delay = 60.0 - (now - self._window_start)
+                logger.debug("enrichment_rate_limited", delay_s=round(delay, 2))
+                await asyncio.sleep(delay)
+
+
+def _estimate_tokens(fields: dict[str, Any]) -> int:
+    """~4 characters per token for the event fields, plus fixed prompt/output overhead."""
+    return sum(len(str(v)) for v in fields.values()) // 4 + _REQUEST_OVERHEAD_TOKENS
+
+
+_rate_limiter = RateLimiter(
+    rpm=int(os.getenv("AGENTGUARD_RPM", "50")),
+    tpm=int(os.getenv("AGENTGUARD_TPM", "40000")),
+)
+
+
+async def _acquire_triage_budget(event: dict[str, Any]) -> None:
+    """EnrichmentClient.triage_gate — charged only for requests that reach the API."""
+    await _rate_limiter.acquire(_estimate_tokens(event))
+
 
 async def handle_event(fields: dict[str, str]) -> None:
     """Process one event from the Redis stream."""
@@ -42,12 +102,12 @@ async def handle_event(fields: dict[str, str]) -> None:
         await publisher.publish_insight({
             "event_id": insight.event_id,
             "analysis": insight.analysis,
-            "attack_patterns": json.dumps(insight.attack_patterns),
+            "attack_patterns": orjson.dumps(insight.attack_patterns).decode(),
             "confidence": str(insight.confidence),
             "severity": insight.severity,
             "recommended_action": insight.recommended_action,
             "false_positive_likelihood": str(insight.false_positive_likelihood),
-            "created_at": insight.created_at.isoformat(),
+            "created_at": insight.created_at_iso,
         })
 
     logger.info(
@@ -60,28 +120,37 @@ async def handle_event(fields: dict[str, str]) -> None:
 
 
 async def main() -> None:
-    configure_logging(log_level=os.getenv("AGENTGUARD_LOG_LEVEL", "INFO"))
+    configure_logging(log_level=os.getenv("AGENTGUARD_LOG_LEVEL", "INFO"), force=True)
     logger.info("enrichment_worker_starting")
+    get_enrichment_client().triage_gate = _acquire_triage_budget
 
     consumer = RedisStreamConsumer(
         consumer_name=os.getenv("ENRICHMENT_WORKER_NAME", "enrichment-1"),
     )
 
     loop = asyncio.get_running_loop()
-    stop = loop.create_future()
+    # An Event, not a Future: a second signal (double Ctrl-C) must be a no-op
+    stop = asyncio.Event()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, stop.set_result, None)
+        loop.add_signal_handler(sig, stop.set)
 
-    worker_task = asyncio.create_task(consumer.run(handle_event))
+    concurrency = int(os.getenv("AGENTGUARD_ENRICH_CONCURRENCY", "8"))
+    worker_task = asyncio.create_task(
+        consumer.run(handle_event, concurrency=concurrency, drain_timeout=_DRAIN_TIMEOUT)
+    )
 
-    await stop
+    await stop.wait()
+    # Let in-flight triage finish and be acked — otherwise those events are
+    # redelivered after restart and paid for twice
     worker_task.cancel()
     try:
         await worker_task
     except asyncio.CancelledError:
         pass
 
+    await get_stream_publisher().close()
+    await get_enrichment_client().aclose()
     logger.info("enrichment_worker_stopped")
 
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
+from collections import deque
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
 from agentguard.integrations.enrichment import EnrichmentInsight
@@ -12,41 +14,58 @@ class InsightsStore:
     """Bounded in-memory store for enrichment insights, keyed by event_id."""
 
     def __init__(self, maxsize: int = 1000) -> None:
-        self._store: OrderedDict[str, EnrichmentInsight] = OrderedDict()
+        # Plain dict: insertion-ordered, smaller and faster than OrderedDict
+        self._store: dict[str, EnrichmentInsight] = {}
+        # API representation built once at put() — dashboards poll far more often
+        # than insights are written
+        self._dicts: dict[str, dict[str, Any]] = {}
+        # event_ids in insertion order, so list_recent() touches only the tail
+        self._ids: deque[str] = deque()
         self._maxsize = maxsize
 
     def put(self, insight: EnrichmentInsight) -> None:
-        if insight.event_id in self._store:
-            del self._store[insight.event_id]
+        # Re-insert so an updated insight moves to the newest position
+        if self._store.pop(insight.event_id, None) is not None:
+            self._ids.remove(insight.event_id)  # O(n), but only on updates
         self._store[insight.event_id] = insight
+        self._dicts[insight.event_id] = _insight_dict(insight)
+        self._ids.append(insight.event_id)
         if len(self._store) > self._maxsize:
-            self._store.popitem(last=False)
+            evicted = self._ids.popleft()
+            del self._store[evicted]
+            del self._dicts[evicted]
 
     def get(self, event_id: str) -> EnrichmentInsight | None:
         return self._store.get(event_id)
 
     def list_recent(self, limit: int = 50) -> list[EnrichmentInsight]:
-        items = list(self._store.values())
-        return items[-limit:]
+        if limit <= 0:
+            # Preserve the historical slice semantics for non-positive limits
+            return list(self._store.values())[-limit:]
+        newest_first = [self._store[k] for k in islice(reversed(self._ids), limit)]
+        newest_first.reverse()
+        return newest_first
 
     def to_dict(self, insight: EnrichmentInsight) -> dict[str, Any]:
-        return {
-            "event_id": insight.event_id,
-            "analysis": insight.analysis,
-            "attack_patterns": insight.attack_patterns,
-            "confidence": insight.confidence,
-            "severity": insight.severity,
-            "recommended_action": insight.recommended_action,
-            "false_positive_likelihood": insight.false_positive_likelihood,
-            "created_at": insight.created_at.isoformat(),
-        }
+        """API representation — prebuilt for stored insights, built on demand otherwise."""
+        if self._store.get(insight.event_id) is insight:
+            return self._dicts[insight.event_id]
+        return _insight_dict(insight)
 
 
-_store: InsightsStore | None = None
+def _insight_dict(insight: EnrichmentInsight) -> dict[str, Any]:
+    return {
+        "event_id": insight.event_id,
+        "analysis": insight.analysis,
+        "attack_patterns": insight.attack_patterns,
+        "confidence": insight.confidence,
+        "severity": insight.severity,
+        "recommended_action": insight.recommended_action,
+        "false_positive_likelihood": insight.false_positive_likelihood,
+        "created_at": insight.created_at_iso,
+    }
 
 
+@lru_cache(maxsize=1)
 def get_insights_store() -> InsightsStore:
-    global _store
-    if _store is None:
-        _store = InsightsStore()
-    return _store
+    return InsightsStore()
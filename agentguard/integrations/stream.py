@@ -11,16 +11,27 @@ from __future__ import annotations
 
 import asyncio
 import os
+from functools import lru_cache
 from typing import Any
 
 import structlog
 
+from agentguard.core.batching import Coalescer
+
 logger = structlog.get_logger(__name__)
 
 EVENTS_STREAM = "agentguard:events"
 INSIGHTS_STREAM = "agentguard:insights"
 CONSUMER_GROUP = "agentguard-enrichment"
 STREAM_MAXLEN = 10_000  # cap stream size to avoid unbounded growth
+_READ_BATCH = 10  # max messages claimed per XREADGROUP
+# PING connections idle this long (seconds) before reuse, so a long-lived worker
+# connection silently dropped by a proxy or failover is noticed before a command
+_HEALTH_CHECK_INTERVAL = 30
+# Publishes arriving within this window (seconds) share one pipelined round-trip
+_PUBLISH_WINDOW = 0.01
+# A pending pipeline this large is sent immediately
+_PUBLISH_BATCH_MAX = 64
 
 
 class RedisStreamPublisher:
@@ -29,12 +40,19 @@ class RedisStreamPublisher:
 
     Lazy-connects on first publish so startup is never blocked.
     Falls back silently if Redis is unavailable.
+
+    XADDs issued within _PUBLISH_WINDOW of each other are sent as one
+    non-transactional pipeline. Each publish call still waits for its own
+    reply, so a failed XADD raises in the caller exactly as before.
     """
 
     def __init__(self, redis_url: str | None = None) -> None:
         self._url = redis_url or os.getenv("REDIS_URL", "")
         self._client: Any = None
         self._enabled = bool(self._url)
+        self._batcher: Coalescer[tuple[str, dict[str, str], asyncio.Future]] = Coalescer(
+            self._send, _PUBLISH_WINDOW, _PUBLISH_BATCH_MAX
+        )
 
     @property
     def enabled(self) -> bool:
@@ -43,20 +61,52 @@ class RedisStreamPublisher:
     async def _get_client(self) -> Any:
         if self._client is None:
             import redis.asyncio as aioredis
-            self._client = aioredis.from_url(self._url, decode_responses=True)
+            # Replies (entry IDs) are never read, so skip decoding them
+            self._client = aioredis.from_url(
+                self._url,
+                decode_responses=False,
+                health_check_interval=_HEALTH_CHECK_INTERVAL,
+            )
         return self._client
 
     async def publish_event(self, event_data: dict[str, str]) -> None:
         """XADD to agentguard:events stream. Fire-and-forget safe."""
-        client = await self._get_client()
-        await client.xadd(EVENTS_STREAM, event_data, maxlen=STREAM_MAXLEN, approximate=True)
+        await self._enqueue(EVENTS_STREAM, event_data)
 
     async def publish_insight(self, insight_data: dict[str, str]) -> None:
         """XADD to agentguard:insights stream (enrichment worker → AgentGuard direction)."""
-        client = await self._get_client()
-        await client.xadd(INSIGHTS_STREAM, insight_data, maxlen=STREAM_MAXLEN, approximate=True)
+        await self._enqueue(INSIGHTS_STREAM, insight_data)
+
+    async def _enqueue(self, stream: str, fields: dict[str, str]) -> None:
+        """Queue one XADD for the next pipeline flush and wait for its reply."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._batcher.add((stream, fields, future))
+        await future
+
+    async def _send(self, batch: list[tuple[str, dict[str, str], asyncio.Future]]) -> None:
+        """Send queued XADDs as one pipeline and resolve each caller's future."""
+        try:
+            client = await self._get_client()
+            pipe = client.pipeline(transaction=False)
+            for stream, fields, _ in batch:
+                pipe.xadd(stream, fields, maxlen=STREAM_MAXLEN, approximate=True)
+            results = await pipe.execute(raise_on_error=False)
+        except Exception as exc:
+            results = [exc] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue  # caller was cancelled while waiting
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(None)
+
+    async def flush(self) -> None:
+        """Send any queued XADDs now and wait for in-flight pipelines (call before shutdown)."""
+        await self._batcher.drain()
 
     async def close(self) -> None:
+        await self.flush()
         if self._client:
             await self._client.aclose()
 
@@ -77,11 +127,19 @@ class RedisStreamConsumer:
         self._url = redis_url or os.getenv("REDIS_URL", "")
         self._consumer_name = consumer_name
         self._client: Any = None
+        # IDs whose handler succeeded, awaiting the next batched XACK
+        self._acks: list[bytes] = []
 
     async def _get_client(self) -> Any:
         if self._client is None:
             import redis.asyncio as aioredis
-            self._client = aioredis.from_url(self._url, decode_responses=True)
+            # Raw bytes: message IDs go straight back into XACK undecoded and only
+            # the fields of dispatched messages are decoded (see _process)
+            self._client = aioredis.from_url(
+                self._url,
+                decode_responses=False,
+                health_check_interval=_HEALTH_CHECK_INTERVAL,
+            )
         return self._client
 
     async def ensure_group(self) -> None:
@@ -92,22 +150,48 @@ class RedisStreamConsumer:
         except Exception:
             pass  # group already exists
 
-    async def run(self, handler: Any, poll_interval: float = 0.5) -> None:
+    async def run(
+        self,
+        handler: Any,
+        poll_interval: float = 0.5,
+        concurrency: int = 1,
+        drain_timeout: float = 0.0,
+    ) -> None:
         """
         Blocking consume loop. For each event, call handler(event_data dict),
         then XACK. Runs until the task is cancelled.
+
+        Up to `concurrency` handlers run at once. Each XREADGROUP claims at most
+        as many messages as there are free handler slots, so messages are never
+        parked in this consumer's pending list while other consumers sit idle;
+        reading pauses while every slot is busy. Each message is XACKed only
+        after its own handler succeeds, so delivery stays at-least-once. Acks
+        are collected and sent as one multi-ID XACK per poll instead of one
+        round-trip per message.
+
+        On cancellation, in-flight handlers get up to `drain_timeout` seconds to
+        finish (and be acked) before they are cancelled too.
         """
         await self.ensure_group()
         client = await self._get_client()
-        logger.info("redis_consumer_started", stream=EVENTS_STREAM, group=CONSUMER_GROUP)
+        logger.info(
+            "redis_consumer_started",
+            stream=EVENTS_STREAM,
+            group=CONSUMER_GROUP,
+            concurrency=concurrency,
+        )
+        in_flight: set[asyncio.Task] = set()
 
         while True:
             try:
+                while len(in_flight) >= concurrency:
+                    await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                await self._flush_acks(client)
                 results = await client.xreadgroup(
                     CONSUMER_GROUP,
                     self._consumer_name,
                     {EVENTS_STREAM: ">"},
-                    count=10,
+                    count=min(_READ_BATCH, concurrency - len(in_flight)),
                     block=int(poll_interval * 1000),
                 )
                 if not results:
@@ -115,33 +199,51 @@ class RedisStreamConsumer:
 
                 for _stream, messages in results:
                     for msg_id, fields in messages:
-                        try:
-                            await handler(fields)
-                            await client.xack(EVENTS_STREAM, CONSUMER_GROUP, msg_id)
-                        except Exception as exc:
-                            logger.warning(
-                                "redis_consumer_handler_error",
-                                msg_id=msg_id,
-                                error=str(exc),
-                            )
+                        task = asyncio.create_task(self._process(handler, msg_id, fields))
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
             except asyncio.CancelledError:
                 break
             except Exception as exc:
                 logger.warning("redis_consumer_poll_error", error=str(exc))
                 await asyncio.sleep(poll_interval)
 
+        if in_flight and drain_timeout > 0:
+            logger.info("redis_consumer_draining", in_flight=len(in_flight))
+            await asyncio.wait(in_flight, timeout=drain_timeout)
+        # Unacked messages stay pending in the group and are redelivered later
+        for task in list(in_flight):
+            task.cancel()
+        await self._flush_acks(client)
         await client.aclose()
 
+    async def _process(self, handler: Any, msg_id: bytes, fields: dict[bytes, bytes]) -> None:
+        try:
+            await handler({k.decode(): v.decode() for k, v in fields.items()})
+            self._acks.append(msg_id)
+        except Exception as exc:
+            logger.warning(
+                "redis_consumer_handler_error",
+                msg_id=msg_id.decode(),
+                error=str(exc),
+            )
+
+    async def _flush_acks(self, client: Any) -> None:
+        """XACK every handled message in one command; keep the IDs for retry on failure."""
+        if not self._acks:
+            return
+        ids, self._acks = self._acks, []
+        try:
+            await client.xack(EVENTS_STREAM, CONSUMER_GROUP, *ids)
+        except Exception as exc:
+            self._acks[:0] = ids
+            logger.warning("redis_consumer_ack_error", pending=len(self._acks), error=str(exc))
+
 
 # ---------------------------------------------------------------------------
 # Singleton publisher
 # ---------------------------------------------------------------------------
 
-_publisher: RedisStreamPublisher | None = None
-
-
+@lru_cache(maxsize=1)
 def get_stream_publisher() -> RedisStreamPublisher:
-    global _publisher
-    if _publisher is None:
-        _publisher = RedisStreamPublisher()
-    return _publisher
+    return RedisStreamPublisher()
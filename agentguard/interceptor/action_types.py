@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import os
 import re
-from pathlib import PurePosixPath
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from agentguard.core.models import ActionType
@@ -29,65 +29,138 @@ CREDENTIAL_PATTERNS: frozenset[str] = frozenset([
 
 CREDENTIAL_EXTENSIONS: set[str] = {".pem", ".key", ".p12", ".pfx", ".crt", ".cer"}
 
-# Tool name patterns → ActionType mapping
-_TOOL_TYPE_PATTERNS: list[tuple[re.Pattern[str], ActionType]] = [
-    (re.compile(r"^(bash|shell|subprocess|exec|run_command|terminal|sh)\b", re.I), ActionType.SHELL_COMMAND),
-    (re.compile(r"^(file\.write|write_file|save_file|create_file|append_file)\b", re.I), ActionType.FILE_WRITE),
-    (re.compile(r"^(file\.read|read_file|open_file|cat|read)\b", re.I), ActionType.FILE_READ),
-    (re.compile(r"^(http|requests?|curl|fetch|web_request|http_request|http_post|http_get)\b", re.I), ActionType.HTTP_REQUEST),
-    (re.compile(r"^(memory\.(write|set|update)|set_memory|update_memory)\b", re.I), ActionType.MEMORY_WRITE),
-    (re.compile(r"^(credential|secret|vault|keychain)\b", re.I), ActionType.CREDENTIAL_ACCESS),
-]
+
+def _index_by_basename(
+    patterns: frozenset[str],
+) -> dict[str, tuple[frozenset[str], tuple[str, ...]]]:
+    """
+    Group multi-segment credential patterns by their final path segment.
+
+    A path can only match a pattern whose last segment equals the path's
+    basename, so one dict lookup replaces the scan over every pattern. Each
+    entry holds the lowercased exact forms and the "/"-prefixed suffixes, so
+    a candidate group is checked with one set probe and one str.endswith call.
+    """
+    index: dict[str, list[str]] = {}
+    for pattern in patterns:
+        lowered = pattern.lower()
+        if "/" in lowered:
+            index.setdefault(lowered.rpartition("/")[2], []).append(lowered)
+    return {
+        name: (frozenset(group), tuple("/" + p for p in group))
+        for name, group in index.items()
+    }
+
+
+_CREDENTIAL_INDEX = _index_by_basename(CREDENTIAL_PATTERNS)
+# Single-segment patterns match on the basename alone
+_CREDENTIAL_BASENAMES: frozenset[str] = frozenset(
+    p.lower() for p in CREDENTIAL_PATTERNS if "/" not in p
+)
+
+# Tool name patterns → ActionType mapping, unioned into one anchored regex.
+# Alternatives are tried in order — write before read so write tools classify correctly;
+# the name of the matching group selects the ActionType.
+_TOOL_TYPE_PATTERN: re.Pattern[str] = re.compile(
+    r"^(?:"
+    r"(?P<shell>bash|shell|subprocess|exec|run_command|terminal|sh)\b"
+    r"|(?P<file_write>file\.write|write_file|save_file|create_file|append_file)\b"
+    r"|(?P<file_read>file\.read|read_file|open_file|cat|read)\b"
+    r"|(?P<http>http|requests?|curl|fetch|web_request|http_request|http_post|http_get)\b"
+    r"|(?P<memory_write>memory\.(?:write|set|update)|set_memory|update_memory)\b"
+    r"|(?P<credential>credential|secret|vault|keychain)\b"
+    r")",
+    re.I,
+)
+
+_GROUP_TO_TYPE: dict[str, ActionType] = {
+    "shell": ActionType.SHELL_COMMAND,
+    "file_write": ActionType.FILE_WRITE,
+    "file_read": ActionType.FILE_READ,
+    "http": ActionType.HTTP_REQUEST,
+    "memory_write": ActionType.MEMORY_WRITE,
+    "credential": ActionType.CREDENTIAL_ACCESS,
+}
 
 
 def _normalize_path(path: str) -> str:
-    """Normalize path: expand ~, resolve to forward slashes, lowercase."""
-    expanded = os.path.expanduser(path)
-    return expanded.replace("\\", "/")
+    """Normalize path: expand ~ and resolve to forward slashes (callers lowercase)."""
+    # Only "~"-prefixed paths need the expanduser machinery (env/pwd lookups)
+    if path[:1] == "~":
+        path = os.path.expanduser(path)
+    # Skip the copy for the common Unix-style path
+    return path.replace("\\", "/") if "\\" in path else path
 
 
+@lru_cache(maxsize=4096)
 def is_credential_path(path: str) -> bool:
     """
     Return True if path matches any known credential pattern.
 
     Uses suffix matching against known sensitive filenames and directories,
     plus extension matching for certificate/key files.
+
+    Memoized — must stay a pure function of `path`. Agents hit the same
+    handful of paths repeatedly, so steady-state checks are a dict hit.
     """
     normalized = _normalize_path(path).lower()
-    p = PurePosixPath(normalized)
-
-    # Check file extension
-    if p.suffix in CREDENTIAL_EXTENSIONS:
+    # Basename and extension via string ops — no PurePosixPath allocation.
+    # Trailing slashes and "." segments are ignored, as pathlib does.
+    trimmed = normalized.rstrip("/")
+    while trimmed.endswith("/."):
+        trimmed = trimmed[:-2].rstrip("/")
+    name = trimmed[trimmed.rfind("/") + 1:]
+
+    # Check file extension — skipped outright for names without one. Leading-dot
+    # names (".pem") have no extension, matching PurePosixPath.suffix.
+    dot = name.rfind(".")
+    if dot > 0 and name[dot:] in CREDENTIAL_EXTENSIONS:
         return True
 
-    # Check for known credential filenames/paths by suffix matching
-    for pattern in CREDENTIAL_PATTERNS:
-        pattern_lower = pattern.lower()
-        # Match if the normalized path ends with the pattern (handles ~ expansion)
-        if normalized.endswith("/" + pattern_lower) or normalized == pattern_lower:
-            return True
-        # Also match basename for simple filename patterns (no slashes)
-        if "/" not in pattern_lower and p.name == pattern_lower:
+    # Known credential filenames, then multi-segment paths: only patterns ending in
+    # this basename can match, and they do when the path equals or ends with "/" + pattern
+    if name in _CREDENTIAL_BASENAMES:
+        return True
+    candidates = _CREDENTIAL_INDEX.get(name)
+    if candidates is not None:
+        exacts, suffixes = candidates
+        if normalized in exacts or normalized.endswith(suffixes):
             return True
 
-    # Catch bare .env files (starts with dot — fnmatch "*.env" misses these)
-    if p.name == ".env" or p.name.endswith(".env"):
-        return True
+    # Environment files by suffix ("prod.env", "app.env") — not covered by the
+    # ".env" basename pattern above
+    return name.endswith(".env")
 
-    return False
+
+@lru_cache(maxsize=2048)
+def _infer_by_tool_name(tool_name: str) -> ActionType | None:
+    """
+    ActionType implied by the tool name alone, or None.
+
+    Memoized — must stay pure. Tool names come from a small per-deployment
+    vocabulary, so the regex runs once per distinct name.
+    """
+    m = _TOOL_TYPE_PATTERN.match(tool_name)
+    return _GROUP_TO_TYPE[m.lastgroup] if m is not None else None  # type: ignore[index]
+
+
+@lru_cache(maxsize=2048)
+def _names_write_tool(tool_name: str) -> bool:
+    """True if the tool name contains a write keyword (memoized, pure)."""
+    lowered = tool_name.lower()
+    return any(kw in lowered for kw in ("write", "save", "create", "append", "put"))
 
 
 def infer_action_type(tool_name: str, parameters: dict) -> ActionType:
     """Infer the ActionType from tool name and parameters."""
-    # Check tool name against patterns — write before read so write tools classified correctly
-    for pattern, action_type in _TOOL_TYPE_PATTERNS:
-        if pattern.match(tool_name):
-            # Override write to CREDENTIAL_ACCESS if credential path
-            if action_type == ActionType.FILE_WRITE:
-                path = extract_file_path(parameters)
-                if path and is_credential_path(path):
-                    return ActionType.CREDENTIAL_ACCESS
-            return action_type
+    action_type = _infer_by_tool_name(tool_name)
+    if action_type is not None:
+        # Upgrade file reads/writes on credential paths to CREDENTIAL_ACCESS
+        if action_type is ActionType.FILE_WRITE or action_type is ActionType.FILE_READ:
+            path = extract_file_path(parameters)
+            if path and is_credential_path(path):
+                return ActionType.CREDENTIAL_ACCESS
+        return action_type
 
     # Inspect parameters for file paths
     path = extract_file_path(parameters)
@@ -95,7 +168,7 @@ def infer_action_type(tool_name: str, parameters: dict) -> ActionType:
         if is_credential_path(path):
             return ActionType.CREDENTIAL_ACCESS
         # Distinguish write vs read by tool name keywords
-        if any(kw in tool_name.lower() for kw in ("write", "save", "create", "append", "put")):
+        if _names_write_tool(tool_name):
             return ActionType.FILE_WRITE
         return ActionType.FILE_READ
 
@@ -112,31 +185,42 @@ def infer_action_type(tool_name: str, parameters: dict) -> ActionType:
     return ActionType.TOOL_CALL
 
 
+# Parameter keys probed for URLs / file paths, most common first
+_URL_KEYS = ("url", "endpoint", "uri", "href")
+_PATH_KEYS = ("path", "file", "filename", "filepath", "file_path")
+
+
 def extract_url_domain(parameters: dict) -> str | None:
     """
     Extract domain from URL-like parameters.
 
     Returns hostname only (no port), suitable for domain matching.
     """
-    url_keys = ("url", "endpoint", "uri", "href")
-    for key in url_keys:
-        if val := parameters.get(key):
-            if isinstance(val, str):
-                try:
-                    url = val if "://" in val else f"https://{val}"
-                    parsed = urlparse(url)
-                    # Use .hostname (not .netloc) to strip port number
-                    return parsed.hostname or None
-                except Exception:
-                    pass
+    if not parameters:
+        return None
+    for key in _URL_KEYS:
+        val = parameters.get(key)
+        if val and isinstance(val, str):
+            try:
+                url = val if "://" in val else f"https://{val}"
+                parsed = urlparse(url)
+                # Use .hostname (not .netloc) to strip port number
+                return parsed.hostname or None
+            except Exception:
+                pass
     return None
 
 
 def extract_file_path(parameters: dict) -> str | None:
     """Extract file path from parameters."""
-    path_keys = ("path", "file", "filename", "filepath", "file_path")
-    for key in path_keys:
-        if val := parameters.get(key):
-            if isinstance(val, str):
-                return val
+    if not parameters:
+        return None
+    # "path" is by far the most common key — probe it before the loop
+    val = parameters.get("path")
+    if val and isinstance(val, str):
+        return val
+    for key in _PATH_KEYS[1:]:
+        val = parameters.get(key)
+        if val and isinstance(val, str):
+            return val
     return None
@@ -3,53 +3,87 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import time
-import uuid
 from collections import defaultdict
+from dataclasses import dataclass
 from typing import Any
+from uuid import uuid4
 
+import orjson
 import structlog
 
-from agentguard.core.models import Action, ActionType, Decision, Event, ProvenanceTag, RiskAssessment, derive_agent_id
+from agentguard.core.models import (
+    Action,
+    ActionType,
+    AttackTaxonomyAnnotation,
+    Decision,
+    Event,
+    ProvenanceTag,
+    RiskAssessment,
+    derive_agent_id,
+)
 from agentguard.interceptor.action_types import (
     infer_action_type,
     is_credential_path,
     extract_file_path,
 )
-from agentguard.integrations.enrichment import get_enrichment_client
-from agentguard.integrations.stream import get_stream_publisher
+from agentguard.integrations.enrichment import EnrichmentClient, get_enrichment_client
+from agentguard.integrations.insights import get_insights_store
+from agentguard.integrations.stream import RedisStreamPublisher, get_stream_publisher
+from agentguard.taxonomy import lookup_by_attack_pattern
 
 logger = structlog.get_logger(__name__)
 
 
+# Canonical tool-name strings. Names come from a small per-deployment vocabulary,
+# so sharing one object per name lets later dict/cache lookups hit the identity
+# fast path. A bounded table rather than sys.intern: interned strings are immortal
+# on 3.12, and tool names are caller-controlled.
+_TOOL_NAMES: dict[str, str] = {}
+_TOOL_NAMES_MAX = 4096
+
+
+def _canonical_tool_name(tool_name: Any) -> Any:
+    if not isinstance(tool_name, str):
+        return tool_name  # left for Action validation to reject
+    canonical = _TOOL_NAMES.get(tool_name)
+    if canonical is not None:
+        return canonical
+    if len(_TOOL_NAMES) < _TOOL_NAMES_MAX:
+        _TOOL_NAMES[tool_name] = tool_name
+    return tool_name
+
+
+def _loads_tool_args(raw_args: str | bytes | bytearray) -> Any:
+    """Decode tool-call arguments — orjson fast path, stdlib json fallback."""
+    try:
+        return orjson.loads(raw_args)
+    except orjson.JSONDecodeError:
+        # orjson rejects some inputs stdlib accepts (NaN, integers beyond 64 bits);
+        # stdlib raises json.JSONDecodeError for genuinely malformed input
+        return json.loads(raw_args)
+
+
 class ActionNormalizer:
     """Normalize raw payloads from various frameworks into Action objects."""
 
     @staticmethod
     def from_openai_tool_call(tool_call: dict[str, Any]) -> Action:
         """Normalize an OpenAI tool call dict into an Action."""
-        import json
-
         function = tool_call.get("function", tool_call)
-        tool_name = function.get("name", "unknown")
+        tool_name = _canonical_tool_name(function.get("name", "unknown"))
         raw_args = function.get("arguments", "{}")
-        if isinstance(raw_args, str):
+        if isinstance(raw_args, (str, bytes, bytearray)):
             try:
-                parameters = json.loads(raw_args)
+                parameters = _loads_tool_args(raw_args)
             except json.JSONDecodeError as exc:
-                import structlog as _sl
-                _sl.get_logger(__name__).warning(
-                    "tool_args_json_parse_failed", tool=tool_name, error=str(exc)
-                )
+                logger.warning("tool_args_json_parse_failed", tool=tool_name, error=str(exc))
                 parameters = {"raw": raw_args}
         else:
             parameters = raw_args or {}
 
         action_type = infer_action_type(tool_name, parameters)
-        if action_type in (ActionType.FILE_READ, ActionType.FILE_WRITE):
-            path = extract_file_path(parameters)
-            if path and is_credential_path(path):
-                action_type = ActionType.CREDENTIAL_ACCESS
 
         return Action(
             tool_name=tool_name,
@@ -71,12 +105,9 @@ class ActionNormalizer:
         else:
             tool_name = "unknown"
             parameters = {}
+        tool_name = _canonical_tool_name(tool_name)
 
         action_type = infer_action_type(tool_name, parameters)
-        if action_type in (ActionType.FILE_READ, ActionType.FILE_WRITE):
-            path = extract_file_path(parameters)
-            if path and is_credential_path(path):
-                action_type = ActionType.CREDENTIAL_ACCESS
 
         return Action(
             tool_name=tool_name,
@@ -88,21 +119,26 @@ class ActionNormalizer:
     @staticmethod
     def from_dict(payload: dict[str, Any]) -> Action:
         """Normalize a generic dict payload into an Action."""
-        tool_name = payload.get("tool_name") or payload.get("name") or payload.get("tool", "unknown")
+        tool_name = _canonical_tool_name(
+            payload.get("tool_name") or payload.get("name") or payload.get("tool", "unknown")
+        )
         parameters = payload.get("parameters") or payload.get("args") or payload.get("input") or {}
         if not isinstance(parameters, dict):
             parameters = {"value": parameters}
 
         action_type_raw = payload.get("action_type") or payload.get("type")
+        action_type: ActionType | None = None
         if action_type_raw:
             try:
                 action_type = ActionType(action_type_raw)
             except ValueError:
-                action_type = infer_action_type(tool_name, parameters)
-        else:
-            action_type = infer_action_type(tool_name, parameters)
+                pass
 
-        if action_type in (ActionType.FILE_READ, ActionType.FILE_WRITE):
+        if action_type is None:
+            # infer_action_type already upgrades credential-path file access
+            action_type = infer_action_type(tool_name, parameters)
+        elif action_type in (ActionType.FILE_READ, ActionType.FILE_WRITE):
+            # Caller-declared file types still get the credential-path upgrade
             path = extract_file_path(parameters)
             if path and is_credential_path(path):
                 action_type = ActionType.CREDENTIAL_ACCESS
@@ -116,6 +152,39 @@ class ActionNormalizer:
 
 
 _SESSION_HISTORY_MAX = 5
+# ALLOW/REVIEW ledger appends waiting for an append worker. When full, an
+# append falls back to a tracked one-off task — it is never dropped
+_APPEND_QUEUE_MAX = 4096
+# Append workers — separate from enrichment so a ledger write never waits
+# behind a multi-second triage call
+_APPEND_WORKERS = 4
+# Enrichment jobs waiting for a worker; when full, enrichment (best-effort)
+# is dropped with a warning
+_ENRICH_QUEUE_MAX = 1024
+# Long-lived enrichment workers (direct triage takes seconds)
+_ENRICH_WORKERS = 4
+# Upper bound on how long aclose() waits for queued background work to finish
+_CLOSE_FLUSH_TIMEOUT = 10.0
+
+
+@dataclass(slots=True)
+class SessionStats:
+    """Per-session counters for session_limits enforcement."""
+
+    actions: int = 0
+    blocked: int = 0
+
+
+@dataclass(slots=True)
+class _BackgroundJob:
+    """Post-decision work for one event, handled off the request path."""
+
+    event: Event
+    # Ledger append still pending (ALLOW/REVIEW); BLOCK events are appended inline
+    append: bool
+    enrich: bool
+    # Redis Streams publisher for enrichment, or None to triage in-process
+    publisher: RedisStreamPublisher | None = None
 
 
 class Interceptor:
@@ -135,12 +204,68 @@ class Interceptor:
         self._policy = policy_engine
         self._ledger = event_ledger
         # Per-session counters for session_limits enforcement (in-memory)
-        self._session_stats: dict[str, dict[str, int]] = defaultdict(
-            lambda: {"actions": 0, "blocked": 0}
-        )
+        self._session_stats: dict[str, SessionStats] = defaultdict(SessionStats)
         # Per-session action history for multi-step attack detection
+        # Both are only touched from the event loop in await-free sections — no lock needed
         self._session_history: dict[str, list[dict]] = defaultdict(list)
-        self._stats_lock = asyncio.Lock()
+        # Actions decided by deterministic rules without an analyzer call
+        self.policy_preempted_analyses = 0
+        # Enrichment transports, resolved on first BLOCK/REVIEW and then reused
+        self._publisher: RedisStreamPublisher | None = None
+        self._enrichment: EnrichmentClient | None = None
+        # Bounded background queues + worker pools — one for ledger appends, one
+        # for enrichment — started on first use and bound to the event loop
+        # that started them
+        self._append_queue: asyncio.Queue[_BackgroundJob] | None = None
+        self._append_workers: list[asyncio.Task] = []
+        self._enrich_queue: asyncio.Queue[_BackgroundJob] | None = None
+        self._enrich_workers: list[asyncio.Task] = []
+        self._enrich_event_loop: asyncio.AbstractEventLoop | None = None
+        # Queue-full fallback appends, held until done
+        self._append_tasks: set[asyncio.Task] = set()
+
+    @property
+    def _stream_publisher(self) -> RedisStreamPublisher:
+        if self._publisher is None:
+            self._publisher = get_stream_publisher()
+        return self._publisher
+
+    @property
+    def _enrichment_client(self) -> EnrichmentClient:
+        if self._enrichment is None:
+            self._enrichment = get_enrichment_client()
+        return self._enrichment
+
+    async def flush(self) -> None:
+        """Wait until every queued ledger append and enrichment job has been handled."""
+        if self._enrich_event_loop is not asyncio.get_running_loop():
+            return
+        # Appends first: a finished append may still hand its event to enrichment
+        await self._append_queue.join()  # type: ignore[union-attr]
+        if self._append_tasks:
+            await asyncio.wait(set(self._append_tasks))
+        await self._enrich_queue.join()  # type: ignore[union-attr]
+
+    async def aclose(self) -> None:
+        """Flush and stop background workers, then release the analyzer's network resources."""
+        try:
+            await asyncio.wait_for(self.flush(), timeout=_CLOSE_FLUSH_TIMEOUT)
+        except TimeoutError:
+            logger.warning(
+                "background_flush_timeout",
+                pending_appends=self._append_queue.qsize() if self._append_queue else 0,
+                pending_enrichment=self._enrich_queue.qsize() if self._enrich_queue else 0,
+            )
+        for worker in (*self._append_workers, *self._enrich_workers):
+            worker.cancel()
+        self._append_workers = []
+        self._enrich_workers = []
+        self._append_queue = None
+        self._enrich_queue = None
+        self._enrich_event_loop = None
+        aclose = getattr(self._analyzer, "aclose", None)
+        if aclose is not None:
+            await aclose()
 
     async def intercept(
         self,
@@ -161,9 +286,9 @@ class Interceptor:
         if a deterministic policy rule fires, or if the LLM risk score
         exceeds the configured threshold.
         """
-        session_id = session_id or str(uuid.uuid4())
+        session_id = session_id or uuid4().hex
         resolved_provenance_tags = provenance_tags or []
-        t_start = time.monotonic()
+        t_start = time.perf_counter_ns()
 
         # Two-tier agent identity: explicit (registered) or derived (auto-detected)
         is_registered = bool(agent_id)
@@ -189,7 +314,7 @@ class Interceptor:
         except Exception as exc:
             # Fail-closed: an unhandled error in the pipeline must never silently
             # allow an action through. Block and log the error for investigation.
-            latency_ms = (time.monotonic() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
             log.error(
                 "intercept_pipeline_error",
                 error=str(exc),
@@ -230,7 +355,7 @@ class Interceptor:
         framework: str,
         is_registered: bool,
         resolved_agent_id: str,
-        t_start: float,
+        t_start: int,
         log: Any,
         correlation_id: str = "",
         initiating_principal: str = "",
@@ -246,31 +371,27 @@ class Interceptor:
         log.info("intercepting_action")
 
         # 2. Session limits (zero-latency, before any other rule)
-        # Atomically read stats, check limits, and pre-increment the action counter
-        # under one lock acquisition to eliminate the TOCTOU window that would
-        # otherwise allow concurrent requests to bypass max_actions / max_blocked.
+        # Read stats, check limits, and pre-increment the action counter with no
+        # await in between: on the event loop this block is atomic, so no
+        # concurrent request can interleave and bypass max_actions / max_blocked.
+        # Keep it await-free — an await here would reopen that TOCTOU window.
         session_decision = session_violation = None
-        async with self._stats_lock:
-            stats = self._session_stats[session_id]
-            current_actions = stats["actions"]
-            current_blocked = stats["blocked"]
-            session_context = list(self._session_history[session_id])
-            session_decision, session_violation = self._policy.evaluate_session_limits(
-                current_actions, current_blocked
-            )
-            if session_decision != Decision.BLOCK:
-                # Reserve the slot — no concurrent coroutine can also pass this
-                # limit check for the same session until the lock is released.
-                stats["actions"] += 1
-            # Compute effective thresholds inside the lock so current_blocked
-            # is consistent with the thresholds used for this request.
-            # Moving this outside the lock would create a TOCTOU window where
-            # a concurrent request increments blocked before we apply demotion.
-            risk_threshold, review_threshold = self._policy.effective_thresholds(current_blocked)
-            is_demoted = (
-                self._policy.config.demotion.enabled
-                and current_blocked >= self._policy.config.demotion.trigger_blocked_count
-            )
+        stats = self._session_stats[session_id]
+        current_actions = stats.actions
+        current_blocked = stats.blocked
+        session_context = list(self._session_history[session_id])
+        session_decision, session_violation = self._policy.evaluate_session_limits(
+            current_actions, current_blocked
+        )
+        if session_decision != Decision.BLOCK:
+            # Reserve the slot before any await
+            stats.actions += 1
+        # Thresholds from the same current_blocked snapshot used for the limit check
+        risk_threshold, review_threshold = self._policy.effective_thresholds(current_blocked)
+        is_demoted = (
+            self._policy.config.demotion.enabled
+            and current_blocked >= self._policy.config.demotion.trigger_blocked_count
+        )
         if is_demoted:
             log.warning(
                 "session_demoted",
@@ -280,7 +401,7 @@ class Interceptor:
             )
 
         if session_decision == Decision.BLOCK and session_violation is not None:
-            latency_ms = (time.monotonic() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
             assessment = RiskAssessment(
                 risk_score=1.0,
                 reason=f"Session limit exceeded: {session_violation.detail}",
@@ -301,18 +422,18 @@ class Interceptor:
                 provenance=provenance_tags,
                 framework=framework,
             )
-            asyncio.create_task(self._ledger.append(event))
-            async with self._stats_lock:
-                # Session limit hit: still count both action + blocked.
-                self._session_stats[session_id]["actions"] += 1
-                self._session_stats[session_id]["blocked"] += 1
+            # Session limit hit: still count both action + blocked.
+            stats.actions += 1
+            stats.blocked += 1
+            self.policy_preempted_analyses += 1
             log.warning("action_blocked_session_limit", detail=session_violation.detail)
+            await self._append_logged(event, log)
             return Decision.BLOCK, event
 
         # 3. ABAC — attribute-based access control (e.g. deny_unregistered_tools)
         abac_decision, abac_violation = self._policy.evaluate_abac(action, is_registered)
         if abac_decision == Decision.BLOCK and abac_violation is not None:
-            latency_ms = (time.monotonic() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
             assessment = RiskAssessment(
                 risk_score=1.0,
                 reason=abac_violation.detail,
@@ -333,18 +454,18 @@ class Interceptor:
                 provenance=provenance_tags,
                 framework=framework,
             )
-            asyncio.create_task(self._ledger.append(event))
-            async with self._stats_lock:
-                self._session_stats[session_id]["actions"] += 1
-                self._session_stats[session_id]["blocked"] += 1
+            stats.actions += 1
+            stats.blocked += 1
+            self.policy_preempted_analyses += 1
             log.warning("action_blocked_abac", detail=abac_violation.detail)
+            await self._append_logged(event, log)
             return Decision.BLOCK, event
 
         # 3.5. Provenance check — block actions driven by denied source types
         # (MITRE ATLAS AML.T0054: Prompt Injection via Tool Outputs)
         prov_decision, prov_violation = self._policy.evaluate_provenance(provenance_tags)
         if prov_decision == Decision.BLOCK and prov_violation is not None:
-            latency_ms = (time.monotonic() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
             assessment = RiskAssessment(
                 risk_score=0.90,
                 reason=prov_violation.detail,
@@ -365,10 +486,10 @@ class Interceptor:
                 provenance=provenance_tags,
                 framework=framework,
             )
-            asyncio.create_task(self._ledger.append(event))
-            async with self._stats_lock:
-                self._session_stats[session_id]["blocked"] += 1
+            stats.blocked += 1
+            self.policy_preempted_analyses += 1
             log.warning("action_blocked_provenance", detail=prov_violation.detail)
+            await self._append_logged(event, log)
             return Decision.BLOCK, event
 
         # 4. Deterministic policy enforcement (zero-latency — runs before LLM)
@@ -376,7 +497,7 @@ class Interceptor:
 
         if decision == Decision.BLOCK and violation is not None:
             # Fast-path: blocked by deterministic rule, skip LLM call
-            latency_ms = (time.monotonic() - t_start) * 1000
+            latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
             assessment = RiskAssessment(
                 risk_score=0.95 if action.type == ActionType.CREDENTIAL_ACCESS else 0.80,
                 reason=f"Policy rule '{violation.rule_name}' triggered: {violation.detail}",
@@ -385,13 +506,18 @@ class Interceptor:
                 analyzer_model="policy_engine",
                 latency_ms=latency_ms,
             )
+            self.policy_preempted_analyses += 1
             log.warning(
                 "action_blocked_by_policy",
                 rule=violation.rule_name,
                 detail=violation.detail,
             )
+            log.debug(
+                "analysis_preempted_by_policy",
+                policy_preempted_analyses=self.policy_preempted_analyses,
+            )
         else:
-            # 5. Intent analysis via Claude (session_context already read under lock above)
+            # 5. Intent analysis via Claude (session_context already read with the stats above)
             assessment = await self._analyzer.analyze(action, agent_goal, session_context)
             log = log.bind(risk_score=assessment.risk_score)
 
@@ -409,7 +535,7 @@ class Interceptor:
                     decision = Decision.REVIEW
                     violation = risk_violation
 
-        latency_ms = (time.monotonic() - t_start) * 1000
+        latency_ms = (time.perf_counter_ns() - t_start) / 1_000_000
 
         event = Event(
             session_id=session_id,
@@ -422,46 +548,132 @@ class Interceptor:
             policy_violation=violation,
             provenance=provenance_tags,
             framework=framework,
-            correlation_id=correlation_id or str(uuid.uuid4()),
+            correlation_id=correlation_id or uuid4().hex,
             initiating_principal=initiating_principal,
         )
 
-        # 6. Log to ledger — fire-and-forget, off the critical path
-        asyncio.create_task(self._ledger.append(event))
-
-        # 7. Async enrichment — fire-and-forget, zero latency impact
+        # 6. Update session counters and history
+        # actions counter was pre-incremented atomically in the session limit check.
+        if decision == Decision.BLOCK:
+            stats.blocked += 1
+        history = self._session_history[session_id]
+        history.append({
+            "tool_name": action.tool_name,
+            "action_type": action.type.value,
+            "decision": decision.value,
+        })
+        if len(history) > _SESSION_HISTORY_MAX:
+            self._session_history[session_id] = history[-_SESSION_HISTORY_MAX:]
+
+        # 7. Log to ledger + async enrichment. BLOCK is appended before returning so
+        # the record is durable before the caller acts on it; ALLOW/REVIEW appends
+        # ride the background append queue, ahead of their enrichment.
+        enrich = False
+        publisher: RedisStreamPublisher | None = None
         if decision in (Decision.BLOCK, Decision.REVIEW):
-            publisher = get_stream_publisher()
+            publisher = self._stream_publisher
             if publisher.enabled:
                 # Redis Streams path: durable, survives worker restarts
-                asyncio.create_task(self._publish_to_stream(event, publisher))
-            elif get_enrichment_client().enabled:
-                # Direct async fallback (no Redis): same process, task-based
-                asyncio.create_task(self._enrich_direct(event))
-
-        # 8. Update session counters and history
-        # actions counter was pre-incremented atomically in the session limit check.
-        async with self._stats_lock:
-            if decision == Decision.BLOCK:
-                self._session_stats[session_id]["blocked"] += 1
-            history = self._session_history[session_id]
-            history.append({
-                "tool_name": action.tool_name,
-                "action_type": action.type.value,
-                "decision": decision.value,
-            })
-            if len(history) > _SESSION_HISTORY_MAX:
-                self._session_history[session_id] = history[-_SESSION_HISTORY_MAX:]
+                enrich = True
+            else:
+                # Direct async fallback (no Redis): same process, worker-based
+                publisher = None
+                enrich = self._enrichment_client.enabled
 
         if decision == Decision.BLOCK:
             log.warning("action_blocked", reason=assessment.reason, latency_ms=f"{latency_ms:.1f}ms")
-        elif decision == Decision.REVIEW:
-            log.warning("action_flagged_for_review", reason=assessment.reason)
+            await self._append_logged(event, log)
+            if enrich:
+                self._schedule_background(_BackgroundJob(event, False, True, publisher))
         else:
-            log.info("action_allowed", latency_ms=f"{latency_ms:.1f}ms")
+            if decision == Decision.REVIEW:
+                log.warning("action_flagged_for_review", reason=assessment.reason)
+            else:
+                log.info("action_allowed", latency_ms=f"{latency_ms:.1f}ms")
+            self._schedule_background(_BackgroundJob(event, True, enrich, publisher))
 
         return decision, event
 
+    async def _append_logged(self, event: Event, log: Any = logger) -> None:
+        """Append an event to the ledger; a failure is logged, never raised (a BLOCK stays blocked)."""
+        try:
+            await self._ledger.append(event)
+        except Exception as exc:
+            log.error("ledger_append_failed", event_id=event.event_id, error=str(exc))
+
+    def _schedule_background(self, job: _BackgroundJob) -> None:
+        """
+        Hand a ledger append and/or enrichment to the background workers without
+        blocking the caller.
+
+        Bounded queues drained by fixed worker pools replace one task per
+        event, so a traffic burst cannot pile up unbounded pending tasks.
+        Appends have their own pool and reach enrichment only once written
+        (so taxonomy updates find the row). When the append queue is full the
+        append still runs as a tracked one-off task.
+        """
+        loop = asyncio.get_running_loop()
+        if self._enrich_event_loop is not loop:
+            # First use, or a new event loop (e.g. a fresh asyncio.run) — the old
+            # loop's workers can no longer run, so start pools on this one
+            append_queue: asyncio.Queue[_BackgroundJob] = asyncio.Queue(maxsize=_APPEND_QUEUE_MAX)
+            enrich_queue: asyncio.Queue[_BackgroundJob] = asyncio.Queue(maxsize=_ENRICH_QUEUE_MAX)
+            self._append_queue = append_queue
+            self._enrich_queue = enrich_queue
+            self._append_workers = [
+                loop.create_task(self._append_worker(append_queue)) for _ in range(_APPEND_WORKERS)
+            ]
+            self._enrich_workers = [
+                loop.create_task(self._enrich_worker(enrich_queue)) for _ in range(_ENRICH_WORKERS)
+            ]
+            self._append_tasks = set()
+            self._enrich_event_loop = loop
+        if not job.append:
+            self._enqueue_enrichment(job)
+            return
+        try:
+            self._append_queue.put_nowait(job)  # type: ignore[union-attr]
+        except asyncio.QueueFull:
+            task = loop.create_task(self._append_then_enrich(job))
+            self._append_tasks.add(task)
+            task.add_done_callback(self._append_tasks.discard)
+
+    def _enqueue_enrichment(self, job: _BackgroundJob) -> None:
+        try:
+            self._enrich_queue.put_nowait(job)  # type: ignore[union-attr]
+        except asyncio.QueueFull:
+            logger.warning("enrich_queue_full", event_id=job.event.event_id, maxsize=_ENRICH_QUEUE_MAX)
+
+    async def _append_then_enrich(self, job: _BackgroundJob) -> None:
+        await self._append_logged(job.event)
+        if job.enrich:
+            self._enqueue_enrichment(job)
+
+    async def _append_worker(self, queue: asyncio.Queue[_BackgroundJob]) -> None:
+        """Drain the append queue; each written event is then handed to enrichment."""
+        while True:
+            job = await queue.get()
+            try:
+                await self._append_then_enrich(job)
+            finally:
+                queue.task_done()
+
+    async def _enrich_worker(self, queue: asyncio.Queue[_BackgroundJob]) -> None:
+        """Drain the enrichment queue: publish to Redis or triage in-process."""
+        while True:
+            job = await queue.get()
+            event = job.event
+            try:
+                if job.publisher is not None:
+                    await self._publish_to_stream(event, job.publisher)
+                else:
+                    await self._enrich_direct(event)
+            except Exception as exc:
+                # Both paths log their own failures; never let one event kill the worker
+                logger.warning("enrichment_worker_error", event_id=event.event_id, error=str(exc))
+            finally:
+                queue.task_done()
+
     async def _publish_to_stream(self, event: Event, publisher: Any) -> None:
         """Publish event to Redis Stream for enrichment worker to consume."""
         try:
@@ -482,9 +694,7 @@ class Interceptor:
 
     async def _enrich_direct(self, event: Event) -> None:
         """Fire-and-forget: enrich event directly via Claude (no Redis)."""
-        from agentguard.integrations.insights import get_insights_store
-
-        client = get_enrichment_client()
+        client = self._enrichment_client
         store = get_insights_store()
         payload = {
             "event_id": event.event_id,
@@ -505,8 +715,6 @@ class Interceptor:
                 confidence=insight.confidence,
             )
             if insight.attack_patterns:
-                from agentguard.taxonomy import lookup_by_attack_pattern
-                from agentguard.core.models import AttackTaxonomyAnnotation
                 pattern = insight.attack_patterns[0]
                 mapping = lookup_by_attack_pattern(pattern)
                 annotation = AttackTaxonomyAnnotation(
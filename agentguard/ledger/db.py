@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import uuid
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, ClassVar
 
+import orjson
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
     DateTime,
@@ -14,18 +20,25 @@ from sqlalchemy import (
     Index,
     Integer,
     JSON,
+    SmallInteger,
     String,
     Text,
     TypeDecorator,
+    and_,
+    bindparam,
     case,
-    select,
     func,
+    insert,
+    or_,
+    select,
 )
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import Pool
+from sqlalchemy.sql import Select
 
 
 class _FlexJSON(TypeDecorator):
@@ -65,10 +78,64 @@ class _FlexUUID(TypeDecorator):
             return value
         return uuid.UUID(str(value))
 
+
+# Stable SMALLINT codes for the low-cardinality enum columns. Append-only:
+# existing codes are stored in rows and must never be renumbered.
+_DECISION_CODES: dict[str, int] = {"allow": 0, "block": 1, "review": 2}
+_ACTION_TYPE_CODES: dict[str, int] = {
+    "unknown": 0,
+    "tool_call": 1,
+    "shell_command": 2,
+    "file_read": 3,
+    "file_write": 4,
+    "http_request": 5,
+    "memory_write": 6,
+    "credential_access": 7,
+}
+
+
+class _CodedEnum(TypeDecorator):
+    """
+    Stores a string enum as a SMALLINT code: 2 bytes per tuple and index entry
+    instead of a varlena, and integer compares. Queries keep using the string
+    values (EventRecord.decision == "block"); binds and results are mapped here.
+    """
+    impl = SmallInteger
+    cache_ok = True
+    codes: ClassVar[dict[str, int]] = {}
+    values: ClassVar[dict[int, str]] = {}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        return self.codes[getattr(value, "value", value)]
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        # int(): SQLite dev databases created before the switch declare these
+        # columns VARCHAR, so their (converted) codes come back as text
+        return self.values[int(value)]
+
+
+class _DecisionCode(_CodedEnum):
+    cache_ok = True  # checked per class, not inherited
+    codes: ClassVar[dict[str, int]] = _DECISION_CODES
+    values: ClassVar[dict[int, str]] = {code: name for name, code in _DECISION_CODES.items()}
+
+
+class _ActionTypeCode(_CodedEnum):
+    cache_ok = True  # checked per class, not inherited
+    codes: ClassVar[dict[str, int]] = _ACTION_TYPE_CODES
+    values: ClassVar[dict[int, str]] = {code: name for name, code in _ACTION_TYPE_CODES.items()}
+
 import structlog
 
+from sqlalchemy import event as sa_event
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy import text as sa_text
 
+from agentguard.core.batching import Coalescer
 from agentguard.core.models import (
     Action,
     ActionType,
@@ -81,6 +148,7 @@ from agentguard.core.models import (
     ProvenanceTag,
     RiskAssessment,
     TimelineSummary,
+    uuid7,
 )
 from agentguard.ledger.event_ledger import EventLedger
 
@@ -101,12 +169,20 @@ class SessionRecord(Base):
     updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
     total_events = Column(Integer, nullable=False, default=0)
     blocked_events = Column(Integer, nullable=False, default=0)
+    # With the two counters above, enough for get_stats to aggregate sessions
+    # instead of scanning events
+    reviewed_events = Column(Integer, nullable=False, default=0)
+    risk_sum = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        Index("ix_sessions_updated_at", "updated_at"),
+    )
 
 
 class EventRecord(Base):
     __tablename__ = "events"
 
-    event_id = Column(_FlexUUID, primary_key=True, default=uuid.uuid4)
+    event_id = Column(_FlexUUID, primary_key=True, default=uuid7)
     session_id = Column(String(64), nullable=False)
     agent_id = Column(String(128), nullable=False, default="unknown")
     agent_is_registered = Column(Boolean, nullable=False, default=False)
@@ -114,7 +190,7 @@ class EventRecord(Base):
     framework = Column(String(64), nullable=False, default="unknown")
 
     action_id = Column(String(64), nullable=False)
-    action_type = Column(String(32), nullable=False)
+    action_type = Column(_ActionTypeCode, nullable=False)
     tool_name = Column(String(256), nullable=False)
     parameters = Column(_FlexJSON, nullable=False, default=dict)
     raw_payload = Column(_FlexJSON, nullable=False, default=dict)
@@ -126,7 +202,7 @@ class EventRecord(Base):
     analyzer_model = Column(String(64), nullable=False, default="unknown")
     latency_ms = Column(Float, nullable=False, default=0.0)
 
-    decision = Column(String(16), nullable=False)
+    decision = Column(_DecisionCode, nullable=False)
     policy_rule = Column(String(128), nullable=True)
     policy_detail = Column(Text, nullable=True)
     policy_violation = Column(_FlexJSON, nullable=True)
@@ -138,13 +214,31 @@ class EventRecord(Base):
     created_at = Column(DateTime(timezone=True), nullable=False)
 
     __table_args__ = (
-        Index("ix_events_session_id", "session_id"),
-        Index("ix_events_agent_id", "agent_id"),
+        # Serves session lookups and get_timeline's ORDER BY created_at; the
+        # INCLUDE columns let get_timeline_summary's aggregates run index-only
+        Index(
+            "ix_events_session_created", "session_id", "created_at",
+            postgresql_include=["decision", "risk_score"],
+        ),
+        # Serves the agent-profile aggregates and _agent_details' ORDER BY
+        # created_at DESC LIMIT (a backward range scan, no sort)
+        Index("ix_events_agent_created", "agent_id", "created_at"),
         Index("ix_events_decision", "decision"),
         Index("ix_events_risk_score", "risk_score"),
         Index("ix_events_created_at", "created_at"),
         Index("ix_events_action_type", "action_type"),
         Index("ix_events_session_decision", "session_id", "decision"),
+        # GIN jsonb_path_ops: accelerates @> containment (e.g. indicators @> '["x"]')
+        # at roughly half the size of jsonb_ops; key-exists (?) is not covered.
+        # PostgreSQL only — SQLite stores these columns as plain JSON text.
+        Index(
+            "ix_events_indicators_gin", "indicators",
+            postgresql_using="gin", postgresql_ops={"indicators": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_events_provenance_gin", "provenance",
+            postgresql_using="gin", postgresql_ops={"provenance": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
 
@@ -161,6 +255,279 @@ def _deserialize_provenance(raw: Any) -> list[ProvenanceTag]:
     return []
 
 
+def _event_row(event: Event) -> dict[str, Any]:
+    """Column values for one events-table row."""
+    violation = event.policy_violation
+    return {
+        "event_id": uuid.UUID(event.event_id),
+        "session_id": event.session_id,
+        "agent_id": event.agent_id,
+        "agent_is_registered": event.agent_is_registered,
+        "agent_goal": event.agent_goal,
+        "framework": event.framework,
+        "action_id": event.action.action_id,
+        "action_type": event.action.type.value,
+        "tool_name": event.action.tool_name,
+        "parameters": event.action.parameters,
+        "raw_payload": event.action.raw_payload,
+        "risk_score": event.assessment.risk_score,
+        "reason": event.assessment.reason,
+        "indicators": event.assessment.indicators,
+        "is_goal_aligned": bool(event.assessment.is_goal_aligned),
+        "analyzer_model": event.assessment.analyzer_model,
+        "latency_ms": event.assessment.latency_ms,
+        "decision": event.decision.value,
+        "policy_rule": violation.rule_name if violation else None,
+        "policy_detail": violation.detail if violation else None,
+        "policy_violation": violation.model_dump() if violation else None,
+        "provenance": [t.model_dump() for t in event.provenance],
+        "correlation_id": event.correlation_id,
+        "initiating_principal": event.initiating_principal,
+        "created_at": event.timestamp,
+    }
+
+
+# Fixed-shape statements built once at import. SQLAlchemy caches compiled SQL
+# by statement structure, so per-call select() construction is the only cost
+# these save; filter-dependent queries (list_events) are left dynamic because
+# each filter combination is its own cache entry and keeps a selective plan.
+# A plain SELECT rather than session.get(): no identity-map lookup or
+# refresh, and the statement is compiled once for every event_id
+_GET_EVENT_STMT = select(EventRecord).where(EventRecord.event_id == bindparam("event_id"))
+_TIMELINE_STMT = (
+    select(EventRecord)
+    .where(EventRecord.session_id == bindparam("session_id"))
+    .order_by(EventRecord.created_at.asc())
+)
+
+
+# PostgreSQL keeps the sessions aggregates in step with events server-side: the
+# AFTER INSERT trigger upserts the session row inside the inserting transaction,
+# so append() is one statement. Installed by create_all here and by migration
+# 0007 for Alembic-managed databases; SQLite uses _session_upsert instead.
+_SESSION_COUNTS_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION bump_session_counts() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sessions (session_id, agent_goal, framework, created_at, updated_at,
+                          total_events, blocked_events, reviewed_events, risk_sum)
+    VALUES (NEW.session_id, NEW.agent_goal, NEW.framework, NEW.created_at, NEW.created_at,
+            1, CASE WHEN NEW.decision = {block} THEN 1 ELSE 0 END,
+            CASE WHEN NEW.decision = {review} THEN 1 ELSE 0 END, NEW.risk_score)
+    ON CONFLICT (session_id) DO UPDATE SET
+        updated_at = NEW.created_at,
+        total_events = sessions.total_events + 1,
+        blocked_events = sessions.blocked_events
+            + CASE WHEN NEW.decision = {block} THEN 1 ELSE 0 END,
+        reviewed_events = sessions.reviewed_events
+            + CASE WHEN NEW.decision = {review} THEN 1 ELSE 0 END,
+        risk_sum = sessions.risk_sum + NEW.risk_score;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""".format(block=_DECISION_CODES["block"], review=_DECISION_CODES["review"])
+_SESSION_COUNTS_TRIGGER_SQL = (
+    "CREATE TRIGGER events_bump_session_counts AFTER INSERT ON events "
+    "FOR EACH ROW EXECUTE FUNCTION bump_session_counts()"
+)
+sa_event.listen(
+    EventRecord.__table__, "after_create",
+    DDL(_SESSION_COUNTS_FUNCTION_SQL).execute_if(dialect="postgresql"),
+)
+sa_event.listen(
+    EventRecord.__table__, "after_create",
+    DDL(_SESSION_COUNTS_TRIGGER_SQL).execute_if(dialect="postgresql"),
+)
+
+# Every events column except the two action payload blobs, whose JSON decode
+# dominates row-heavy reads. _record_to_event fills them in as empty dicts.
+_SUMMARY_COLUMNS = tuple(
+    column for column in EventRecord.__table__.c
+    if column.name not in ("parameters", "raw_payload")
+)
+
+
+# Built once; rows are bound as execute() parameters, so single and batched
+# appends share one compiled statement (and one asyncpg prepared statement)
+_INSERT_EVENT_STMT = insert(EventRecord.__table__)
+
+# Upper bound on events coalesced into one group-commit transaction
+_APPEND_BATCH_MAX = 100
+# Most recent events per agent read for tools_used / attack_patterns / risk_trend
+_AGENT_DETAIL_EVENTS = 100
+
+
+def _session_upsert(events: list[Event]) -> Any:
+    """
+    Client-side maintenance of the sessions rows for a batch of events (SQLite).
+
+    Groups events per session_id and issues one atomic INSERT ... ON CONFLICT
+    that adds the batch counts to the stored counters — no read-then-write
+    race when concurrent requests share a session_id.
+    """
+    sessions: dict[str, dict[str, Any]] = {}
+    for event in events:
+        blocked = 1 if event.decision == Decision.BLOCK else 0
+        reviewed = 1 if event.decision == Decision.REVIEW else 0
+        row = sessions.get(event.session_id)
+        if row is None:
+            sessions[event.session_id] = {
+                "session_id": event.session_id,
+                "agent_goal": event.agent_goal,
+                "framework": event.framework,
+                "created_at": event.timestamp,
+                "updated_at": event.timestamp,
+                "total_events": 1,
+                "blocked_events": blocked,
+                "reviewed_events": reviewed,
+                "risk_sum": event.assessment.risk_score,
+            }
+        else:
+            row["created_at"] = min(row["created_at"], event.timestamp)
+            row["updated_at"] = max(row["updated_at"], event.timestamp)
+            row["total_events"] += 1
+            row["blocked_events"] += blocked
+            row["reviewed_events"] += reviewed
+            row["risk_sum"] += event.assessment.risk_score
+    stmt = sqlite_insert(SessionRecord).values(list(sessions.values()))
+    return stmt.on_conflict_do_update(
+        index_elements=["session_id"],
+        set_={
+            "updated_at": stmt.excluded.updated_at,
+            "total_events": SessionRecord.total_events + stmt.excluded.total_events,
+            "blocked_events": SessionRecord.blocked_events + stmt.excluded.blocked_events,
+            "reviewed_events": SessionRecord.reviewed_events + stmt.excluded.reviewed_events,
+            "risk_sum": SessionRecord.risk_sum + stmt.excluded.risk_sum,
+        },
+    )
+
+
+@lru_cache(maxsize=256)
+def _list_events_stmt(
+    session_id: bool,
+    decision: bool,
+    min_risk: bool,
+    max_risk: bool,
+    since: bool,
+    until: bool,
+    cursor: int,
+    include_payload: bool,
+) -> Select:
+    """
+    list_events statement for one combination of active filters.
+
+    Each flag adds its WHERE clause with a bindparam, so a shape is built once
+    and every later call only binds values. cursor: 0 = none, 1 = before,
+    2 = before + before_id (keyset seek past the previous page's last row).
+    """
+    query = select(EventRecord) if include_payload else select(*_SUMMARY_COLUMNS)
+    if session_id:
+        query = query.where(EventRecord.session_id == bindparam("session_id"))
+    if decision:
+        query = query.where(EventRecord.decision == bindparam("decision"))
+    if min_risk:
+        query = query.where(EventRecord.risk_score >= bindparam("min_risk"))
+    if max_risk:
+        query = query.where(EventRecord.risk_score <= bindparam("max_risk"))
+    if since:
+        query = query.where(EventRecord.created_at >= bindparam("since"))
+    if until:
+        query = query.where(EventRecord.created_at <= bindparam("until"))
+    if cursor == 2:
+        query = query.where(or_(
+            EventRecord.created_at < bindparam("before"),
+            and_(
+                EventRecord.created_at == bindparam("before"),
+                EventRecord.event_id < bindparam("before_id"),
+            ),
+        ))
+    elif cursor == 1:
+        query = query.where(EventRecord.created_at < bindparam("before"))
+    return (
+        query.order_by(EventRecord.created_at.desc(), EventRecord.event_id.desc())
+        .offset(bindparam("offset", type_=Integer))
+        .limit(bindparam("limit", type_=Integer))
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive filter datetimes (e.g. from query strings) as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _upgrade_sqlite_schema(conn: Connection) -> None:
+    """
+    Bring a SQLite dev database created by an older build up to date.
+
+    create_all never alters existing tables; PostgreSQL gets these changes
+    from the Alembic migrations (0008 for the enum codes, 0010 for the
+    session rollups).
+    """
+    # Enum columns stored as text before they became SMALLINT codes —
+    # filters and aggregates bind the codes, so unconverted rows would
+    # silently drop out of every query
+    for column, codes in (("decision", _DECISION_CODES), ("action_type", _ACTION_TYPE_CODES)):
+        whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+        conn.exec_driver_sql(
+            f"UPDATE events SET {column} = CASE {column} {whens} END "
+            f"WHERE {column} IN ({', '.join(repr(name) for name in codes)})"
+        )
+
+    session_columns = {c["name"] for c in sa_inspect(conn).get_columns("sessions")}
+    added = False
+    for column, ddl in (("reviewed_events", "INTEGER"), ("risk_sum", "FLOAT")):
+        if column not in session_columns:
+            conn.exec_driver_sql(f"ALTER TABLE sessions ADD COLUMN {column} {ddl} NOT NULL DEFAULT 0")
+            added = True
+    if added:
+        # Recompute every rollup from events, as migration 0010 does
+        conn.exec_driver_sql(f"""
+            UPDATE sessions SET
+                total_events = (SELECT COUNT(*) FROM events e
+                                WHERE e.session_id = sessions.session_id),
+                blocked_events = (SELECT COUNT(*) FROM events e
+                                  WHERE e.session_id = sessions.session_id
+                                  AND e.decision = {_DECISION_CODES["block"]}),
+                reviewed_events = (SELECT COUNT(*) FROM events e
+                                   WHERE e.session_id = sessions.session_id
+                                   AND e.decision = {_DECISION_CODES["review"]}),
+                risk_sum = (SELECT COALESCE(SUM(risk_score), 0) FROM events e
+                            WHERE e.session_id = sessions.session_id)
+        """)
+
+
+def _json_dumps(value: Any) -> str:
+    """JSON/JSONB column encoder — orjson fast path, stdlib json fallback."""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except (orjson.JSONEncodeError, TypeError):
+        # orjson rejects integers beyond 64 bits, which _loads_tool_args lets
+        # through from (attacker-controlled) tool arguments; the event must
+        # still reach the ledger
+        return json.dumps(value)
+
+
+def _json_loads(raw: str | bytes) -> Any:
+    """JSON/JSONB column decoder — orjson fast path, stdlib json fallback."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
+def _async_database_url(database_url: str) -> str:
+    """
+    Pin bare PostgreSQL URLs to the asyncpg driver.
+
+    postgresql:// (or the legacy postgres:// scheme) resolves to psycopg2,
+    which create_async_engine cannot drive; asyncpg speaks the binary
+    protocol natively. URLs that already name a driver are left alone.
+    """
+    for scheme in ("postgresql://", "postgres://"):
+        if database_url.startswith(scheme):
+            return "postgresql+asyncpg://" + database_url[len(scheme):]
+    return database_url
+
+
 class PostgresEventLedger(EventLedger):
     """
     SQL-backed event ledger supporting PostgreSQL and SQLite.
@@ -169,91 +536,137 @@ class PostgresEventLedger(EventLedger):
     SQLite (local dev):       DATABASE_URL=sqlite+aiosqlite:///./agentguard.db
     """
 
-    def __init__(self, database_url: str) -> None:
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+        pool_recycle: int = 1800,
+        statement_cache_size: int = 1024,
+        poolclass: type[Pool] | None = None,
+        batch_window_ms: float = 0.0,
+    ) -> None:
+        """
+        pool_size / max_overflow size the connection pool; pass
+        poolclass=NullPool behind PgBouncer in transaction-pooling mode (and
+        statement_cache_size=0, since prepared statements do not survive
+        connection hand-off there). statement_cache_size sizes asyncpg's
+        per-connection prepared-statement caches, so repeated appends and
+        reads skip the server-side parse.
+
+        batch_window_ms > 0 turns on group commit: concurrent append() calls
+        arriving within the window share one append_many() transaction. Each
+        caller still returns only once its event is committed.
+        """
+        database_url = _async_database_url(database_url)
         self._is_sqlite = database_url.startswith("sqlite")
+        # orjson for the JSON/JSONB columns (parameters, raw_payload,
+        # indicators, provenance); on asyncpg it plugs into the dialect's
+        # binary jsonb codec.
+        json_kwargs = {"json_serializer": _json_dumps, "json_deserializer": _json_loads}
         if self._is_sqlite:
             # SQLite doesn't support connection pooling parameters
-            self._engine = create_async_engine(database_url, echo=False)
+            self._engine = create_async_engine(database_url, echo=False, **json_kwargs)
         else:
-            self._engine = create_async_engine(
-                database_url,
-                echo=False,
-                pool_size=10,
-                max_overflow=20,
-                pool_timeout=30,
-                pool_pre_ping=True,
-                pool_recycle=3600,
-            )
+            engine_kwargs: dict[str, Any] = {
+                "echo": False,
+                **json_kwargs,
+                "pool_pre_ping": True,
+                "pool_recycle": pool_recycle,
+            }
+            if poolclass is not None:
+                engine_kwargs["poolclass"] = poolclass
+            else:
+                engine_kwargs.update(pool_size=pool_size, max_overflow=max_overflow, pool_timeout=30)
+            if database_url.startswith("postgresql+asyncpg"):
+                engine_kwargs["connect_args"] = {
+                    "prepared_statement_cache_size": statement_cache_size,
+                    "statement_cache_size": statement_cache_size,
+                    # Ledger queries are short index lookups; JIT compilation
+                    # costs more than it saves on them.
+                    "server_settings": {"jit": "off"},
+                }
+            self._engine = create_async_engine(database_url, **engine_kwargs)
+        # Sessions only read or run Core UPDATEs (appends use bare connections),
+        # so there is never pending ORM state to autoflush before a query
         self._sessionmaker = async_sessionmaker(
-            self._engine, class_=AsyncSession, expire_on_commit=False
+            self._engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
+        )
+        self._batch_window = batch_window_ms / 1000
+        self._batcher: Coalescer[tuple[Event, asyncio.Future[None]]] = Coalescer(
+            self._flush, self._batch_window, _APPEND_BATCH_MAX
         )
 
     async def create_tables(self) -> None:
         """Create all tables if they don't exist. Used for SQLite local dev."""
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            if self._is_sqlite:
+                await conn.run_sync(_upgrade_sqlite_schema)
 
     async def close(self) -> None:
+        """Commit any events still waiting for (or in) a batch, then dispose of the pool."""
+        await self._batcher.drain()
         await self._engine.dispose()
 
     async def append(self, event: Event) -> None:
-        record = EventRecord(
-            event_id=uuid.UUID(event.event_id),
-            session_id=event.session_id,
-            agent_id=event.agent_id,
-            agent_is_registered=event.agent_is_registered,
-            agent_goal=event.agent_goal,
-            framework=event.framework,
-            action_id=event.action.action_id,
-            action_type=event.action.type.value,
-            tool_name=event.action.tool_name,
-            parameters=event.action.parameters,
-            raw_payload=event.action.raw_payload,
-            risk_score=event.assessment.risk_score,
-            reason=event.assessment.reason,
-            indicators=event.assessment.indicators,
-            is_goal_aligned=bool(event.assessment.is_goal_aligned),
-            analyzer_model=event.assessment.analyzer_model,
-            latency_ms=event.assessment.latency_ms,
-            decision=event.decision.value,
-            policy_rule=event.policy_violation.rule_name if event.policy_violation else None,
-            policy_detail=event.policy_violation.detail if event.policy_violation else None,
-            policy_violation=event.policy_violation.model_dump() if event.policy_violation else None,
-            provenance=[t.model_dump() for t in event.provenance],
-            correlation_id=event.correlation_id,
-            initiating_principal=event.initiating_principal,
-            created_at=event.timestamp,
-        )
-        async with self._sessionmaker() as session:
-            session.add(record)
-            # Atomic upsert for the session row — eliminates the Python-level
-            # read-then-write race when concurrent requests share a session_id.
-            _insert = sqlite_insert if self._is_sqlite else pg_insert
-            upsert_stmt = _insert(SessionRecord).values(
-                session_id=event.session_id,
-                agent_goal=event.agent_goal,
-                framework=event.framework,
-                created_at=event.timestamp,
-                updated_at=event.timestamp,
-                total_events=1,
-                blocked_events=1 if event.decision == Decision.BLOCK else 0,
-            ).on_conflict_do_update(
-                index_elements=["session_id"],
-                set_={
-                    "updated_at": event.timestamp,
-                    "total_events": SessionRecord.total_events + 1,
-                    "blocked_events": SessionRecord.blocked_events + (
-                        1 if event.decision == Decision.BLOCK else 0
-                    ),
-                },
-            )
-            await session.execute(upsert_stmt)
-            await session.commit()
+        if self._batch_window <= 0:
+            await self._append_one(event)
+            return
+        # Group commit: queue the event and wait for the batch it lands in.
+        # The first event in an empty queue schedules a flush after the window;
+        # a full queue (_APPEND_BATCH_MAX) is flushed immediately.
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._batcher.add((event, future))
+        await future
+
+    async def _flush(self, batch: list[tuple[Event, asyncio.Future[None]]]) -> None:
+        """Commit one batch and resolve each waiting caller."""
+        try:
+            await self.append_many([event for event, _ in batch])
+        except Exception as exc:
+            # One bad row must not fail its neighbours: retry individually so
+            # each caller gets its own outcome.
+            logger.warning("ledger_batch_failed", size=len(batch), error=str(exc))
+            for event, future in batch:
+                try:
+                    await self._append_one(event)
+                except Exception as row_exc:
+                    if not future.done():
+                        future.set_exception(row_exc)
+                else:
+                    if not future.done():
+                        future.set_result(None)
+            return
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def _append_one(self, event: Event) -> None:
+        # Core INSERT on a bare connection: no ORM session, identity map or
+        # unit-of-work for a write-only path. On PostgreSQL the bump_session_counts
+        # trigger maintains the sessions row in the same transaction.
+        async with self._engine.begin() as conn:
+            await conn.execute(_INSERT_EVENT_STMT, _event_row(event))
+            if self._is_sqlite:
+                await conn.execute(_session_upsert([event]))
         logger.debug("event_persisted", event_id=str(event.event_id), agent_id=event.agent_id)
 
+    async def append_many(self, events: list[Event]) -> None:
+        """Persist a batch of events in one multi-row INSERT (plus, on SQLite, one session upsert)."""
+        if not events:
+            return
+        async with self._engine.begin() as conn:
+            # A list of parameter dicts runs as executemany on the driver
+            await conn.execute(_INSERT_EVENT_STMT, [_event_row(e) for e in events])
+            if self._is_sqlite:
+                await conn.execute(_session_upsert(events))
+        logger.debug("events_persisted", count=len(events))
+
     async def get_event(self, event_id: str) -> Event | None:
         async with self._sessionmaker() as session:
-            record = await session.get(EventRecord, uuid.UUID(event_id))
+            result = await session.execute(_GET_EVENT_STMT, {"event_id": uuid.UUID(event_id)})
+            record = result.scalar_one_or_none()
             return self._record_to_event(record) if record else None
 
     async def list_events(
@@ -266,36 +679,53 @@ class PostgresEventLedger(EventLedger):
         until: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
+        include_payload: bool = True,
+        before: datetime | None = None,
+        before_id: str | None = None,
     ) -> list[Event]:
-        query = select(EventRecord)
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
         if session_id:
-            query = query.where(EventRecord.session_id == session_id)
+            params["session_id"] = session_id
         if decision:
-            query = query.where(EventRecord.decision == decision.value)
+            params["decision"] = decision.value
         if min_risk is not None:
-            query = query.where(EventRecord.risk_score >= min_risk)
+            params["min_risk"] = min_risk
         if max_risk is not None:
-            query = query.where(EventRecord.risk_score <= max_risk)
+            params["max_risk"] = max_risk
         if since:
-            since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
-            query = query.where(EventRecord.created_at >= since_aware)
+            params["since"] = _as_utc(since)
         if until:
-            until_aware = until if until.tzinfo else until.replace(tzinfo=timezone.utc)
-            query = query.where(EventRecord.created_at <= until_aware)
-        query = query.order_by(EventRecord.created_at.desc()).offset(offset).limit(limit)
+            params["until"] = _as_utc(until)
+        cursor = 0
+        if before:
+            params["before"] = _as_utc(before)
+            cursor = 1
+            if before_id:
+                params["before_id"] = before_id
+                cursor = 2
+        query = _list_events_stmt(
+            "session_id" in params, "decision" in params, "min_risk" in params,
+            "max_risk" in params, "since" in params, "until" in params, cursor, include_payload,
+        )
         async with self._sessionmaker() as session:
-            result = await session.execute(query)
-            return [self._record_to_event(r) for r in result.scalars()]
+            result = await session.execute(query, params)
+            rows = result.scalars() if include_payload else result
+            return [self._record_to_event(r) for r in rows]
 
     async def get_timeline(self, session_id: str) -> list[Event]:
-        query = (
-            select(EventRecord)
-            .where(EventRecord.session_id == session_id)
-            .order_by(EventRecord.created_at.asc())
-        )
+        return [event async for event in self.stream_timeline(session_id)]
+
+    async def stream_timeline(self, session_id: str) -> AsyncIterator[Event]:
+        """
+        Yield a session's events in order as rows arrive from the database.
+
+        Uses a server-side cursor, so a long session is never buffered as a
+        full result set before conversion starts.
+        """
         async with self._sessionmaker() as session:
-            result = await session.execute(query)
-            return [self._record_to_event(r) for r in result.scalars()]
+            result = await session.stream_scalars(_TIMELINE_STMT, {"session_id": session_id})
+            async for record in result:
+                yield self._record_to_event(record)
 
     async def list_sessions(self) -> list[str]:
         # Order by most blocked events first so attack sessions appear at the top of the
@@ -309,49 +739,60 @@ class PostgresEventLedger(EventLedger):
             return [row[0] for row in result]
 
     async def get_timeline_summary(self, session_id: str) -> TimelineSummary | None:
-        events = await self.get_timeline(session_id)
-        if not events:
-            return None
-        blocked = [e for e in events if e.decision == Decision.BLOCK]
-        reviewed = [e for e in events if e.decision == Decision.REVIEW]
-        allowed = [e for e in events if e.decision == Decision.ALLOW]
-        risk_scores = [e.assessment.risk_score for e in events]
-        attack_vectors = list({ind for e in blocked for ind in e.assessment.indicators})
+        # Aggregate server-side; only the indicators of blocked events come back as rows
+        query = select(
+            func.count().label("total"),
+            func.sum(case((EventRecord.decision == "block", 1), else_=0)).label("blocked"),
+            func.sum(case((EventRecord.decision == "review", 1), else_=0)).label("reviewed"),
+            func.sum(case((EventRecord.decision == "allow", 1), else_=0)).label("allowed"),
+            func.max(EventRecord.risk_score).label("max_risk"),
+            func.avg(EventRecord.risk_score).label("avg_risk"),
+            func.min(EventRecord.created_at).label("start_time"),
+            func.max(EventRecord.created_at).label("end_time"),
+        ).where(EventRecord.session_id == session_id)
+        vectors_query = select(EventRecord.indicators).where(
+            EventRecord.session_id == session_id, EventRecord.decision == "block"
+        )
+        async with self._sessionmaker() as session:
+            row = (await session.execute(query)).one()
+            if not row.total:
+                return None
+            indicator_lists = (await session.scalars(vectors_query)).all()
         return TimelineSummary(
             session_id=session_id,
-            total_events=len(events),
-            blocked_events=len(blocked),
-            reviewed_events=len(reviewed),
-            allowed_events=len(allowed),
-            max_risk_score=max(risk_scores),
-            avg_risk_score=sum(risk_scores) / len(risk_scores),
-            start_time=events[0].timestamp,
-            end_time=events[-1].timestamp,
-            attack_vectors=attack_vectors,
+            total_events=row.total,
+            blocked_events=row.blocked or 0,
+            reviewed_events=row.reviewed or 0,
+            allowed_events=row.allowed or 0,
+            max_risk_score=float(row.max_risk),
+            avg_risk_score=float(row.avg_risk),
+            start_time=row.start_time,
+            end_time=row.end_time,
+            attack_vectors=list({ind for inds in indicator_lists for ind in (inds or [])}),
         )
 
     async def get_stats(self) -> dict[str, Any]:
+        # Sum the per-session rollups (kept current on every append) — one
+        # row per session rather than a scan of every event
+        query = select(
+            func.sum(SessionRecord.total_events).label("total"),
+            func.sum(SessionRecord.blocked_events).label("blocked"),
+            func.sum(SessionRecord.reviewed_events).label("reviewed"),
+            func.count().label("sessions"),
+            func.sum(SessionRecord.risk_sum).label("risk_sum"),
+        )
         async with self._sessionmaker() as session:
-            total = await session.scalar(select(func.count(EventRecord.event_id)))
-            if not total:
-                return {"total_events": 0, "blocked_events": 0, "reviewed_events": 0,
-                        "allowed_events": 0, "active_sessions": 0, "avg_risk_score": 0.0}
-            blocked = await session.scalar(
-                select(func.count(EventRecord.event_id)).where(EventRecord.decision == "block"))
-            reviewed = await session.scalar(
-                select(func.count(EventRecord.event_id)).where(EventRecord.decision == "review"))
-            allowed = await session.scalar(
-                select(func.count(EventRecord.event_id)).where(EventRecord.decision == "allow"))
-            sessions_count = await session.scalar(
-                select(func.count(func.distinct(EventRecord.session_id))))
-            avg_risk = await session.scalar(select(func.avg(EventRecord.risk_score)))
+            row = (await session.execute(query)).one()
+        total = row.total or 0
+        blocked = row.blocked or 0
+        reviewed = row.reviewed or 0
         return {
-            "total_events": total or 0,
-            "blocked_events": blocked or 0,
-            "reviewed_events": reviewed or 0,
-            "allowed_events": allowed or 0,
-            "active_sessions": sessions_count or 0,
-            "avg_risk_score": float(avg_risk or 0.0),
+            "total_events": total,
+            "blocked_events": blocked,
+            "reviewed_events": reviewed,
+            "allowed_events": total - blocked - reviewed,
+            "active_sessions": row.sessions,
+            "avg_risk_score": float(row.risk_sum / total) if total else 0.0,
         }
 
     async def list_agents(self) -> list[AgentProfile]:
@@ -381,10 +822,11 @@ class PostgresEventLedger(EventLedger):
             .order_by(func.max(EventRecord.created_at).desc())
         )
         async with self._sessionmaker() as session:
-            result = await session.execute(query)
+            rows = (await session.execute(query)).all()
+            details = await self._all_agent_details(session)
             profiles = []
-            for row in result:
-                tools, patterns, trend = await self._agent_details(session, row.agent_id)
+            for row in rows:
+                tools, patterns, trend = details.get(row.agent_id, ([], [], []))
                 profiles.append(AgentProfile(
                     agent_id=row.agent_id,
                     agent_goal=row.agent_goal,
@@ -453,15 +895,23 @@ class PostgresEventLedger(EventLedger):
 
     async def get_agent_graph(self, agent_id: str) -> AgentGraphData:
         """Build graph nodes and edges for the knowledge graph visualization."""
+        # Only the columns the graph draws — no parameters/raw_payload decode
         query = (
-            select(EventRecord)
+            select(
+                EventRecord.session_id,
+                EventRecord.tool_name,
+                EventRecord.indicators,
+                EventRecord.decision,
+                EventRecord.risk_score,
+                EventRecord.created_at,
+            )
             .where(EventRecord.agent_id == agent_id)
             .order_by(EventRecord.created_at.asc())
             .limit(500)
         )
         async with self._sessionmaker() as session:
             result = await session.execute(query)
-            agent_events = [self._record_to_event(r) for r in result.scalars()]
+            agent_events = result.all()
         if not agent_events:
             return AgentGraphData(nodes=[], edges=[])
 
@@ -491,25 +941,26 @@ class PostgresEventLedger(EventLedger):
                     "id": session_node_id, "type": "session",
                     "label": event.session_id[:16],
                     "session_id": event.session_id,
-                    "timestamp": event.timestamp.isoformat(),
+                    "timestamp": event.created_at.isoformat(),
                 }
                 edges.append({"source": agent_node_id, "target": session_node_id, "type": "had_session"})
 
-            tool_node_id = f"tool:{event.action.tool_name}"
-            if event.action.tool_name not in tools_seen:
-                tools_seen.add(event.action.tool_name)
+            decision = Decision(event.decision).value
+            tool_node_id = f"tool:{event.tool_name}"
+            if event.tool_name not in tools_seen:
+                tools_seen.add(event.tool_name)
                 nodes[tool_node_id] = {
                     "id": tool_node_id, "type": "tool",
-                    "label": event.action.tool_name,
-                    "decision": event.decision.value,
+                    "label": event.tool_name,
+                    "decision": decision,
                 }
             edges.append({
                 "source": session_node_id, "target": tool_node_id,
-                "type": "used_tool", "decision": event.decision.value,
-                "risk_score": event.assessment.risk_score,
+                "type": "used_tool", "decision": decision,
+                "risk_score": float(event.risk_score),
             })
 
-            for indicator in event.assessment.indicators:
+            for indicator in event.indicators or []:
                 pattern_node_id = f"pattern:{indicator}"
                 if indicator not in patterns_seen:
                     patterns_seen.add(indicator)
@@ -562,10 +1013,41 @@ class PostgresEventLedger(EventLedger):
         result = await session.execute(
             select(EventRecord.tool_name, EventRecord.indicators, EventRecord.risk_score)
             .where(EventRecord.agent_id == agent_id)
-            .order_by(EventRecord.created_at.desc())
-            .limit(100)
+            .order_by(EventRecord.created_at.desc(), EventRecord.event_id.desc())
+            .limit(_AGENT_DETAIL_EVENTS)
+        )
+        return self._details_from_rows(result.all())
+
+    async def _all_agent_details(
+        self, session: AsyncSession
+    ) -> dict[str, tuple[list[str], list[str], list[float]]]:
+        """
+        _agent_details for every agent in one query — each agent's latest
+        events picked by ROW_NUMBER() instead of one LIMIT query per agent.
+        """
+        recent = select(
+            EventRecord.agent_id,
+            EventRecord.tool_name,
+            EventRecord.indicators,
+            EventRecord.risk_score,
+            func.row_number().over(
+                partition_by=EventRecord.agent_id,
+                order_by=(EventRecord.created_at.desc(), EventRecord.event_id.desc()),
+            ).label("rn"),
+        ).subquery()
+        result = await session.execute(
+            select(recent.c.agent_id, recent.c.tool_name, recent.c.indicators, recent.c.risk_score)
+            .where(recent.c.rn <= _AGENT_DETAIL_EVENTS)
+            .order_by(recent.c.agent_id, recent.c.rn)
         )
-        rows = result.all()
+        by_agent: dict[str, list[Any]] = {}
+        for r in result:
+            by_agent.setdefault(r.agent_id, []).append(r)
+        return {agent_id: self._details_from_rows(rows) for agent_id, rows in by_agent.items()}
+
+    @staticmethod
+    def _details_from_rows(rows: list[Any]) -> tuple[list[str], list[str], list[float]]:
+        """Reduce an agent's events (newest first) to tools, patterns and risk trend."""
         tools = list(dict.fromkeys(r.tool_name for r in rows))[:20]
         patterns: list[str] = []
         for r in rows:
@@ -596,27 +1078,32 @@ class PostgresEventLedger(EventLedger):
             else None
         )
 
-        return Event(
+        # Rows were validated on write; model_construct skips re-validation of
+        # the three per-row models. Enums and ids are coerced explicitly here;
+        # Boolean columns already come back as bool from asyncpg and SQLAlchemy's
+        # SQLite result processor.
+        return Event.model_construct(
             event_id=str(record.event_id),
             session_id=record.session_id,
             agent_id=record.agent_id,
-            agent_is_registered=bool(record.agent_is_registered),
+            agent_is_registered=record.agent_is_registered,
             agent_goal=record.agent_goal,
             framework=record.framework,
-            action=Action(
+            action=Action.model_construct(
                 action_id=record.action_id,
                 type=ActionType(record.action_type),
                 tool_name=record.tool_name,
-                parameters=record.parameters or {},
-                raw_payload=record.raw_payload or {},
+                # Absent on rows selected with _SUMMARY_COLUMNS
+                parameters=getattr(record, "parameters", None) or {},
+                raw_payload=getattr(record, "raw_payload", None) or {},
             ),
-            assessment=RiskAssessment(
-                risk_score=record.risk_score,
+            assessment=RiskAssessment.model_construct(
+                risk_score=float(record.risk_score),
                 reason=record.reason,
                 indicators=record.indicators or [],
-                is_goal_aligned=bool(record.is_goal_aligned),
+                is_goal_aligned=record.is_goal_aligned,
                 analyzer_model=record.analyzer_model,
-                latency_ms=record.latency_ms,
+                latency_ms=float(record.latency_ms),
                 attack_taxonomy=attack_taxonomy,
             ),
             decision=Decision(record.decision),
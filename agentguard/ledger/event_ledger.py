@@ -5,7 +5,7 @@ from __future__ import annotations
 import abc
 import asyncio
 from collections import defaultdict
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from typing import Any
 
 import structlog
@@ -22,6 +22,11 @@ class EventLedger(abc.ABC):
     async def append(self, event: Event) -> None:
         """Persist a new event."""
 
+    async def append_many(self, events: list[Event]) -> None:
+        """Persist a batch of events. Backends override this with a bulk write."""
+        for event in events:
+            await self.append(event)
+
     @abc.abstractmethod
     async def get_event(self, event_id: str) -> Event | None:
         """Retrieve a single event by ID."""
@@ -37,8 +42,20 @@ class EventLedger(abc.ABC):
         until: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
+        include_payload: bool = True,
+        before: datetime | None = None,
+        before_id: str | None = None,
     ) -> list[Event]:
-        """List events with optional filters."""
+        """
+        List events with optional filters.
+
+        include_payload=False lets a backend skip loading action.parameters and
+        action.raw_payload (they come back empty) for summary listings.
+
+        Keyset pagination: pass the last event's (timestamp, event_id) of the
+        previous page as (before, before_id) to get the next page; unlike
+        offset, cost does not grow with page depth.
+        """
 
     @abc.abstractmethod
     async def get_timeline(self, session_id: str) -> list[Event]:
@@ -118,6 +135,9 @@ class InMemoryEventLedger(EventLedger):
         until: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
+        include_payload: bool = True,
+        before: datetime | None = None,
+        before_id: str | None = None,
     ) -> list[Event]:
         async with self._lock:
             events = list(self._events.values())
@@ -131,13 +151,20 @@ class InMemoryEventLedger(EventLedger):
         if max_risk is not None:
             events = [e for e in events if e.assessment.risk_score <= max_risk]
         if since:
-            since_aware = since if since.tzinfo else since.replace(tzinfo=timezone.utc)
+            since_aware = since if since.tzinfo else since.replace(tzinfo=UTC)
             events = [e for e in events if e.timestamp >= since_aware]
         if until:
-            until_aware = until if until.tzinfo else until.replace(tzinfo=timezone.utc)
+            until_aware = until if until.tzinfo else until.replace(tzinfo=UTC)
             events = [e for e in events if e.timestamp <= until_aware]
+        if before:
+            before_aware = before if before.tzinfo else before.replace(tzinfo=UTC)
+            events = [
+                e for e in events
+                if e.timestamp < before_aware
+                or (before_id and e.timestamp == before_aware and e.event_id < before_id)
+            ]
 
-        events.sort(key=lambda e: e.timestamp, reverse=True)
+        events.sort(key=lambda e: (e.timestamp, e.event_id), reverse=True)
         return events[offset : offset + limit]
 
     async def get_timeline(self, session_id: str) -> list[Event]:
@@ -57,7 +57,14 @@ def get_proxy_interceptor() -> Any:
 
     backend = create_backend()
     hedge_after = float(os.getenv("AGENTGUARD_HEDGE_AFTER", "1.0"))
-    analyzer = IntentAnalyzer(backend=backend, hedge_after=hedge_after)
+    batch_window_ms = float(os.getenv("AGENTGUARD_BATCH_WINDOW_MS", "0"))
+    safe_tools = [t.strip() for t in os.getenv("AGENTGUARD_SAFE_TOOLS", "").split(",") if t.strip()]
+    analyzer = IntentAnalyzer(
+        backend=backend,
+        hedge_after=hedge_after,
+        batch_window_ms=batch_window_ms,
+        safe_tools=safe_tools,
+    )
     policy_engine = PolicyEngine.from_yaml(policy_file)
 
     # Use PostgresEventLedger when DATABASE_URL is configured so proxy events
@@ -117,7 +124,7 @@ def extract_request_context(request: Request, config: ProxyConfig) -> ProxyReque
     auth_hash = hashlib.sha256(auth.encode()).hexdigest()[:16] if auth else ""
 
     if not session_id:
-        session_id = f"proxy-{auth_hash}" if auth_hash else str(uuid.uuid4())
+        session_id = f"proxy-{auth_hash}" if auth_hash else uuid.uuid4().hex
 
     if not agent_id:
         agent_id = f"proxy-agent-{session_id[:8]}"
@@ -126,7 +133,7 @@ def extract_request_context(request: Request, config: ProxyConfig) -> ProxyReque
         goal = "LLM API Proxy Agent"
 
     # X-Request-ID set by RequestIDMiddleware before this runs
-    correlation_id = getattr(getattr(request, "state", None), "request_id", "") or str(uuid.uuid4())
+    correlation_id = getattr(getattr(request, "state", None), "request_id", "") or uuid.uuid4().hex
 
     return ProxyRequestContext(
         agent_goal=goal,
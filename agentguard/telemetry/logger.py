@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from contextvars import ContextVar
 from typing import Any
 
+import orjson
 import structlog
 
 request_id_ctx_var: ContextVar[str] = ContextVar("request_id", default="-")
 
+# Background thread that performs the actual stream writes (see configure_logging)
+_listener: logging.handlers.QueueListener | None = None
+# Set after the first successful configure_logging(); later calls are no-ops unless forced
+_configured = False
+
 
 def _inject_request_id(
     logger: Any, method: str, event_dict: dict[str, Any]
@@ -20,8 +30,38 @@ def _inject_request_id(
     return event_dict
 
 
-def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
-    """Configure structlog for JSON output with stdlib integration."""
+def _encode_rendered(logger: Any, method: str, rendered: str) -> bytes:
+    """Final processor for BytesLogger behind a str renderer (ConsoleRenderer)."""
+    return rendered.encode()
+
+
+def configure_logging(
+    log_level: str = "INFO",
+    json_logs: bool = True,
+    logger_factory: Any | None = None,
+    force: bool = False,
+) -> None:
+    """
+    Configure structlog for JSON output with stdlib integration.
+
+    Hot-path friendly:
+      - make_filtering_bound_logger drops calls below log_level before any
+        processor runs, so debug lines on the intercept path cost ~nothing.
+      - Records are rendered in the caller but written by a QueueListener
+        thread, so request handling never blocks on stdout.
+
+    Runs once per process: repeat calls return immediately unless force=True,
+    and AGENTGUARD_SKIP_LOGGING_CONFIG=1 leaves logging entirely to the host app.
+
+    logger_factory replaces the stdlib integration with a structlog-native
+    factory (e.g. structlog.BytesLoggerFactory()); events are rendered directly
+    by structlog and the stdlib root logger is left untouched.
+    """
+    global _listener, _configured
+    if os.getenv("AGENTGUARD_SKIP_LOGGING_CONFIG", "").lower() in ("1", "true", "yes"):
+        return
+    if _configured and not force:
+        return
     level = getattr(logging, log_level.upper(), logging.INFO)
 
     shared_processors: list[structlog.types.Processor] = [
@@ -39,12 +79,37 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
     else:
         renderer = structlog.dev.ConsoleRenderer(colors=True)
 
+    if logger_factory is not None:
+        final: list[structlog.types.Processor] = [renderer]
+        if isinstance(logger_factory, structlog.BytesLoggerFactory):
+            # BytesLogger writes bytes: orjson renders JSON as bytes directly,
+            # ConsoleRenderer's str output is encoded
+            if json_logs:
+                final = [structlog.processors.JSONRenderer(serializer=orjson.dumps)]
+            else:
+                final = [renderer, _encode_rendered]
+        structlog.configure(
+            processors=[
+                structlog.contextvars.merge_contextvars,
+                _inject_request_id,
+                structlog.processors.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+                *final,
+            ],
+            logger_factory=logger_factory,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
+            cache_logger_on_first_use=True,
+        )
+        _configured = True
+        return
+
     structlog.configure(
         processors=shared_processors + [
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
@@ -56,13 +121,30 @@ def configure_logging(log_level: str = "INFO", json_logs: bool = True) -> None:
         ],
     )
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    # Formatting happens on the QueueHandler (caller thread, full record context);
+    # the listener thread only writes the pre-rendered message.
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    if _listener is not None:
+        _listener.stop()
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler)
+    _listener.start()
 
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+    root_logger.addHandler(queue_handler)
     root_logger.setLevel(level)
+    _configured = True
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Flush queued log records on interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
 
 
 def setup_otel(service_name: str = "agentguard", otlp_endpoint: str | None = None) -> None:
@@ -0,0 +1,23 @@
+"""Index sessions.updated_at for recency-ordered session listing.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_sessions_updated_at", "sessions", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_updated_at", table_name="sessions")
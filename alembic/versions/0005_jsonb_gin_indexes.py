@@ -0,0 +1,31 @@
+"""GIN jsonb_path_ops indexes on events.indicators and events.provenance.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_events_indicators_gin", "events", ["indicators"],
+        postgresql_using="gin", postgresql_ops={"indicators": "jsonb_path_ops"},
+    )
+    op.create_index(
+        "ix_events_provenance_gin", "events", ["provenance"],
+        postgresql_using="gin", postgresql_ops={"provenance": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_provenance_gin", table_name="events")
+    op.drop_index("ix_events_indicators_gin", table_name="events")
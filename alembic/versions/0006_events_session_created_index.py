@@ -0,0 +1,31 @@
+"""Composite (session_id, created_at) index covering decision and risk_score.
+
+Replaces ix_events_session_id: the composite serves the same session_id
+lookups and additionally the timeline's ORDER BY created_at.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_events_session_created", "events", ["session_id", "created_at"],
+        postgresql_include=["decision", "risk_score"],
+    )
+    op.drop_index("ix_events_session_id", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_session_id", "events", ["session_id"])
+    op.drop_index("ix_events_session_created", table_name="events")
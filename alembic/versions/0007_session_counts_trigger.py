@@ -0,0 +1,46 @@
+"""Maintain sessions.total_events / blocked_events with an AFTER INSERT trigger.
+
+The ledger stops upserting the sessions row from application code on
+PostgreSQL; this trigger does it inside the inserting transaction.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+CREATE OR REPLACE FUNCTION bump_session_counts() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sessions (session_id, agent_goal, framework, created_at, updated_at,
+                          total_events, blocked_events)
+    VALUES (NEW.session_id, NEW.agent_goal, NEW.framework, NEW.created_at, NEW.created_at,
+            1, CASE WHEN NEW.decision = 'block' THEN 1 ELSE 0 END)
+    ON CONFLICT (session_id) DO UPDATE SET
+        updated_at = NEW.created_at,
+        total_events = sessions.total_events + 1,
+        blocked_events = sessions.blocked_events
+            + CASE WHEN NEW.decision = 'block' THEN 1 ELSE 0 END;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""")
+    op.execute(
+        "CREATE TRIGGER events_bump_session_counts AFTER INSERT ON events "
+        "FOR EACH ROW EXECUTE FUNCTION bump_session_counts()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS events_bump_session_counts ON events")
+    op.execute("DROP FUNCTION IF EXISTS bump_session_counts()")
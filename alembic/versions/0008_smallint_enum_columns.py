@@ -0,0 +1,74 @@
+"""Store events.decision and events.action_type as SMALLINT codes.
+
+Codes match _DECISION_CODES / _ACTION_TYPE_CODES in agentguard.ledger.db and
+are frozen here. Indexes on these columns are rebuilt by ALTER COLUMN TYPE.
+The session-counter trigger function is re-created to compare against the
+integer code for "block".
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+_DECISIONS = {"allow": 0, "block": 1, "review": 2}
+_ACTION_TYPES = {
+    "unknown": 0,
+    "tool_call": 1,
+    "shell_command": 2,
+    "file_read": 3,
+    "file_write": 4,
+    "http_request": 5,
+    "memory_write": 6,
+    "credential_access": 7,
+}
+
+_FUNCTION = """
+CREATE OR REPLACE FUNCTION bump_session_counts() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sessions (session_id, agent_goal, framework, created_at, updated_at,
+                          total_events, blocked_events)
+    VALUES (NEW.session_id, NEW.agent_goal, NEW.framework, NEW.created_at, NEW.created_at,
+            1, CASE WHEN NEW.decision = {block} THEN 1 ELSE 0 END)
+    ON CONFLICT (session_id) DO UPDATE SET
+        updated_at = NEW.created_at,
+        total_events = sessions.total_events + 1,
+        blocked_events = sessions.blocked_events
+            + CASE WHEN NEW.decision = {block} THEN 1 ELSE 0 END;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def _to_code(column: str, codes: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for name, code in codes.items())
+    return f"ALTER TABLE events ALTER COLUMN {column} TYPE SMALLINT USING CASE {column} {whens} END"
+
+
+def _to_text(column: str, length: int, codes: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for name, code in codes.items())
+    return (
+        f"ALTER TABLE events ALTER COLUMN {column} TYPE VARCHAR({length}) "
+        f"USING CASE {column} {whens} END"
+    )
+
+
+def upgrade() -> None:
+    op.execute(_to_code("decision", _DECISIONS))
+    op.execute(_to_code("action_type", _ACTION_TYPES))
+    op.execute(_FUNCTION.format(block=_DECISIONS["block"]))
+
+
+def downgrade() -> None:
+    op.execute(_to_text("action_type", 32, _ACTION_TYPES))
+    op.execute(_to_text("decision", 16, _DECISIONS))
+    op.execute(_FUNCTION.format(block="'block'"))
@@ -0,0 +1,29 @@
+"""Composite (agent_id, created_at) index.
+
+Replaces ix_events_agent_id: the composite serves the same agent_id lookups
+and lets the agent-profile queries read an agent's most recent events by a
+backward index scan instead of sorting its whole history.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_agent_created", "events", ["agent_id", "created_at"])
+    op.drop_index("ix_events_agent_id", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_agent_id", "events", ["agent_id"])
+    op.drop_index("ix_events_agent_created", table_name="events")
@@ -0,0 +1,95 @@
+"""Per-session reviewed_events / risk_sum rollups for get_stats.
+
+Adds the two counters to sessions, extends bump_session_counts to maintain
+them, and backfills every session's counters from events so get_stats can
+sum sessions instead of scanning events.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+# Decision codes as frozen by 0008
+_BLOCK = 1
+_REVIEW = 2
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sessions",
+        sa.Column("reviewed_events", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "sessions",
+        sa.Column("risk_sum", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.execute(f"""
+CREATE OR REPLACE FUNCTION bump_session_counts() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sessions (session_id, agent_goal, framework, created_at, updated_at,
+                          total_events, blocked_events, reviewed_events, risk_sum)
+    VALUES (NEW.session_id, NEW.agent_goal, NEW.framework, NEW.created_at, NEW.created_at,
+            1, CASE WHEN NEW.decision = {_BLOCK} THEN 1 ELSE 0 END,
+            CASE WHEN NEW.decision = {_REVIEW} THEN 1 ELSE 0 END, NEW.risk_score)
+    ON CONFLICT (session_id) DO UPDATE SET
+        updated_at = NEW.created_at,
+        total_events = sessions.total_events + 1,
+        blocked_events = sessions.blocked_events
+            + CASE WHEN NEW.decision = {_BLOCK} THEN 1 ELSE 0 END,
+        reviewed_events = sessions.reviewed_events
+            + CASE WHEN NEW.decision = {_REVIEW} THEN 1 ELSE 0 END,
+        risk_sum = sessions.risk_sum + NEW.risk_score;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""")
+    # Recompute all counters from events (also repairs any pre-trigger drift)
+    op.execute(f"""
+UPDATE sessions AS s SET
+    total_events = e.total,
+    blocked_events = e.blocked,
+    reviewed_events = e.reviewed,
+    risk_sum = e.risk_sum
+FROM (
+    SELECT session_id,
+           COUNT(*) AS total,
+           SUM(CASE WHEN decision = {_BLOCK} THEN 1 ELSE 0 END) AS blocked,
+           SUM(CASE WHEN decision = {_REVIEW} THEN 1 ELSE 0 END) AS reviewed,
+           SUM(risk_score) AS risk_sum
+    FROM events
+    GROUP BY session_id
+) AS e
+WHERE s.session_id = e.session_id
+""")
+
+
+def downgrade() -> None:
+    op.execute(f"""
+CREATE OR REPLACE FUNCTION bump_session_counts() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO sessions (session_id, agent_goal, framework, created_at, updated_at,
+                          total_events, blocked_events)
+    VALUES (NEW.session_id, NEW.agent_goal, NEW.framework, NEW.created_at, NEW.created_at,
+            1, CASE WHEN NEW.decision = {_BLOCK} THEN 1 ELSE 0 END)
+    ON CONFLICT (session_id) DO UPDATE SET
+        updated_at = NEW.created_at,
+        total_events = sessions.total_events + 1,
+        blocked_events = sessions.blocked_events
+            + CASE WHEN NEW.decision = {_BLOCK} THEN 1 ELSE 0 END;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+""")
+    op.drop_column("sessions", "risk_sum")
+    op.drop_column("sessions", "reviewed_events")
@@ -21,6 +21,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from agentguard.auth.jwt_utils import auth_enabled, validate_auth_config
+from agentguard.integrations.stream import get_stream_publisher
 from agentguard.telemetry.logger import configure_logging
 from api.dependencies import check_rate_limit, verify_auth
 from api.middleware.request_id import RequestIDMiddleware
@@ -33,6 +34,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     configure_logging(
         log_level=log_level,
         json_logs=os.getenv("AGENTGUARD_JSON_LOGS", "true").lower() == "true",
+        force=True,
     )
     import structlog
     logger = structlog.get_logger(__name__)
@@ -63,7 +65,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if os.getenv("AGENTGUARD_AUTO_SEED", "").lower() == "true":
         from api.routes.demo import OPENCLAW_SCENARIOS
         import uuid as _uuid
-        existing = await ledger.list_events(limit=1)
+        existing = await ledger.list_events(limit=1, include_payload=False)
         if not existing:
             # Attack scenarios in one session — triggers realistic demotion
             attack_session = f"openclaw-demo-{_uuid.uuid4().hex[:8]}"
@@ -86,6 +88,11 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     )
     yield
     logger.info("agentguard_api_stopping")
+    await interceptor.aclose()
+    if isinstance(ledger, PostgresEventLedger):
+        # Drains group-commit batches still waiting on their window, then disposes the pool
+        await ledger.close()
+    await get_stream_publisher().close()
 
 
 def create_app() -> FastAPI:
@@ -12,7 +12,14 @@ import jwt as _jwt
 from fastapi import APIRouter, Depends, Request
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from agentguard.auth.jwt_utils import auth_enabled, check_token_revocation, create_access_token, token_expire_seconds, verify_token
+from agentguard.auth.jwt_utils import (
+    add_to_denylist,
+    auth_enabled,
+    check_token_revocation,
+    create_access_token,
+    token_expire_seconds,
+    verify_token,
+)
 from agentguard.auth.rate_limiter import get_rate_limiter
 from agentguard.core.errors import AgentGuardHTTPError, ErrorCode
 
@@ -109,10 +116,7 @@ async def revoke_token(
                 ErrorCode.INTERNAL_ERROR,
                 "Token revocation requires Redis (REDIS_URL not configured)",
             )
-        import redis.asyncio as aioredis
-        client = aioredis.from_url(redis_url)
-        await client.setex(f"agentguard:revoked:{jti}", ttl, "1")
-        await client.aclose()
+        await add_to_denylist(jti, ttl, redis_url)
         return {"revoked": True, "jti": jti}
     except AgentGuardHTTPError:
         raise
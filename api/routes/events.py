@@ -25,8 +25,11 @@ async def list_events(
     until: datetime | None = Query(None),
     limit: int = Query(50, ge=1, le=500),
     offset: int = Query(0, ge=0),
+    include_payload: bool = Query(True, description="Include action parameters and raw payload"),
+    before: datetime | None = Query(None, description="Keyset cursor: timestamp of the last event seen"),
+    before_id: str | None = Query(None, description="Keyset cursor: event_id of the last event seen"),
 ) -> list[Event]:
-    """List events with optional filters."""
+    """List events with optional filters (newest first; page with offset or before/before_id)."""
     return await ledger.list_events(
         session_id=session_id,
         decision=decision,
@@ -36,6 +39,9 @@ async def list_events(
         until=until,
         limit=limit,
         offset=offset,
+        include_payload=include_payload,
+        before=before,
+        before_id=before_id,
     )
 
 
@@ -98,6 +98,24 @@ class TestOpenAIHooks:
         with pytest.raises(BlockedByAgentGuard):
             await hooks.on_tool_start(ctx, _MockAgent(), tool)
 
+    @pytest.mark.asyncio
+    async def test_parameter_location_cached_after_first_call(
+        self, secure_interceptor: Interceptor
+    ) -> None:
+        hooks = AgentGuardOpenAIHooks(
+            interceptor=secure_interceptor,
+            agent_goal="Read README.md",
+            session_id="openai-test-resolver",
+        )
+        tool = _MockTool("file.read")
+        await hooks.on_tool_start(_MockContext({"path": "README.md"}), _MockAgent(), tool)
+        assert hooks._param_resolver is not None
+
+        # Later calls reuse the cached location and still see fresh values
+        ctx = _MockContext({"path": "~/.aws/credentials"})
+        with pytest.raises(BlockedByAgentGuard):
+            await hooks.on_tool_start(ctx, _MockAgent(), tool)
+
     @pytest.mark.asyncio
     async def test_no_op_on_tool_end(self, secure_interceptor: Interceptor) -> None:
         hooks = AgentGuardOpenAIHooks(
@@ -177,3 +195,64 @@ class TestLangGraphAdapter:
         # bash is in deny_tools — should return blocked message instead of raising
         result = await wrapped(command="rm -rf /")
         assert "BLOCKED" in str(result).upper()
+
+    @pytest.mark.asyncio
+    async def test_wrap_tool_positional_dict_parameters(self, secure_interceptor: Interceptor) -> None:
+        adapter = LangGraphAdapter(
+            interceptor=secure_interceptor,
+            agent_goal="Read docs",
+            session_id="langgraph-positional",
+        )
+
+        async def read_tool(args: dict) -> str:
+            return "contents"
+
+        wrapped = adapter.wrap_tool(read_tool, "file.read")
+        assert await wrapped({"path": "README.md"}) == "contents"
+        result = await wrapped({"path": "~/.ssh/id_rsa"})
+        assert "BLOCKED" in str(result).upper()
+
+    def test_wrap_langgraph_finds_nested_tool_node(self, secure_interceptor: Interceptor) -> None:
+        class _Wrapper:
+            def __init__(self, **attrs: object) -> None:
+                self.__dict__.update(attrs)
+
+        async def read_file(**kwargs: object) -> str:
+            return "contents"
+
+        tool_node = _Wrapper(tools_by_name={"file.read": read_file})
+        graph = _Wrapper(nodes={"tools": _Wrapper(func=_Wrapper(bound=_Wrapper(runnable=tool_node)))})
+        adapter = LangGraphAdapter(
+            interceptor=secure_interceptor,
+            agent_goal="Read docs",
+            session_id="langgraph-nested",
+        )
+
+        adapter.wrap_langgraph(graph)
+
+        assert tool_node.tools_by_name["file.read"] is not read_file
+        assert graph._agentguard is adapter
+
+    @pytest.mark.asyncio
+    async def test_wrap_tool_blocked_message_per_event(self, secure_interceptor: Interceptor) -> None:
+        messages = pytest.importorskip("langchain_core.messages")
+
+        adapter = LangGraphAdapter(
+            interceptor=secure_interceptor,
+            agent_goal="test",
+            session_id="langgraph-proto",
+        )
+
+        async def fake_bash(**kwargs: object) -> str:
+            return "output"
+
+        wrapped = adapter.wrap_tool(fake_bash, "bash")
+        first = await wrapped(command="ls")
+        second = await wrapped(command="pwd")
+        assert isinstance(first, messages.ToolMessage)
+        assert first.name == "bash"
+        assert first.tool_call_id and first.tool_call_id != second.tool_call_id
+        first.additional_kwargs["seen"] = True
+        first.response_metadata["seen"] = True
+        assert "seen" not in second.additional_kwargs
+        assert "seen" not in second.response_metadata
@@ -0,0 +1,57 @@
+"""Tests for the shared time-window Coalescer."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentguard.core.batching import Coalescer
+
+
+class TestCoalescer:
+    @pytest.mark.asyncio
+    async def test_window_and_size_triggered_flushes(self) -> None:
+        batches: list[list[int]] = []
+
+        async def flush(batch: list[int]) -> None:
+            batches.append(batch)
+
+        coalescer = Coalescer(flush, window=0.01, max_size=3)
+        for i in range(4):
+            coalescer.add(i)
+        await asyncio.sleep(0)
+        assert batches == [[0, 1, 2]]  # full batch sent without waiting for the window
+        await asyncio.sleep(0.03)
+        assert batches == [[0, 1, 2], [3]]
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_in_flight_flushes(self) -> None:
+        done: list[list[int]] = []
+
+        async def slow_flush(batch: list[int]) -> None:
+            await asyncio.sleep(0.02)
+            done.append(batch)
+
+        coalescer = Coalescer(slow_flush, window=10.0, max_size=2)
+        coalescer.add(1)
+        coalescer.add(2)  # full batch, now in flight
+        coalescer.add(3)  # queued behind a 10 s window
+        await coalescer.drain()
+        assert sorted(done) == [[1, 2], [3]]
+
+    @pytest.mark.asyncio
+    async def test_drain_timeout_cancels_stragglers(self) -> None:
+        cancelled = asyncio.Event()
+
+        async def stuck_flush(batch: list[int]) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        coalescer = Coalescer(stuck_flush, window=0.0, max_size=1)
+        coalescer.add(1)
+        await coalescer.drain(timeout=0.01)
+        assert cancelled.is_set()
@@ -0,0 +1,220 @@
+"""Tests for the Claude enrichment client (using mocks — no real API calls)."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import get_args
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from agentguard.integrations.enrichment import (
+    TRIAGE_TOOL,
+    EnrichmentClient,
+    TriageResult,
+    _fallback_insight,
+)
+from agentguard.integrations.insights import InsightsStore
+
+
+def make_event(event_id: str = "evt-1") -> dict:
+    return {
+        "event_id": event_id,
+        "session_id": "s1",
+        "tool_name": "file.read",
+        "decision": "block",
+        "risk_score": 0.95,
+        "reason": "Credential path",
+        "agent_goal": "Summarize README",
+    }
+
+
+def make_triage_content(pattern: str = "credential_exfiltration") -> list:
+    block = MagicMock()
+    block.type = "tool_use"
+    block.name = "security_triage"
+    block.input = {
+        "attack_pattern": pattern,
+        "confidence": 0.9,
+        "severity": "high",
+        "summary": "Agent tried to read SSH keys",
+        "recommended_action": "Rotate keys",
+        "false_positive_likelihood": 0.05,
+    }
+    return [block]
+
+
+class TestTriageSchema:
+    def test_model_matches_tool_schema(self) -> None:
+        """TriageResult is the compiled validator for TRIAGE_TOOL — keep them in sync."""
+        schema = TRIAGE_TOOL["input_schema"]
+        fields = TriageResult.model_fields
+        assert set(fields) == set(schema["properties"]) == set(schema["required"])
+        for name, prop in schema["properties"].items():
+            if "enum" in prop:
+                assert list(get_args(fields[name].annotation)) == prop["enum"]
+
+
+class TestTriage:
+    @pytest.mark.asyncio
+    async def test_disabled_without_api_key(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+        insight = await EnrichmentClient().triage_event(make_event())
+        assert insight.analysis == "Enrichment unavailable"
+
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self) -> None:
+        client = EnrichmentClient(api_key="fake-key")
+        response = MagicMock()
+        response.content = make_triage_content()
+
+        with patch.object(client._get_client().messages, "create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = response
+            first = await client.triage_event(make_event("evt-1"))
+            second = await client.triage_event(make_event("evt-2"))
+
+        assert client._get_client() is client._get_client()
+        assert first.attack_patterns == ["credential_exfiltration"]
+        assert second.event_id == "evt-2"
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_repeat_event_served_from_cache(self) -> None:
+        client = EnrichmentClient(api_key="fake-key")
+        response = MagicMock()
+        response.content = make_triage_content()
+
+        with patch.object(client._get_client().messages, "create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = response
+            first = await client.triage_event(make_event("evt-1"))
+            second = await client.triage_event(make_event("evt-2"))
+            other = make_event("evt-3")
+            other["reason"] = "Outbound request to ngrok"
+            await client.triage_event(other)
+
+        assert mock_create.call_count == 2
+        assert second.event_id == "evt-2"
+        assert second.attack_patterns == first.attack_patterns
+        assert second.attack_patterns is not first.attack_patterns
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicates_share_one_call(self) -> None:
+        client = EnrichmentClient(api_key="fake-key")
+        response = MagicMock()
+        response.content = make_triage_content()
+
+        async def slow_create(**kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return response
+
+        with patch.object(client._get_client().messages, "create", side_effect=slow_create) as mock_create:
+            insights = await asyncio.gather(
+                *(client.triage_event(make_event(f"evt-{i}")) for i in range(3))
+            )
+
+        assert mock_create.call_count == 1
+        assert [i.event_id for i in insights] == ["evt-0", "evt-1", "evt-2"]
+        assert client._triage_inflight == {}
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_triage_gate_charged_only_for_api_calls(self) -> None:
+        client = EnrichmentClient(api_key="fake-key")
+        client.triage_gate = AsyncMock()
+        response = MagicMock()
+        response.content = make_triage_content()
+
+        async def slow_create(**kwargs: object) -> MagicMock:
+            await asyncio.sleep(0.01)
+            return response
+
+        with patch.object(client._get_client().messages, "create", side_effect=slow_create):
+            await asyncio.gather(*(client.triage_event(make_event(f"evt-{i}")) for i in range(3)))
+            await client.triage_event(make_event("evt-cached"))
+
+        client.triage_gate.assert_awaited_once()
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_malformed_tool_input_falls_back(self) -> None:
+        client = EnrichmentClient(api_key="fake-key")
+        content = make_triage_content()
+        content[0].input["severity"] = "catastrophic"  # not in the schema enum
+        response = MagicMock()
+        response.content = content
+
+        with patch.object(client._get_client().messages, "create", new_callable=AsyncMock) as mock_create:
+            mock_create.return_value = response
+            insight = await client.triage_event(make_event())
+
+        assert insight.analysis == "Enrichment unavailable"
+        await client.aclose()
+
+
+class TestMessageBatches:
+    @pytest.mark.asyncio
+    async def test_concurrent_events_share_one_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTGUARD_ANALYZER_BATCH_WINDOW_MS", "10")
+        client = EnrichmentClient(api_key="fake-key", batch=True)
+        batches = client._get_client().messages.batches
+
+        def entry(custom_id: str, pattern: str) -> MagicMock:
+            e = MagicMock()
+            e.custom_id = custom_id
+            e.result.type = "succeeded"
+            e.result.message.content = make_triage_content(pattern)
+            return e
+
+        async def results(_batch_id: str):
+            async def gen():
+                yield entry("e0", "credential_exfiltration")
+                yield entry("e1", "data_exfiltration")
+            return gen()
+
+        created = MagicMock(id="batch-1", processing_status="ended")
+        with patch.object(batches, "create", new_callable=AsyncMock) as mock_create, \
+                patch.object(batches, "results", side_effect=results):
+            mock_create.return_value = created
+            other = make_event("evt-2")
+            other["reason"] = "Outbound request to ngrok"  # distinct triage key
+            first, second = await asyncio.gather(
+                client.triage_event(make_event("evt-1")),
+                client.triage_event(other),
+            )
+
+        assert mock_create.call_count == 1
+        assert len(mock_create.call_args.kwargs["requests"]) == 2
+        assert first.event_id == "evt-1"
+        assert first.attack_patterns == ["credential_exfiltration"]
+        assert second.attack_patterns == ["data_exfiltration"]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("AGENTGUARD_ANALYZER_BATCH_WINDOW_MS", "10")
+        client = EnrichmentClient(api_key="fake-key", batch=True)
+        batches = client._get_client().messages.batches
+
+        with patch.object(batches, "create", new_callable=AsyncMock) as mock_create:
+            mock_create.side_effect = Exception("overloaded")
+            insight = await client.triage_event(make_event())
+
+        assert insight.analysis == "Enrichment unavailable"
+        await client.aclose()
+
+
+class TestInsightsStore:
+    def test_to_dict_prebuilt_and_evicted_with_insight(self) -> None:
+        store = InsightsStore(maxsize=2)
+        first = _fallback_insight("evt-1")
+        store.put(first)
+        assert store.to_dict(first) is store.to_dict(first)
+        assert store.to_dict(first)["created_at"] == first.created_at.isoformat()
+
+        store.put(_fallback_insight("evt-2"))
+        store.put(_fallback_insight("evt-3"))
+        assert store.get("evt-1") is None
+        assert set(store._dicts) == {"evt-2", "evt-3"}
+        # Insights not (or no longer) in the store are still serialisable
+        assert store.to_dict(first)["event_id"] == "evt-1"
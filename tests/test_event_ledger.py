@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import time
+import uuid
+
 import pytest
 
 from agentguard.core.models import Action, ActionType, Decision, Event, RiskAssessment
@@ -140,3 +143,25 @@ class TestInMemoryEventLedger:
         ids1 = {e.event_id for e in page1}
         ids2 = {e.event_id for e in page2}
         assert not ids1.intersection(ids2)
+
+    @pytest.mark.asyncio
+    async def test_keyset_pagination(self) -> None:
+        ledger = InMemoryEventLedger()
+        for _ in range(10):
+            await ledger.append(make_event())
+
+        page1 = await ledger.list_events(limit=5)
+        last = page1[-1]
+        page2 = await ledger.list_events(limit=5, before=last.timestamp, before_id=last.event_id)
+        assert len(page2) == 5
+        assert {e.event_id for e in page1}.isdisjoint(e.event_id for e in page2)
+
+
+class TestEventIds:
+    def test_event_ids_are_time_ordered_uuid7(self) -> None:
+        first = make_event().event_id
+        time.sleep(0.002)
+        second = make_event().event_id
+        assert uuid.UUID(first).version == 7
+        assert uuid.UUID(first).variant == uuid.RFC_4122
+        assert first < second
@@ -2,14 +2,44 @@
 
 from __future__ import annotations
 
+import asyncio
+
 import pytest
+from structlog.testing import capture_logs
 
 from agentguard.core.models import ActionType, Decision
-from agentguard.interceptor.interceptor import ActionNormalizer, Interceptor
+from agentguard.interceptor import interceptor as interceptor_module
+from agentguard.interceptor.action_types import is_credential_path
+from agentguard.interceptor.interceptor import ActionNormalizer, Interceptor, _BackgroundJob
 from agentguard.policy.engine import PolicyEngine
 from agentguard.policy.schema import SessionLimits
 
 
+class TestCredentialPaths:
+    @pytest.mark.parametrize("path", [
+        "~/.ssh/id_rsa",
+        "/home/dev/.SSH/ID_ED25519",
+        "C:\\Users\\dev\\.aws\\credentials",
+        ".env",
+        "app/prod.env",
+        "/etc/passwd",
+        "deploy/credentials.json",
+        "certs/server.PEM",
+    ])
+    def test_credential_paths(self, path: str) -> None:
+        assert is_credential_path(path)
+
+    @pytest.mark.parametrize("path", [
+        "README.md",
+        "src/etc/passwd",  # only the absolute /etc/passwd is sensitive
+        "docs/ssh/id_rsa.md",
+        "config/settings.yaml",
+        "notes.env.bak",
+    ])
+    def test_non_credential_paths(self, path: str) -> None:
+        assert not is_credential_path(path)
+
+
 class TestActionNormalizer:
     def test_from_dict_basic(self) -> None:
         payload = {"tool_name": "file.read", "parameters": {"path": "README.md"}}
@@ -32,6 +62,15 @@ class TestActionNormalizer:
         action = ActionNormalizer.from_dict(payload)
         assert action.type == ActionType.CREDENTIAL_ACCESS
 
+    def test_from_dict_declared_file_read_credential_override(self) -> None:
+        payload = {
+            "tool_name": "loader",
+            "action_type": "file_read",
+            "parameters": {"path": "~/.ssh/id_rsa"},
+        }
+        action = ActionNormalizer.from_dict(payload)
+        assert action.type == ActionType.CREDENTIAL_ACCESS
+
     def test_from_dict_http_request(self) -> None:
         payload = {"tool_name": "http.request", "parameters": {"url": "https://example.com"}}
         action = ActionNormalizer.from_dict(payload)
@@ -88,6 +127,27 @@ class TestInterceptor:
         assert event.policy_violation is not None
         assert event.policy_violation.rule_name == "deny_tools"
 
+    @pytest.mark.asyncio
+    async def test_policy_block_skips_analyzer(self, interceptor: Interceptor) -> None:
+        calls = 0
+        original = interceptor._analyzer.analyze
+
+        async def counting_analyze(*args: object, **kwargs: object) -> object:
+            nonlocal calls
+            calls += 1
+            return await original(*args, **kwargs)
+
+        interceptor._analyzer.analyze = counting_analyze
+        decision, event = await interceptor.intercept(
+            raw_payload={"tool_name": "bash", "parameters": {"command": "rm -rf /"}},
+            agent_goal="List files",
+            session_id="test-session",
+        )
+        assert decision == Decision.BLOCK
+        assert event.assessment.analyzer_model == "policy_engine"
+        assert calls == 0
+        assert interceptor.policy_preempted_analyses == 1
+
     @pytest.mark.asyncio
     async def test_block_credential_path(self, interceptor: Interceptor) -> None:
         decision, event = await interceptor.intercept(
@@ -111,16 +171,26 @@ class TestInterceptor:
 
     @pytest.mark.asyncio
     async def test_event_logged_to_ledger(self, interceptor: Interceptor, event_ledger) -> None:
-        import asyncio
         await interceptor.intercept(
             raw_payload={"tool_name": "file.read", "parameters": {"path": "README.md"}},
             agent_goal="Summarize",
             session_id="ledger-test",
         )
-        await asyncio.sleep(0)  # yield so fire-and-forget ledger task completes
+        await interceptor.flush()  # ALLOW appends run on the background workers
         events = await event_ledger.list_events(session_id="ledger-test")
         assert len(events) == 1
 
+    @pytest.mark.asyncio
+    async def test_block_logged_before_return(self, interceptor: Interceptor, event_ledger) -> None:
+        decision, event = await interceptor.intercept(
+            raw_payload={"tool_name": "bash", "parameters": {"command": "ls"}},
+            agent_goal="List files",
+            session_id="durable-test",
+        )
+        assert decision == Decision.BLOCK
+        events = await event_ledger.list_events(session_id="durable-test")
+        assert [e.event_id for e in events] == [event.event_id]
+
     @pytest.mark.asyncio
     async def test_high_risk_score_blocks(self, interceptor: Interceptor) -> None:
         """Mock analyzer returns 0.92 for ngrok URLs — above threshold."""
@@ -172,6 +242,29 @@ class TestInterceptor:
         assert event.policy_violation is not None
         assert event.policy_violation.rule_name == "session_limits"
 
+    @pytest.mark.asyncio
+    async def test_session_max_actions_enforced_concurrently(
+        self, policy_engine, event_ledger, mock_analyzer
+    ) -> None:
+        """Concurrent requests for one session cannot overshoot max_actions."""
+        import asyncio
+        tight_engine = PolicyEngine(config=policy_engine.config.model_copy(
+            update={"session_limits": SessionLimits(max_actions=3, max_blocked=100)}
+        ))
+        inter = Interceptor(
+            analyzer=mock_analyzer,
+            policy_engine=tight_engine,
+            event_ledger=event_ledger,
+        )
+        payload = {"tool_name": "file.read", "parameters": {"path": "README.md"}}
+        results = await asyncio.gather(*(
+            inter.intercept(raw_payload=payload, agent_goal="Task", session_id="race-test")
+            for _ in range(6)
+        ))
+        decisions = [d for d, _ in results]
+        assert decisions.count(Decision.ALLOW) == 3
+        assert decisions.count(Decision.BLOCK) == 3
+
     @pytest.mark.asyncio
     async def test_session_max_blocked_enforced(
         self, policy_engine, event_ledger, mock_analyzer
@@ -200,6 +293,84 @@ class TestInterceptor:
         assert d == Decision.BLOCK
         assert event.policy_violation.rule_name == "session_limits"
 
+    @pytest.mark.asyncio
+    async def test_blocked_events_published_by_enrichment_workers(
+        self, interceptor: Interceptor
+    ) -> None:
+        published: list[dict] = []
+
+        class FakePublisher:
+            enabled = True
+
+            async def publish_event(self, data: dict) -> None:
+                published.append(data)
+
+        interceptor._publisher = FakePublisher()  # type: ignore[assignment]
+        for _ in range(3):
+            await interceptor.intercept(
+                raw_payload={"tool_name": "bash", "parameters": {"command": "ls"}},
+                agent_goal="List files",
+                session_id="enrich-test",
+            )
+        await interceptor.flush()
+
+        assert len(published) == 3
+        assert {p["decision"] for p in published} == {"block"}
+        await interceptor.aclose()
+        assert interceptor._enrich_workers == []
+        assert interceptor._append_workers == []
+
+    @pytest.mark.asyncio
+    async def test_appends_never_wait_behind_enrichment(
+        self, interceptor: Interceptor, event_ledger
+    ) -> None:
+        release = asyncio.Event()
+
+        async def stuck_triage(event) -> None:
+            await release.wait()
+
+        interceptor._enrich_direct = stuck_triage  # type: ignore[method-assign]
+        _, blocked = await interceptor.intercept(
+            raw_payload={"tool_name": "bash", "parameters": {"command": "ls"}},
+            agent_goal="List files",
+            session_id="stall-test",
+        )
+        for _ in range(8):  # occupy every enrichment worker and queue more behind them
+            interceptor._schedule_background(_BackgroundJob(blocked, False, True))
+        decision, allowed = await interceptor.intercept(
+            raw_payload={"tool_name": "file.read", "parameters": {"path": "README.md"}},
+            agent_goal="Summarize README.md",
+            session_id="stall-test",
+        )
+        assert decision == Decision.ALLOW
+        await asyncio.sleep(0.01)
+        assert await event_ledger.get_event(allowed.event_id) is not None
+        release.set()
+        await interceptor.aclose()
+
+    @pytest.mark.asyncio
+    async def test_queue_full_append_fallback_tracked_and_logged(
+        self, interceptor: Interceptor, event_ledger, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(interceptor_module, "_APPEND_QUEUE_MAX", 1)
+        _, event = await interceptor.intercept(
+            raw_payload={"tool_name": "file.read", "parameters": {"path": "README.md"}},
+            agent_goal="Summarize README.md",
+            session_id="fallback-test",
+        )  # fills the one-slot queue
+        interceptor._schedule_background(_BackgroundJob(event.model_copy(update={"event_id": "x"}), True, False))
+        assert len(interceptor._append_tasks) == 1
+
+        async def failing_append(event) -> None:
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(event_ledger, "append", failing_append)
+        with capture_logs() as logs:
+            await interceptor.flush()
+        assert interceptor._append_tasks == set()
+        assert [e["event"] for e in logs].count("ledger_append_failed") == 2
+        await interceptor.aclose()
+
     @pytest.mark.asyncio
     async def test_pipeline_error_fails_closed(
         self, policy_engine, event_ledger
@@ -7,10 +7,12 @@ production on PostgreSQL if not tested locally.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 
 import pytest
+from sqlalchemy.pool import NullPool
 
 from agentguard.core.models import (
     Action,
@@ -20,7 +22,14 @@ from agentguard.core.models import (
     Event,
     RiskAssessment,
 )
-from agentguard.ledger.db import PostgresEventLedger
+from agentguard.ledger.db import (
+    _ACTION_TYPE_CODES,
+    _DECISION_CODES,
+    PostgresEventLedger,
+    SessionRecord,
+    _async_database_url,
+    _DecisionCode,
+)
 
 
 @pytest.fixture
@@ -66,7 +75,7 @@ def _make_event(
         decision=decision,
         correlation_id=str(uuid.uuid4()),
         initiating_principal="test-principal",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=datetime.now(UTC),
     )
 
 
@@ -79,6 +88,15 @@ class TestSQLiteBasicOperations:
         assert retrieved is not None
         assert retrieved.event_id == event.event_id
         assert retrieved.session_id == event.session_id
+        assert retrieved.decision is Decision.ALLOW
+        assert retrieved.agent_is_registered is True
+        assert retrieved.assessment.is_goal_aligned is True
+        assert retrieved.action.type is ActionType.TOOL_CALL
+        assert retrieved.action.parameters == event.action.parameters
+        assert retrieved.assessment.risk_level == event.assessment.risk_level
+        assert retrieved.model_dump(exclude={"timestamp", "action"}) == event.model_dump(
+            exclude={"timestamp", "action"}
+        )
 
     @pytest.mark.asyncio
     async def test_correlation_id_persisted(self, sqlite_ledger: PostgresEventLedger) -> None:
@@ -101,6 +119,46 @@ class TestSQLiteBasicOperations:
         events = await sqlite_ledger.list_events(limit=10)
         assert len(events) == 3
 
+    @pytest.mark.asyncio
+    async def test_list_events_combined_filters(self, sqlite_ledger: PostgresEventLedger) -> None:
+        await sqlite_ledger.append(_make_event(session_id="sess-f", risk_score=0.9))
+        await sqlite_ledger.append(_make_event(session_id="sess-f", risk_score=0.2))
+        await sqlite_ledger.append(_make_event(session_id="other", risk_score=0.9))
+        since = datetime(2000, 1, 1)  # naive: treated as UTC
+        events = await sqlite_ledger.list_events(session_id="sess-f", min_risk=0.5, since=since)
+        assert [e.assessment.risk_score for e in events] == [0.9]
+        assert await sqlite_ledger.list_events(max_risk=0.1) == []
+
+    @pytest.mark.asyncio
+    async def test_list_events_without_payload(self, sqlite_ledger: PostgresEventLedger) -> None:
+        event = _make_event(decision=Decision.BLOCK)
+        await sqlite_ledger.append(event)
+        [summary] = await sqlite_ledger.list_events(include_payload=False)
+        assert summary.event_id == event.event_id
+        assert summary.action.tool_name == event.action.tool_name
+        assert summary.decision == Decision.BLOCK
+        assert summary.action.parameters == {}
+        assert summary.action.raw_payload == {}
+        [full] = await sqlite_ledger.list_events()
+        assert full.action.parameters == event.action.parameters
+
+    @pytest.mark.asyncio
+    async def test_list_events_keyset_pagination(self, sqlite_ledger: PostgresEventLedger) -> None:
+        shared_ts = datetime.now(UTC)
+        for _ in range(5):
+            event = _make_event()
+            event.timestamp = shared_ts  # ties are broken by event_id
+            await sqlite_ledger.append(event)
+        seen: list[str] = []
+        cursor: tuple[datetime | None, str | None] = (None, None)
+        while True:
+            page = await sqlite_ledger.list_events(limit=2, before=cursor[0], before_id=cursor[1])
+            if not page:
+                break
+            seen.extend(e.event_id for e in page)
+            cursor = (page[-1].timestamp, page[-1].event_id)
+        assert len(seen) == len(set(seen)) == 5
+
     @pytest.mark.asyncio
     async def test_list_events_filter_decision(self, sqlite_ledger: PostgresEventLedger) -> None:
         await sqlite_ledger.append(_make_event(decision=Decision.BLOCK))
@@ -116,6 +174,32 @@ class TestSQLiteBasicOperations:
         sessions = await sqlite_ledger.list_sessions()
         assert set(sessions) == {"sess-a", "sess-b"}
 
+    @pytest.mark.asyncio
+    async def test_get_timeline_scoped_and_ordered(self, sqlite_ledger: PostgresEventLedger) -> None:
+        events = [_make_event(session_id="sess-t") for _ in range(3)]
+        for event in reversed(events):
+            await sqlite_ledger.append(event)
+        await sqlite_ledger.append(_make_event(session_id="other"))
+        timeline = await sqlite_ledger.get_timeline("sess-t")
+        assert [e.event_id for e in timeline] == [e.event_id for e in events]
+
+    @pytest.mark.asyncio
+    async def test_get_timeline_summary(self, sqlite_ledger: PostgresEventLedger) -> None:
+        blocked = _make_event(session_id="sess-s", decision=Decision.BLOCK, risk_score=0.9)
+        blocked.assessment.indicators = ["credential_access", "exfiltration"]
+        allowed = _make_event(session_id="sess-s", decision=Decision.ALLOW, risk_score=0.1)
+        allowed.assessment.indicators = ["benign"]
+        await sqlite_ledger.append(blocked)
+        await sqlite_ledger.append(allowed)
+
+        summary = await sqlite_ledger.get_timeline_summary("sess-s")
+        assert summary is not None
+        assert (summary.total_events, summary.blocked_events, summary.allowed_events) == (2, 1, 1)
+        assert summary.max_risk_score == pytest.approx(0.9)
+        assert summary.avg_risk_score == pytest.approx(0.5)
+        assert sorted(summary.attack_vectors) == ["credential_access", "exfiltration"]
+        assert await sqlite_ledger.get_timeline_summary("missing") is None
+
     @pytest.mark.asyncio
     async def test_get_stats(self, sqlite_ledger: PostgresEventLedger) -> None:
         await sqlite_ledger.append(_make_event(decision=Decision.ALLOW))
@@ -125,6 +209,95 @@ class TestSQLiteBasicOperations:
         assert stats["blocked_events"] == 1
         assert stats["allowed_events"] == 1
 
+    @pytest.mark.asyncio
+    async def test_get_stats_from_session_rollups(self, sqlite_ledger: PostgresEventLedger) -> None:
+        await sqlite_ledger.append(_make_event(session_id="s-1", decision=Decision.REVIEW, risk_score=0.5))
+        await sqlite_ledger.append_many([
+            _make_event(session_id="s-1", decision=Decision.BLOCK, risk_score=0.9),
+            _make_event(session_id="s-2", decision=Decision.ALLOW, risk_score=0.1),
+            _make_event(session_id="s-2", decision=Decision.ALLOW, risk_score=0.1),
+        ])
+        stats = await sqlite_ledger.get_stats()
+        assert stats["total_events"] == 4
+        assert stats["blocked_events"] == 1
+        assert stats["reviewed_events"] == 1
+        assert stats["allowed_events"] == 2
+        assert stats["active_sessions"] == 2
+        assert stats["avg_risk_score"] == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_get_stats_empty(self, sqlite_ledger: PostgresEventLedger) -> None:
+        stats = await sqlite_ledger.get_stats()
+        assert stats == {
+            "total_events": 0, "blocked_events": 0, "reviewed_events": 0,
+            "allowed_events": 0, "active_sessions": 0, "avg_risk_score": 0.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_session_counters_upserted(self, sqlite_ledger: PostgresEventLedger) -> None:
+        await asyncio.gather(
+            sqlite_ledger.append(_make_event(session_id="sess-u", decision=Decision.BLOCK)),
+            sqlite_ledger.append(_make_event(session_id="sess-u", decision=Decision.ALLOW)),
+            sqlite_ledger.append(_make_event(session_id="sess-u", decision=Decision.BLOCK)),
+        )
+        async with sqlite_ledger._sessionmaker() as session:
+            record = await session.get(SessionRecord, "sess-u")
+        assert record.total_events == 3
+        assert record.blocked_events == 2
+
+    @pytest.mark.asyncio
+    async def test_append_many(self, sqlite_ledger: PostgresEventLedger) -> None:
+        await sqlite_ledger.append(_make_event(session_id="sess-m", decision=Decision.BLOCK))
+        batch = [
+            _make_event(session_id="sess-m", decision=Decision.BLOCK),
+            _make_event(session_id="sess-m", decision=Decision.ALLOW),
+            _make_event(session_id="sess-n", decision=Decision.ALLOW),
+        ]
+        await sqlite_ledger.append_many(batch)
+        assert len(await sqlite_ledger.list_events(limit=10)) == 4
+        async with sqlite_ledger._sessionmaker() as session:
+            m = await session.get(SessionRecord, "sess-m")
+            n = await session.get(SessionRecord, "sess-n")
+        assert (m.total_events, m.blocked_events) == (3, 2)
+        assert (n.total_events, n.blocked_events) == (1, 0)
+
+
+class TestGroupCommit:
+    @pytest.mark.asyncio
+    async def test_concurrent_appends_share_one_transaction(self, tmp_path) -> None:
+        ledger = PostgresEventLedger(f"sqlite+aiosqlite:///{tmp_path / 'gc.db'}", batch_window_ms=10)
+        await ledger.create_tables()
+        batches: list[int] = []
+        original = ledger.append_many
+
+        async def counting_append_many(events: list[Event]) -> None:
+            batches.append(len(events))
+            await original(events)
+
+        ledger.append_many = counting_append_many  # type: ignore[method-assign]
+        await asyncio.gather(*(ledger.append(_make_event(session_id="sess-g")) for _ in range(5)))
+
+        assert batches == [5]
+        assert len(await ledger.list_events(session_id="sess-g")) == 5  # committed on return
+        await ledger.close()
+
+    @pytest.mark.asyncio
+    async def test_bad_row_fails_only_its_caller(self, tmp_path) -> None:
+        ledger = PostgresEventLedger(f"sqlite+aiosqlite:///{tmp_path / 'gc.db'}", batch_window_ms=10)
+        await ledger.create_tables()
+        good = _make_event()
+        duplicate = _make_event()
+        await ledger.append(duplicate)
+
+        results = await asyncio.gather(
+            ledger.append(good), ledger.append(duplicate), return_exceptions=True
+        )
+
+        assert results[0] is None
+        assert isinstance(results[1], Exception)  # primary-key conflict
+        assert await ledger.get_event(good.event_id) is not None
+        await ledger.close()
+
 
 class TestSQLiteAgentProfile:
     @pytest.mark.asyncio
@@ -158,6 +331,36 @@ class TestSQLiteAgentProfile:
         assert profile.allowed_events == 2
         assert profile.total_events == 5
 
+    @pytest.mark.asyncio
+    async def test_list_agents_details_match_single_profile(self, sqlite_ledger: PostgresEventLedger) -> None:
+        """The windowed list_agents details agree with the per-agent query."""
+        for i in range(3):
+            await sqlite_ledger.append(_make_event(agent_id="agent-a", tool_name=f"tool.{i}", risk_score=i / 10))
+        await sqlite_ledger.append(_make_event(agent_id="agent-b", tool_name="shell.exec", risk_score=0.9))
+        profiles = {p.agent_id: p for p in await sqlite_ledger.list_agents()}
+        for agent_id in ("agent-a", "agent-b"):
+            single = await sqlite_ledger.get_agent_profile(agent_id)
+            assert profiles[agent_id].tools_used == single.tools_used
+            assert profiles[agent_id].risk_trend == single.risk_trend
+        assert profiles["agent-a"].tools_used == ["tool.2", "tool.1", "tool.0"]
+        assert profiles["agent-b"].risk_trend == [0.9]
+
+    @pytest.mark.asyncio
+    async def test_get_agent_graph(self, sqlite_ledger: PostgresEventLedger) -> None:
+        blocked = _make_event(agent_id="agent-g", decision=Decision.BLOCK, tool_name="shell.exec", risk_score=0.9)
+        blocked.assessment.indicators = ["data_exfiltration"]
+        await sqlite_ledger.append(blocked)
+        await sqlite_ledger.append(_make_event(agent_id="agent-other"))
+        graph = await sqlite_ledger.get_agent_graph("agent-g")
+        by_type = {n["type"]: n for n in graph.nodes}
+        assert set(by_type) == {"agent", "session", "tool", "pattern"}
+        assert by_type["tool"]["decision"] == "block"
+        stored = await sqlite_ledger.get_event(blocked.event_id)
+        assert by_type["session"]["timestamp"] == stored.timestamp.isoformat()
+        used = next(e for e in graph.edges if e["type"] == "used_tool")
+        assert used["risk_score"] == 0.9
+        assert (await sqlite_ledger.get_agent_graph("missing")).nodes == []
+
 
 class TestSQLiteTaxonomy:
     @pytest.mark.asyncio
@@ -175,3 +378,107 @@ class TestSQLiteTaxonomy:
         await sqlite_ledger.update_event_taxonomy(event.event_id, annotation)
         retrieved = await sqlite_ledger.get_event(event.event_id)
         assert retrieved is not None
+
+
+class TestDatabaseUrl:
+    @pytest.mark.parametrize("url, expected", [
+        ("postgresql://u:p@db:5432/ag", "postgresql+asyncpg://u:p@db:5432/ag"),
+        ("postgres://u:p@db:5432/ag", "postgresql+asyncpg://u:p@db:5432/ag"),
+        ("postgresql+asyncpg://u:p@db:5432/ag", "postgresql+asyncpg://u:p@db:5432/ag"),
+        ("sqlite+aiosqlite:///./agentguard.db", "sqlite+aiosqlite:///./agentguard.db"),
+    ])
+    def test_bare_postgres_urls_use_asyncpg(self, url: str, expected: str) -> None:
+        assert _async_database_url(url) == expected
+
+
+class TestEngineConfig:
+    @pytest.mark.asyncio
+    async def test_pool_sizing_and_statement_cache(self) -> None:
+        ledger = PostgresEventLedger("postgresql://u:p@db:5432/ag", pool_size=25, max_overflow=75)
+        assert ledger._engine.pool.size() == 25
+        assert ledger._engine.pool._max_overflow == 75
+        await ledger.close()
+
+    @pytest.mark.asyncio
+    async def test_null_pool_for_pgbouncer(self) -> None:
+        ledger = PostgresEventLedger(
+            "postgresql+asyncpg://u:p@db:5432/ag", poolclass=NullPool, statement_cache_size=0
+        )
+        assert isinstance(ledger._engine.pool, NullPool)
+        await ledger.close()
+
+    @pytest.mark.asyncio
+    async def test_json_columns_round_trip_through_orjson(self, sqlite_ledger) -> None:
+        event = _make_event()
+        event.action.parameters = {"nested": {"n": [1, 2.5, None]}, 7: "int key"}
+        await sqlite_ledger.append(event)
+        stored = await sqlite_ledger.get_event(event.event_id)
+        assert stored.action.parameters == {"nested": {"n": [1, 2.5, None]}, "7": "int key"}
+
+    @pytest.mark.asyncio
+    async def test_json_columns_accept_integers_beyond_64_bits(self, sqlite_ledger) -> None:
+        """orjson rejects these; the stdlib fallback must still persist the event."""
+        event = _make_event(decision=Decision.BLOCK)
+        event.action.parameters = {"n": 2**70}
+        await sqlite_ledger.append(event)
+        stored = await sqlite_ledger.get_event(event.event_id)
+        assert stored.action.parameters == {"n": 2**70}
+
+
+class TestLegacySQLiteUpgrade:
+    @pytest.mark.asyncio
+    async def test_text_enum_rows_converted_on_startup(self, tmp_path) -> None:
+        """Rows written as text before the SMALLINT switch must stay queryable."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"
+        ledger = PostgresEventLedger(url)
+        await ledger.create_tables()
+        event = _make_event(session_id="sess-legacy", decision=Decision.BLOCK)
+        await ledger.append(event)
+        async with ledger._engine.begin() as conn:
+            await conn.exec_driver_sql("UPDATE events SET decision = 'block', action_type = 'tool_call'")
+        await ledger.close()
+
+        ledger = PostgresEventLedger(url)
+        await ledger.create_tables()
+        blocked = await ledger.list_events(decision=Decision.BLOCK)
+        assert [e.event_id for e in blocked] == [event.event_id]
+        assert blocked[0].action.type == ActionType.TOOL_CALL
+        summary = await ledger.get_timeline_summary("sess-legacy")
+        assert summary.blocked_events == 1
+        await ledger.close()
+
+
+    @pytest.mark.asyncio
+    async def test_session_rollup_columns_added_and_backfilled(self, tmp_path) -> None:
+        """A sessions table without reviewed_events/risk_sum must keep accepting appends."""
+        url = f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}"
+        ledger = PostgresEventLedger(url)
+        await ledger.create_tables()
+        await ledger.append(_make_event(session_id="s-old", decision=Decision.REVIEW, risk_score=0.5))
+        async with ledger._engine.begin() as conn:
+            await conn.exec_driver_sql("ALTER TABLE sessions DROP COLUMN reviewed_events")
+            await conn.exec_driver_sql("ALTER TABLE sessions DROP COLUMN risk_sum")
+        await ledger.close()
+
+        ledger = PostgresEventLedger(url)
+        await ledger.create_tables()
+        await ledger.append(_make_event(session_id="s-old", decision=Decision.BLOCK, risk_score=0.9))
+        stats = await ledger.get_stats()
+        assert stats["total_events"] == 2
+        assert stats["reviewed_events"] == 1
+        assert stats["blocked_events"] == 1
+        assert stats["avg_risk_score"] == pytest.approx(0.7)
+        await ledger.close()
+
+
+class TestEnumCodes:
+    def test_every_enum_value_has_a_stable_code(self) -> None:
+        """New ActionType / Decision members need a code before they can be stored."""
+        assert set(_ACTION_TYPE_CODES) == {t.value for t in ActionType}
+        assert set(_DECISION_CODES) == {d.value for d in Decision}
+        assert len(set(_ACTION_TYPE_CODES.values())) == len(_ACTION_TYPE_CODES)
+
+    def test_codes_read_back_from_text_affinity_columns(self) -> None:
+        """Pre-switch SQLite databases declare the columns VARCHAR, returning '1'."""
+        assert _DecisionCode().process_result_value("1", None) == "block"
+        assert _DecisionCode().process_result_value(1, None) == "block"
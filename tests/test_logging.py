@@ -0,0 +1,27 @@
+"""Tests for structlog configuration."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+import structlog
+
+from agentguard.telemetry.logger import configure_logging
+
+
+@pytest.fixture
+def restore_structlog():
+    config = structlog.get_config()
+    yield
+    structlog.configure(**config)
+
+
+class TestBytesLoggerFactory:
+    @pytest.mark.parametrize("json_logs", [True, False])
+    def test_renders_bytes_for_both_renderers(self, json_logs: bool, restore_structlog, monkeypatch) -> None:
+        monkeypatch.delenv("AGENTGUARD_SKIP_LOGGING_CONFIG", raising=False)
+        out = io.BytesIO()
+        configure_logging(json_logs=json_logs, logger_factory=structlog.BytesLoggerFactory(out), force=True)
+        structlog.get_logger("test").info("hello", k=1)
+        assert b"hello" in out.getvalue()
@@ -0,0 +1,177 @@
+"""Tests for the Redis Streams consumer (fake client — no Redis server needed)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from agentguard.integrations.stream import (
+    EVENTS_STREAM,
+    INSIGHTS_STREAM,
+    RedisStreamConsumer,
+    RedisStreamPublisher,
+)
+
+
+class _FakeRedis:
+    """Serves one XREADGROUP batch, then blocks; records XACKs."""
+
+    def __init__(self, messages: list[tuple[str, dict[str, str]]]) -> None:
+        # Replies arrive undecoded, as from a decode_responses=False client
+        raw = [
+            (msg_id.encode(), {k.encode(): v.encode() for k, v in fields.items()})
+            for msg_id, fields in messages
+        ]
+        self._batches = [[(b"agentguard:events", raw)]]
+        self.acked: list[bytes] = []
+        self.xack_calls = 0
+        self.read_counts: list[int] = []
+
+    async def xgroup_create(self, *args: object, **kwargs: object) -> None:
+        return None
+
+    async def xreadgroup(self, *args: object, count: int, **kwargs: object) -> list:
+        self.read_counts.append(count)
+        if self._batches:
+            return self._batches.pop(0)
+        await asyncio.sleep(0.01)
+        return []
+
+    async def xack(self, stream: str, group: str, *ids: bytes) -> int:
+        self.xack_calls += 1
+        self.acked.extend(ids)
+        return len(ids)
+
+    async def aclose(self) -> None:
+        return None
+
+
+def make_consumer(fake: _FakeRedis) -> RedisStreamConsumer:
+    consumer = RedisStreamConsumer(redis_url="redis://unused")
+    consumer._client = fake
+    return consumer
+
+
+class TestRedisStreamConsumer:
+    @pytest.mark.asyncio
+    async def test_handlers_run_concurrently_and_ack_on_success(self) -> None:
+        fake = _FakeRedis([(f"1-{i}", {"event_id": str(i)}) for i in range(4)])
+        running = 0
+        peak = 0
+
+        async def handler(fields: dict[str, str]) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            if fields["event_id"] == "3":
+                raise RuntimeError("triage failed")
+
+        task = asyncio.create_task(make_consumer(fake).run(handler, poll_interval=0.01, concurrency=4))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await task
+
+        assert peak == 4
+        assert sorted(fake.acked) == [b"1-0", b"1-1", b"1-2"]  # failed message stays pending
+        assert fake.xack_calls == 1  # one multi-ID XACK for the whole batch
+
+    @pytest.mark.asyncio
+    async def test_reads_only_as_many_as_free_slots(self) -> None:
+        fake = _FakeRedis([(f"1-{i}", {"event_id": str(i)}) for i in range(2)])
+        release = asyncio.Event()
+
+        async def handler(fields: dict[str, str]) -> None:
+            await release.wait()
+
+        task = asyncio.create_task(make_consumer(fake).run(handler, poll_interval=0.01, concurrency=3))
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.sleep(0.05)
+        task.cancel()
+        await task
+
+        assert fake.read_counts[0] == 3
+        assert fake.read_counts[1] == 1  # two handlers still busy
+        assert max(fake.read_counts) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancel_drains_in_flight_handlers(self) -> None:
+        fake = _FakeRedis([("1-0", {"event_id": "0"})])
+        started = asyncio.Event()
+
+        async def handler(fields: dict[str, str]) -> None:
+            started.set()
+            await asyncio.sleep(0.05)
+
+        task = asyncio.create_task(
+            make_consumer(fake).run(handler, poll_interval=0.01, concurrency=2, drain_timeout=1.0)
+        )
+        await started.wait()
+        task.cancel()
+        await task
+
+        assert fake.acked == [b"1-0"]
+
+
+class _FakePipeline:
+    def __init__(self, owner: _FakePublishRedis) -> None:
+        self._owner = owner
+        self._commands: list[tuple[str, dict[str, str]]] = []
+
+    def xadd(self, stream: str, fields: dict[str, str], **kwargs: object) -> None:
+        self._commands.append((stream, fields))
+
+    async def execute(self, raise_on_error: bool = True) -> list:
+        self._owner.executes.append(self._commands)
+        return [
+            RuntimeError("OOM") if fields.get("fail") else b"1-0"
+            for _stream, fields in self._commands
+        ]
+
+
+class _FakePublishRedis:
+    def __init__(self) -> None:
+        self.executes: list[list[tuple[str, dict[str, str]]]] = []
+
+    def pipeline(self, transaction: bool = True) -> _FakePipeline:
+        return _FakePipeline(self)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class TestRedisStreamPublisher:
+    @pytest.mark.asyncio
+    async def test_concurrent_publishes_share_one_pipeline(self) -> None:
+        fake = _FakePublishRedis()
+        publisher = RedisStreamPublisher(redis_url="redis://unused")
+        publisher._client = fake
+
+        await asyncio.gather(
+            publisher.publish_event({"event_id": "1"}),
+            publisher.publish_event({"event_id": "2"}),
+            publisher.publish_insight({"event_id": "1"}),
+        )
+
+        assert len(fake.executes) == 1
+        assert [stream for stream, _ in fake.executes[0]] == [
+            EVENTS_STREAM, EVENTS_STREAM, INSIGHTS_STREAM,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_xadd_raises_in_its_caller(self) -> None:
+        fake = _FakePublishRedis()
+        publisher = RedisStreamPublisher(redis_url="redis://unused")
+        publisher._client = fake
+
+        ok, failed = await asyncio.gather(
+            publisher.publish_event({"event_id": "1"}),
+            publisher.publish_event({"event_id": "2", "fail": "1"}),
+            return_exceptions=True,
+        )
+
+        assert ok is None
+        assert isinstance(failed, RuntimeError)